@@ -0,0 +1,145 @@
+"""Benchmark measurement and baseline comparison"""
+import gc
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+from src.game_engine import GameEngine
+from benchmarks.scenarios import Scenario
+
+
+def _step(engine: GameEngine, scenario: Scenario) -> None:
+    """Advance one tick, rendering if the scenario asks for it
+
+    Args:
+        engine: Engine to step
+        scenario: Scenario being run
+    """
+    scenario.hold_balls(engine)
+    engine.step()
+    if scenario.render:
+        engine._draw()
+
+
+def run_scenario(scenario: Scenario, ticks: int, alloc_ticks: int) -> Dict[str, object]:
+    """Run one scenario and collect timings
+
+    The timed pass runs without tracemalloc; a second, shorter pass from a
+    fresh engine measures allocations, since tracing distorts timings.
+
+    Args:
+        scenario: Scenario to run
+        ticks: Ticks in the timed pass
+        alloc_ticks: Ticks in the allocation pass
+
+    Returns:
+        Result record
+
+    Raises:
+        RuntimeError: If the scenario did not keep its workload (see
+            Scenario.check())
+    """
+    # Timed pass, total throughput
+    with scenario.build() as engine:
+        gc.collect()
+        collections_before = sum(stat['collections'] for stat in gc.get_stats())
+        start = time.perf_counter()
+        for _ in range(ticks):
+            _step(engine, scenario)
+        elapsed = time.perf_counter() - start
+        collections = sum(stat['collections'] for stat in gc.get_stats()) - collections_before
+        scenario.check(engine)
+
+    # Phase pass, per-subsystem time
+    with scenario.build() as engine:
+        profiler = engine.enable_profiling()
+        for _ in range(ticks):
+            _step(engine, scenario)
+        phase_ns = dict(profiler.totals_ns)
+        engine.disable_profiling()
+    if not scenario.render:
+        del phase_ns['draw']
+
+    # Allocation pass
+    with scenario.build() as engine:
+        tracemalloc.start()
+        baseline_size, _ = tracemalloc.get_traced_memory()
+        snapshot_before = tracemalloc.take_snapshot()
+        for _ in range(alloc_ticks):
+            _step(engine, scenario)
+        snapshot_after = tracemalloc.take_snapshot()
+        current_size, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    allocated_blocks = sum(
+        stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename')
+        if stat.count_diff > 0
+    )
+
+    return {
+        'scenario': scenario.name,
+        'ticks': ticks,
+        'seconds': elapsed,
+        'ticks_per_sec': ticks / elapsed if elapsed > 0 else 0.0,
+        'us_per_tick': {
+            key: elapsed_ns / ticks / 1e3 for key, elapsed_ns in phase_ns.items()
+        },
+        'gc_collections': collections,
+        'alloc_ticks': alloc_ticks,
+        'retained_kib': (current_size - baseline_size) / 1024,
+        'peak_kib': (peak_size - baseline_size) / 1024,
+        'retained_blocks': allocated_blocks,
+        'final_score': engine.state.score,
+        'bricks_left': len(engine.state.bricks),
+    }
+
+
+def compare(
+    results: List[Dict[str, object]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+    reference: Optional[str] = None
+) -> List[str]:
+    """Find scenarios slower than baseline beyond tolerance
+
+    With a reference scenario, each scenario's speed is taken relative to
+    the reference from the same run and compared with the same ratio in
+    the baseline, so a baseline recorded on another machine still applies.
+    Slowdowns shared by every scenario (including the reference) are not
+    caught this way; compare absolute speeds for those.
+
+    Args:
+        results: Result records from run_scenario()
+        baseline: Scenario name -> {'ticks_per_sec': ...}
+        tolerance: Allowed fractional slowdown (0.2 = 20%)
+        reference: Scenario to normalize by (None compares absolute ticks/s)
+
+    Returns:
+        Human-readable regression messages (empty if none)
+
+    Raises:
+        ValueError: If the reference is missing from results or baseline
+    """
+    actual_scale = expected_scale = 1.0
+    unit, number_format = "ticks/s", ",.0f"
+    if reference is not None:
+        speeds = {result['scenario']: result['ticks_per_sec'] for result in results}
+        if reference not in speeds or reference not in baseline:
+            raise ValueError(f"Reference scenario {reference!r} missing from results or baseline")
+        actual_scale = speeds[reference]
+        expected_scale = baseline[reference]['ticks_per_sec']
+        unit, number_format = f"x {reference}", ".3f"
+
+    regressions = []
+    for result in results:
+        if result['scenario'] == reference:
+            continue
+        entry = baseline.get(result['scenario'])
+        if not entry:
+            continue
+        expected = entry['ticks_per_sec'] / expected_scale
+        actual = result['ticks_per_sec'] / actual_scale
+        if actual < expected * (1.0 - tolerance):
+            regressions.append(
+                f"{result['scenario']}: {actual:{number_format}} {unit} vs baseline "
+                f"{expected:{number_format}} ({(actual / expected - 1) * 100:+.1f}%)"
+            )
+    return regressions
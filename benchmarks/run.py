@@ -0,0 +1,95 @@
+"""Benchmark runner
+
+Usage:
+    python -m benchmarks.run                      # run all, compare to baseline
+    python -m benchmarks.run -k multiball         # scenarios matching a substring
+    python -m benchmarks.run --update-baseline    # record this machine's baseline
+
+Scenarios are gated on their speed relative to REFERENCE_SCENARIO, so the
+committed baseline holds on other machines as long as the mix of costs is
+similar. --absolute compares raw ticks/s instead; only do that against a
+baseline recorded on the same machine.
+"""
+import argparse
+import json
+import os
+import sys
+
+# Render scenarios draw to an invisible window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from benchmarks.scenarios import SCENARIOS, REFERENCE_SCENARIO
+from benchmarks.harness import run_scenario, compare
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+DEFAULT_TOLERANCE = float(os.environ.get('BENCH_TOLERANCE', 0.2))
+
+
+def main() -> int:
+    """Run benchmarks
+
+    Returns:
+        Process exit code (1 on regression)
+    """
+    parser = argparse.ArgumentParser(description="VC-Arkanoid benchmarks")
+    parser.add_argument("-k", dest="filter", default="", help="Run scenarios containing this text")
+    parser.add_argument("--ticks", type=int, default=3000, help="Ticks per timed pass")
+    parser.add_argument("--alloc-ticks", type=int, default=300, help="Ticks in allocation pass")
+    parser.add_argument("--output", default="bench_results.json", help="Write results JSON here")
+    parser.add_argument("--baseline", default=BASELINE_PATH,
+                        help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown fraction (default: $BENCH_TOLERANCE or 0.2)")
+    parser.add_argument("--reference", default=REFERENCE_SCENARIO,
+                        help="Scenario other speeds are taken relative to")
+    parser.add_argument("--absolute", action="store_true",
+                        help="Compare raw ticks/s (baseline must come from this machine)")
+    parser.add_argument("--update-baseline", action="store_true", help="Store results as baseline")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'scenario':<22}{'ticks/s':>12}{'gc':>6}{'peak KiB':>10}  phases (us/tick)")
+    reference = None if args.absolute else args.reference
+    for scenario in SCENARIOS:
+        if args.filter not in scenario.name and scenario.name != reference:
+            continue
+        result = run_scenario(scenario, args.ticks, args.alloc_ticks)
+        results.append(result)
+        phases = ' '.join(f"{key}={value:.1f}" for key, value in result['us_per_tick'].items())
+        print(f"{scenario.name:<22}{result['ticks_per_sec']:>12,.0f}"
+              f"{result['gc_collections']:>6}{result['peak_kib']:>10.1f}  {phases}")
+
+    with open(args.output, 'w') as output_file:
+        json.dump({'python': sys.version.split()[0], 'results': results}, output_file, indent=2)
+
+    if args.update_baseline:
+        baseline = {
+            result['scenario']: {'ticks_per_sec': round(result['ticks_per_sec'])}
+            for result in results
+        }
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = compare(results, baseline, args.tolerance, reference)
+    if regressions:
+        print("\nPERFORMANCE REGRESSION")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
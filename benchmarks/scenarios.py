@@ -0,0 +1,195 @@
+"""Canned benchmark scenarios"""
+from typing import Callable, List, Optional
+from src.game_engine import GameEngine
+from src.entities.ball import Ball
+from src.managers.input_manager import AutopilotInput
+from src.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BALL_RADIUS, BRICK_WIDTH, BRICK_HEIGHT, BRICK_OFFSET_Y,
+    PADDLE_HEIGHT
+)
+from data.levels import LEVELS
+
+
+BENCHMARK_SEED = 1234
+BENCHMARK_LIVES = 1_000_000  # Keep scenarios running through ball losses
+REFERENCE_SCENARIO = "level_01"  # Other scenarios are gated relative to this one
+
+
+class Scenario:
+    """Benchmark scenario: builds an engine in a known starting state"""
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[GameEngine], None],
+        level_data: List[List[str]] = LEVELS,
+        level_index: int = 0,
+        fire_interval: int = 0,
+        render: bool = False,
+        vectorized: bool = False,
+        balls: Optional[int] = None
+    ) -> None:
+        """Initialize scenario
+
+        Args:
+            name: Scenario name used in reports and baselines
+            setup: Adjusts engine state after the level is loaded
+            level_data: Level set to play
+            level_index: Level to start on
+            fire_interval: Autopilot click interval in ticks
+            render: Also render every tick (needs a display driver)
+            vectorized: Simulate balls with the NumPy BallSystem
+            balls: Start with a fan of this many balls and keep exactly
+                that many in play every tick (see hold_balls())
+        """
+        self.name = name
+        self.setup = setup
+        self.level_data = level_data
+        self.level_index = level_index
+        self.fire_interval = fire_interval
+        self.render = render
+        self.vectorized = vectorized
+        self.balls = balls
+
+    def build(self) -> GameEngine:
+        """Create engine for this scenario
+
+        Returns:
+            Engine ready to step
+        """
+        autopilot = AutopilotInput(self.fire_interval)
+        engine = GameEngine(
+            self.level_data,
+            headless=not self.render,
+            input_manager=autopilot,
+            seed=BENCHMARK_SEED,
+            vectorized_balls=self.vectorized,
+            start_level=self.level_index
+        )
+        autopilot.engine = engine
+        engine.state.lives = BENCHMARK_LIVES
+        if self.balls is not None:
+            _fan_balls(engine, self.balls)
+        self.setup(engine)
+        return engine
+
+    def hold_balls(self, engine: GameEngine) -> None:
+        """Keep the ball count fixed; call before every tick
+
+        The autopilot only follows the lowest ball, so without help the
+        others drain within a few hundred ticks and a multiball scenario
+        ends up timing single-ball play. Balls about to fall below the
+        screen are reflected off a floor instead, balls added by a DISRUPT
+        capsule are dropped, and the fan is served again when a new level
+        starts with a single ball.
+
+        Args:
+            engine: Engine built by build()
+        """
+        if self.balls is None:
+            return
+        balls = engine.state.balls
+        if len(balls) < self.balls:
+            _fan_balls(engine, self.balls)
+        while len(balls) > self.balls:
+            balls.remove(balls[len(balls) - 1])
+        floor = SCREEN_HEIGHT - BALL_RADIUS - 1
+        if engine.vectorized_balls:
+            count = len(balls)
+            vy = balls.vy[:count]
+            falling = ~balls.caught[:count] & (vy > 0) & (balls.y[:count] + vy >= floor)
+            vy[falling] = -vy[falling]
+            return
+        for ball in balls:
+            if ball.dy > 0 and not ball.is_caught and ball.get_center()[1] + ball.dy >= floor:
+                ball.dy = -ball.dy
+
+    def check(self, engine: GameEngine) -> None:
+        """Verify the scenario kept its workload until the end
+
+        Args:
+            engine: Engine after the run
+
+        Raises:
+            RuntimeError: If a held ball count was not kept
+        """
+        if self.balls is not None and len(engine.state.balls) != self.balls:
+            raise RuntimeError(
+                f"{self.name}: {len(engine.state.balls)} balls in play, expected {self.balls}"
+            )
+
+
+def _no_setup(engine: GameEngine) -> None:
+    """Leave the loaded level as is"""
+    return None
+
+
+def _fan_balls(engine: GameEngine, count: int) -> None:
+    """Replace the ball with a fan of count balls served from the paddle
+
+    Args:
+        engine: Engine to set up
+        count: Number of balls
+    """
+    balls = engine.state.balls
+    balls.clear()
+    paddle = engine.state.paddle.rect
+    for index in range(count):
+        ball = Ball()
+        ball.set_center(paddle.centerx, paddle.top - 2 * BALL_RADIUS)
+        ball.dx = -6.0 + 12.0 * index / max(1, count - 1)
+        ball.dy = -5.0 - (index % 3)
+        balls.append(ball)
+
+
+def _laser_spam(engine: GameEngine) -> None:
+    """Give the paddle a permanent laser"""
+    engine.state.paddle.laser_active = True
+
+
+def _boss_bombs(engine: GameEngine) -> None:
+    """Start with a bomb already queued"""
+    engine.state.bomb_spawn_timer = 100
+
+
+def _mixed_level(columns: int, rows: int) -> List[List[str]]:
+    """Build a synthetic level set with columns x rows mixed bricks
+
+    Args:
+        columns: Bricks per row (bricks past SCREEN_WIDTH lie off-screen)
+        rows: Number of rows
+
+    Returns:
+        Level set with one level
+    """
+    pattern = "nsg"
+    return [[
+        ''.join(pattern[(row + col) % 3] for col in range(columns))
+        for row in range(rows)
+    ]]
+
+
+# Brick field filling the playfield, leaving room above the paddle to serve
+PLAYFIELD_COLUMNS = SCREEN_WIDTH // BRICK_WIDTH
+PLAYFIELD_ROWS = (SCREEN_HEIGHT - PADDLE_HEIGHT - 8 * BALL_RADIUS - BRICK_OFFSET_Y) // BRICK_HEIGHT
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario(f"level_{index + 1:02d}", _no_setup, level_index=index)
+    for index in range(len(LEVELS))
+] + [
+    Scenario("multiball_3", _no_setup, balls=3),
+    Scenario("multiball_50", _no_setup, balls=50),
+    Scenario("vectorized_multiball_50", _no_setup, vectorized=True, balls=50),
+    Scenario("vectorized_multiball_2000", _no_setup, vectorized=True, balls=2000),
+    Scenario("laser_spam", _laser_spam, fire_interval=2),
+    Scenario("boss_bombs", _boss_bombs, level_index=1),
+    # Every cell of the playfield holds a brick, a third of them gold
+    Scenario("dense_playfield_50", _no_setup,
+             level_data=_mixed_level(PLAYFIELD_COLUMNS, PLAYFIELD_ROWS), balls=50),
+    # 10k-brick level, nearly all off-screen to the right (the ball reaches
+    # about 80): per-tick cost must not grow with the size of the level
+    Scenario("offscreen_10k", _no_setup, level_data=_mixed_level(1250, 8)),
+    Scenario("render_level_01", _no_setup, render=True),
+    Scenario("render_multiball_50", _no_setup, render=True, balls=50),
+]
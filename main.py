@@ -3,13 +3,80 @@
 A modern Arkanoid clone built with Pygame.
 Refactored with OOP principles and modular architecture.
 """
+import argparse
 from src.game_engine import GameEngine
+from src.managers.input_manager import InputManager
+from src.replay import Replay, ReplayRecorder, play_replay, export_replay
+from src.level_pack import LevelPack
+from src.constants import TICK_RATE
 from data.levels import LEVELS
 
 
 def main() -> None:
     """Main entry point for the game"""
-    game = GameEngine(LEVELS)
+    parser = argparse.ArgumentParser(description="VC-Arkanoid")
+    parser.add_argument("--seed", type=int, help="Game seed")
+    parser.add_argument("--level-pack", metavar="PATH",
+                        help="Play levels from a level pack instead of the built-in levels")
+    parser.add_argument("--record", metavar="PATH", help="Record input replay to PATH")
+    parser.add_argument("--replay", metavar="PATH", help="Play back a recorded replay")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="Replay speed as a multiple of real time")
+    parser.add_argument("--headless", action="store_true",
+                        help="Play replay without a window at maximum speed")
+    parser.add_argument("--export", metavar="PATH",
+                        help="Render replay frames offscreen to PATH: an image pattern "
+                             "such as frames/{:06d}.png, or a raw video file")
+    parser.add_argument("--export-size", metavar="WxH", default="800x600",
+                        help="Exported frame size (default: 800x600)")
+    parser.add_argument("--export-gray", action="store_true",
+                        help="Export grayscale frames")
+    parser.add_argument("--export-every", metavar="N", type=int, default=1,
+                        help="Export every Nth tick (default: 1)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Show frame-time telemetry overlay")
+    parser.add_argument("--profile-trace", metavar="PATH",
+                        help="Write per-frame phase timings to PATH (.csv or .jsonl)")
+    args = parser.parse_args()
+
+    levels = LevelPack(args.level_pack) if args.level_pack else LEVELS
+
+    if args.replay and args.export:
+        # Needs NumPy, so only imported when exporting
+        from src.rendering.offscreen import OffscreenRenderer, RawVideoWriter, open_frame_writer
+        width, height = (int(value) for value in args.export_size.lower().split("x"))
+        renderer = OffscreenRenderer((width, height), grayscale=args.export_gray)
+        with open_frame_writer(args.export) as writer:
+            export_replay(Replay.load(args.replay), levels, renderer, writer, args.export_every)
+        print(f"Exported {writer.frames} frames to {args.export}")
+        if isinstance(writer, RawVideoWriter):
+            print(writer.ffmpeg_command(max(1, round(TICK_RATE / args.export_every))))
+        return
+
+    if args.replay:
+        replay = Replay.load(args.replay)
+        game = play_replay(replay, levels, headless=args.headless, speed=args.speed)
+        print(f"Replay finished: score {game.state.score}, level {game.state.level + 1}")
+        if replay.final_digest:
+            matched = game.state.digest() == replay.final_digest
+            print(f"Final state {'matches' if matched else 'DIFFERS from'} recording")
+        return
+
+    if args.record:
+        recorder = ReplayRecorder(InputManager(), levels)
+        game = GameEngine(levels, input_manager=recorder, seed=args.seed)
+        if args.profile or args.profile_trace:
+            game.enable_profiling(overlay=args.profile, trace_path=args.profile_trace)
+        try:
+            game.run()
+        finally:
+            recorder.replay.final_digest = game.state.digest()
+            recorder.replay.save(args.record)
+        return
+
+    game = GameEngine(levels, seed=args.seed)
+    if args.profile or args.profile_trace:
+        game.enable_profiling(overlay=args.profile, trace_path=args.profile_trace)
     game.run()
 
 
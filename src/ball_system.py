@@ -0,0 +1,477 @@
+"""Vectorized structure-of-arrays ball physics (requires NumPy)"""
+import math
+import numpy as np
+import pygame
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.entities.ball import Ball
+from src.entities.brick import Brick
+from src.entities.paddle import Paddle
+from src.brick_grid import BrickGrid
+from src.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BALL_RADIUS, BRICK_WIDTH, BRICK_HEIGHT,
+    BRICK_OFFSET_Y, PADDLE_HIT_ANGLE_RANGE, BALL_SYSTEM_CAPACITY, RED
+)
+
+
+BALL_SIZE = BALL_RADIUS * 2
+
+
+class BallView(Ball):
+    """Ball facade over one slot of a BallSystem
+
+    Reads and writes go straight to the system arrays, so the inherited Ball
+    methods (draw, slow_down, speed_up, reverse_dy, ...) keep working. The
+    rect is derived from the rounded center on every access; changes made
+    to the returned rect are not written back.
+    """
+
+    color = RED
+
+    def __init__(self, system: 'BallSystem', index: int) -> None:
+        """Initialize view
+
+        Args:
+            system: Owning ball system
+            index: Slot in the system arrays
+        """
+        self.system = system
+        self.index = index
+
+    @property
+    def rect(self) -> pygame.Rect:
+        system, index = self.system, self.index
+        return pygame.Rect(
+            round(float(system.x[index])) - BALL_RADIUS,
+            round(float(system.y[index])) - BALL_RADIUS,
+            BALL_SIZE, BALL_SIZE
+        )
+
+    @property
+    def pos_x(self) -> float:
+        return float(self.system.x[self.index])
+
+    @pos_x.setter
+    def pos_x(self, value: float) -> None:
+        self.system.x[self.index] = value
+
+    @property
+    def pos_y(self) -> float:
+        return float(self.system.y[self.index])
+
+    @pos_y.setter
+    def pos_y(self, value: float) -> None:
+        self.system.y[self.index] = value
+
+    @property
+    def dx(self) -> float:
+        return float(self.system.vx[self.index])
+
+    @dx.setter
+    def dx(self, value: float) -> None:
+        self.system.vx[self.index] = value
+
+    @property
+    def dy(self) -> float:
+        return float(self.system.vy[self.index])
+
+    @dy.setter
+    def dy(self, value: float) -> None:
+        self.system.vy[self.index] = value
+
+    @property
+    def is_caught(self) -> bool:
+        return bool(self.system.caught[self.index])
+
+    @is_caught.setter
+    def is_caught(self, value: bool) -> None:
+        self.system.caught[self.index] = value
+
+    @property
+    def prev_center(self) -> Optional[Tuple[int, int]]:
+        prev_x = float(self.system.prev_x[self.index])
+        if math.isnan(prev_x):
+            return None
+        return int(prev_x), int(self.system.prev_y[self.index])
+
+    @prev_center.setter
+    def prev_center(self, value: Optional[Tuple[int, int]]) -> None:
+        if value is None:
+            value = (math.nan, math.nan)
+        self.system.prev_x[self.index], self.system.prev_y[self.index] = value
+
+
+class BallSystem:
+    """All balls in play stored as parallel NumPy arrays
+
+    Behaves like the list of balls it replaces (len, iteration, indexing,
+    append, remove, clear), handing out BallView objects. step() moves every
+    ball and resolves wall, paddle and brick contacts for all of them at
+    once, so per-tick cost grows with array length rather than with Python
+    work per ball.
+
+    Brick contacts are resolved on the overlap after moving (the scalar path
+    sweeps instead); at the ball speeds used by the game the ball never
+    travels further than a brick per tick, so nothing is tunnelled.
+    """
+
+    def __init__(self, capacity: int = BALL_SYSTEM_CAPACITY) -> None:
+        """Initialize empty system
+
+        Args:
+            capacity: Initial array length (doubled when full)
+        """
+        self._views: List[BallView] = []
+        self._allocate(max(1, capacity))
+
+        # Dense brick lookup built from a BrickGrid
+        self._grid: Optional[BrickGrid] = None
+        self._layout_version: int = -1
+        self._table = np.full((0, 0), -1, dtype=np.int32)
+        self._brick_list: List[Brick] = []
+        self._brick_alive = np.zeros(0, dtype=bool)
+        self._alive_count: int = 0
+        self._brick_rects = np.zeros((4, 0), dtype=np.int64)
+        self._last_hits: List[int] = []
+
+    def _allocate(self, capacity: int) -> None:
+        """Resize arrays to capacity, keeping the live slots
+
+        Args:
+            capacity: New array length
+        """
+        count = len(self._views)
+        old = getattr(self, 'x', None)
+        arrays = {}
+        for name, dtype, fill in (
+            ('x', np.float64, 0.0), ('y', np.float64, 0.0),
+            ('vx', np.float64, 0.0), ('vy', np.float64, 0.0),
+            ('prev_x', np.float64, math.nan), ('prev_y', np.float64, math.nan),
+            ('caught', bool, False),
+        ):
+            array = np.full(capacity, fill, dtype=dtype)
+            if old is not None:
+                array[:count] = getattr(self, name)[:count]
+            arrays[name] = array
+        for name, array in arrays.items():
+            setattr(self, name, array)
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def __iter__(self) -> Iterator[BallView]:
+        return iter(self._views)
+
+    def __getitem__(self, index):
+        return self._views[index]
+
+    def append(self, ball: Ball) -> BallView:
+        """Add a ball, copying its state into the arrays
+
+        Args:
+            ball: Ball to add
+
+        Returns:
+            View of the stored ball
+        """
+        index = len(self._views)
+        if index == len(self.x):
+            self._allocate(len(self.x) * 2)
+        self.x[index], self.y[index] = ball.get_center()
+        self.vx[index] = ball.dx
+        self.vy[index] = ball.dy
+        self.caught[index] = ball.is_caught
+        view = BallView(self, index)
+        view.prev_center = ball.prev_center
+        self._views.append(view)
+        return view
+
+    def remove(self, ball: BallView) -> None:
+        """Remove a ball, keeping the order of the others
+
+        Args:
+            ball: View returned by this system
+
+        Raises:
+            ValueError: If ball is not in the system
+        """
+        if ball.system is not self or ball.index >= len(self._views) \
+                or self._views[ball.index] is not ball:
+            raise ValueError("BallSystem.remove(x): x not in system")
+        keep = np.ones(len(self._views), dtype=bool)
+        keep[ball.index] = False
+        self._compact(keep)
+
+    def clear(self) -> None:
+        """Remove all balls"""
+        for view in self._views:
+            view.index = -1
+        self._views.clear()
+
+    def flush(self) -> None:
+        """Nothing to do: removals compact the arrays at once (EntityList API)"""
+
+    def _compact(self, keep: np.ndarray) -> None:
+        """Drop slots whose keep flag is False and re-index views
+
+        Args:
+            keep: Boolean mask over the live slots
+        """
+        count = int(keep.sum())
+        for name in ('x', 'y', 'vx', 'vy', 'prev_x', 'prev_y', 'caught'):
+            array = getattr(self, name)
+            array[:count] = array[:len(keep)][keep]
+        views = []
+        for view, kept in zip(self._views, keep.tolist()):
+            if kept:
+                view.index = len(views)
+                views.append(view)
+            else:
+                view.index = -1
+        self._views = views
+
+    def store_previous(self) -> None:
+        """Remember current rounded centers for render interpolation"""
+        count = len(self._views)
+        np.rint(self.x[:count], out=self.prev_x[:count])
+        np.rint(self.y[:count], out=self.prev_y[:count])
+
+    def _rects(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get integer ball rects, matching Ball.rect rounding
+
+        Returns:
+            (left, top, right, bottom) arrays over the live slots
+        """
+        count = len(self._views)
+        left = np.rint(self.x[:count]).astype(np.int64) - BALL_RADIUS
+        top = np.rint(self.y[:count]).astype(np.int64) - BALL_RADIUS
+        return left, top, left + BALL_SIZE, top + BALL_SIZE
+
+    def overlapping(self, rect: pygame.Rect) -> np.ndarray:
+        """Find balls overlapping a rect
+
+        Args:
+            rect: Rect to test
+
+        Returns:
+            Ball indices in ascending order
+        """
+        left, top, right, bottom = self._rects()
+        return np.flatnonzero(
+            (left < rect.right) & (right > rect.left)
+            & (top < rect.bottom) & (bottom > rect.top)
+        )
+
+    def reverse_dy(self, indices: np.ndarray) -> None:
+        """Reverse vertical direction of some balls
+
+        Args:
+            indices: Ball indices
+        """
+        self.vy[indices] *= -1
+
+    def remove_out_of_bounds(self) -> int:
+        """Remove balls that fell below the screen
+
+        Returns:
+            Number of balls removed
+        """
+        bottom = self._rects()[3]
+        keep = bottom < SCREEN_HEIGHT
+        removed = len(keep) - int(keep.sum())
+        if removed:
+            self._compact(keep)
+        return removed
+
+    def _sync_bricks(self, bricks: BrickGrid) -> None:
+        """Rebuild the dense brick table when the level layout changed
+
+        Removals do not trigger a rebuild: bricks found in the table are
+        checked against the grid when touched and dropped if gone.
+
+        Args:
+            bricks: Brick grid of the current level
+        """
+        if bricks is self._grid and bricks.layout_version == self._layout_version:
+            return
+        self._grid = bricks
+        self._layout_version = bricks.layout_version
+
+        ids: Dict[Brick, int] = {}
+        cells = [
+            (row, col, ids.setdefault(brick, len(ids)))
+            for (row, col), brick in bricks.cells() if row >= 0 and col >= 0
+        ]
+        rows = max((row for row, _, _ in cells), default=-1) + 1
+        cols = max((col for _, col, _ in cells), default=-1) + 1
+        self._table = np.full((rows, cols), -1, dtype=np.int32)
+        for row, col, brick_id in cells:
+            self._table[row, col] = brick_id
+
+        self._brick_list = list(ids)
+        self._brick_alive = np.ones(len(ids), dtype=bool)
+        self._alive_count = len(ids)
+        self._last_hits = []
+        self._brick_rects = np.array(
+            [(brick.rect.left, brick.rect.top, brick.rect.right, brick.rect.bottom)
+             for brick in self._brick_list],
+            dtype=np.int64
+        ).reshape(-1, 4).T
+
+    def _drop_removed_bricks(self, candidates: np.ndarray) -> None:
+        """Forget table bricks that were removed from the grid
+
+        Only runs while the grid holds fewer bricks than the table thinks
+        are alive. Bricks hit last tick are checked first since they are
+        the usual removals; otherwise the bricks under the balls are.
+
+        Args:
+            candidates: Brick ids currently under a ball
+        """
+        grid = self._grid
+        for checked in (self._last_hits, candidates):
+            if len(grid) == self._alive_count:
+                return
+            if checked is candidates:
+                checked = np.unique(candidates[candidates >= 0]).tolist()
+            for brick_id in checked:
+                if self._brick_alive[brick_id] and self._brick_list[brick_id] not in grid:
+                    self._brick_alive[brick_id] = False
+                    self._alive_count -= 1
+                    self._table[self._table == brick_id] = -1
+
+    def _collide_bricks(
+        self,
+        active: np.ndarray,
+        left: np.ndarray,
+        top: np.ndarray,
+        right: np.ndarray,
+        bottom: np.ndarray
+    ) -> List[Brick]:
+        """Reflect balls off the first brick each one overlaps
+
+        Cells under the ball are probed row-major, like
+        BrickGrid.first_overlapping. A ball bounces on the axis of least
+        penetration, away from the brick center; the brick only counts as
+        hit if the ball was moving into it.
+
+        Args:
+            active: Mask of balls that moved this tick
+            left, top, right, bottom: Ball rects
+
+        Returns:
+            Bricks hit this tick, in order of the first ball hitting each
+        """
+        table = self._table
+        rows, cols = table.shape
+        if rows == 0:
+            return []
+        field_bottom = BRICK_OFFSET_Y + rows * BRICK_HEIGHT
+        balls = np.flatnonzero(active & (top < field_bottom) & (bottom > BRICK_OFFSET_Y))
+        if len(balls) == 0:
+            self._last_hits = []
+            return []
+        left, top, right, bottom = left[balls], top[balls], right[balls], bottom[balls]
+
+        # Corner cells of each ball rect, row-major: shape (4, balls)
+        first_col = left // BRICK_WIDTH
+        last_col = (right - 1) // BRICK_WIDTH
+        first_row = (top - BRICK_OFFSET_Y) // BRICK_HEIGHT
+        last_row = (bottom - 1 - BRICK_OFFSET_Y) // BRICK_HEIGHT
+        cell_rows = np.stack((first_row, first_row, last_row, last_row))
+        cell_cols = np.stack((first_col, last_col, first_col, last_col))
+        inside = (cell_rows >= 0) & (cell_rows < rows) & (cell_cols >= 0) & (cell_cols < cols)
+        ids = np.full(cell_rows.shape, -1, dtype=np.int64)
+        ids[inside] = table[cell_rows[inside], cell_cols[inside]]
+
+        self._drop_removed_bricks(ids)
+        found = ids >= 0
+        lookup = np.where(found, ids, 0)
+        brick_left, brick_top, brick_right, brick_bottom = self._brick_rects
+        found &= (
+            self._brick_alive[lookup]
+            & (left < brick_right[lookup])
+            & (right > brick_left[lookup])
+            & (top < brick_bottom[lookup])
+            & (bottom > brick_top[lookup])
+        )
+        touching = found.any(axis=0)
+        if not touching.any():
+            self._last_hits = []
+            return []
+        balls = balls[touching]
+        ids = ids[found[:, touching].argmax(axis=0), touching]
+        left, top, right, bottom = left[touching], top[touching], right[touching], bottom[touching]
+
+        bl, bt, br, bb = brick_left[ids], brick_top[ids], brick_right[ids], brick_bottom[ids]
+        overlap_x = np.minimum(right, br) - np.maximum(left, bl)
+        overlap_y = np.minimum(bottom, bb) - np.maximum(top, bt)
+        horizontal = overlap_x < overlap_y
+
+        # Direction pointing out of the brick on each axis
+        away_x = np.where(self.x[balls] * 2 < bl + br, -1.0, 1.0)
+        away_y = np.where(self.y[balls] * 2 < bt + bb, -1.0, 1.0)
+        vx = self.vx[balls]
+        vy = self.vy[balls]
+        into = np.where(horizontal, vx * away_x < 0, vy * away_y < 0)
+        self.vx[balls] = np.where(horizontal, np.abs(vx) * away_x, vx)
+        self.vy[balls] = np.where(horizontal, vy, np.abs(vy) * away_y)
+
+        hit = ids[into]
+        unique_ids, first = np.unique(hit, return_index=True)
+        self._last_hits = unique_ids[np.argsort(first)].tolist()
+        return [self._brick_list[brick_id] for brick_id in self._last_hits]
+
+    def step(self, paddle: Paddle, bricks: BrickGrid) -> Tuple[List[Brick], bool]:
+        """Advance all balls one tick with wall, brick and paddle response
+
+        Args:
+            paddle: Player paddle
+            bricks: Brick grid of the current level
+
+        Returns:
+            (bricks hit, True if any ball bounced off a wall or the paddle)
+        """
+        count = len(self._views)
+        if count == 0:
+            return [], False
+        x, y = self.x[:count], self.y[:count]
+        vx, vy = self.vx[:count], self.vy[:count]
+        caught = self.caught[:count]
+        active = ~caught
+
+        # Caught balls ride on the paddle
+        x[caught] = paddle.rect.centerx
+        x[active] += vx[active]
+        y[active] += vy[active]
+
+        self._sync_bricks(bricks)
+        left, top, right, bottom = self._rects()
+        hit_bricks = self._collide_bricks(active, left, top, right, bottom)
+
+        # Walls (reflect away from the wall that was touched)
+        wall_x = active & (((left <= 0) & (vx < 0)) | ((right >= SCREEN_WIDTH) & (vx > 0)))
+        wall_y = active & (top <= 0) & (vy < 0)
+        vx[wall_x] = -vx[wall_x]
+        vy[wall_y] = -vy[wall_y]
+        bounced = bool(wall_x.any() or wall_y.any())
+
+        # Paddle
+        rect = paddle.rect
+        on_paddle = np.flatnonzero(
+            active & (vy > 0)
+            & (left < rect.right) & (right > rect.left)
+            & (top < rect.bottom) & (bottom > rect.top)
+        )
+        if len(on_paddle):
+            bounced = True
+            if paddle.catch_active and paddle.caught_ball is None:
+                first = on_paddle[0]
+                on_paddle = on_paddle[1:]
+                caught[first] = True
+                y[first] = rect.top - BALL_RADIUS
+                paddle.caught_ball = self._views[first]
+            hit_pos = (np.rint(x[on_paddle]) - rect.left) / rect.width
+            vx[on_paddle] = (hit_pos - 0.5) * PADDLE_HIT_ANGLE_RANGE
+            vy[on_paddle] = -np.abs(vy[on_paddle])
+
+        return hit_bricks, bounced
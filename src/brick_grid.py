@@ -0,0 +1,282 @@
+"""Uniform-grid spatial index for bricks"""
+import pygame
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from src.entities.brick import Brick
+from src.level_format import BRICK_CODES
+from src.constants import BRICK_WIDTH, BRICK_HEIGHT, BRICK_OFFSET_Y, BrickType
+
+
+Cell = Tuple[int, int]
+
+# Brick type -> cell byte of the occupancy map (same codes as compiled levels)
+TYPE_CODES: Dict[BrickType, int] = {
+    brick_type: code for code, brick_type in enumerate(BRICK_CODES) if brick_type
+}
+
+
+class BrickGrid:
+    """Brick store indexed by (row, col) cells of the level grid
+
+    Bricks are kept in insertion order for iteration and drawing. Each brick
+    is also registered in every grid cell its rect overlaps, so overlap
+    queries only visit the cells under the query rect and removal is O(1).
+
+    Occupancy of the level grid (cells with row, col >= 0) is also kept in
+    flat maps indexed by row * cols + col: cell_types holds the type code of
+    each cell (TYPE_CODES, 0 = empty) for O(1) point queries, and one
+    bytearray per brick type holds 1 for each cell holding that type, so
+    adding or removing a brick only writes the bytes of its own cells. The
+    number of destructible bricks is maintained for the stage-clear rule.
+    """
+
+    def __init__(self, bricks: Optional[Iterable[Brick]] = None) -> None:
+        """Initialize grid
+
+        Args:
+            bricks: Initial bricks to insert
+        """
+        self._bricks: Dict[Brick, None] = {}
+        self._cells: Dict[Cell, List[Brick]] = {}
+        self.layout_version: int = 0  # Bumped when bricks are added or cleared
+        self.version: int = 0  # Bumped on every change, including hits
+        self.rows: int = 0
+        self.cols: int = 0
+        self.cell_types = bytearray()
+        self._type_cells: Dict[BrickType, bytearray] = {
+            brick_type: bytearray() for brick_type in BrickType
+        }
+        self.destructible: int = 0  # Bricks that can still be destroyed
+        if bricks:
+            bricks = list(bricks)
+            # Size the maps once instead of growing them brick by brick
+            last_row = last_col = -1
+            for brick in bricks:
+                _, row, _, col = self.cell_range(brick.rect)
+                last_row = max(last_row, row)
+                last_col = max(last_col, col)
+            self._resize(last_row + 1, last_col + 1)
+            for brick in bricks:
+                self.add(brick)
+
+    def __len__(self) -> int:
+        return len(self._bricks)
+
+    def __iter__(self) -> Iterator[Brick]:
+        return iter(self._bricks)
+
+    def __contains__(self, brick: object) -> bool:
+        return brick in self._bricks
+
+    @staticmethod
+    def cell_range(rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        """Get inclusive cell bounds covered by a rect
+
+        Args:
+            rect: Rect in screen coordinates
+
+        Returns:
+            (first_row, last_row, first_col, last_col)
+        """
+        first_col = rect.left // BRICK_WIDTH
+        last_col = (rect.right - 1) // BRICK_WIDTH
+        first_row = (rect.top - BRICK_OFFSET_Y) // BRICK_HEIGHT
+        last_row = (rect.bottom - 1 - BRICK_OFFSET_Y) // BRICK_HEIGHT
+        return first_row, last_row, first_col, last_col
+
+    def add(self, brick: Brick) -> None:
+        """Insert brick into the grid
+
+        Args:
+            brick: Brick to insert
+        """
+        self._bricks[brick] = None
+        self.layout_version += 1
+        self.version += 1
+        if brick.destructible:
+            self.destructible += 1
+        first_row, last_row, first_col, last_col = self.cell_range(brick.rect)
+        if last_row >= self.rows or last_col >= self.cols:
+            self._resize(max(self.rows, last_row + 1), max(self.cols, last_col + 1))
+        code = TYPE_CODES[brick.type]
+        type_cells = self._type_cells[brick.type]
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = self._cells.setdefault((row, col), [])
+                cell.append(brick)
+                if row >= 0 and col >= 0:
+                    index = row * self.cols + col
+                    if len(cell) == 1:
+                        self.cell_types[index] = code
+                    type_cells[index] = 1
+
+    def remove(self, brick: Brick) -> None:
+        """Remove brick from the grid
+
+        Args:
+            brick: Brick to remove
+        """
+        del self._bricks[brick]
+        self.version += 1
+        if brick.destructible:
+            self.destructible -= 1
+        first_row, last_row, first_col, last_col = self.cell_range(brick.rect)
+        type_cells = self._type_cells[brick.type]
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = self._cells[(row, col)]
+                cell.remove(brick)
+                if not cell:
+                    del self._cells[(row, col)]
+                if row >= 0 and col >= 0:
+                    index = row * self.cols + col
+                    self.cell_types[index] = TYPE_CODES[cell[0].type] if cell else 0
+                    if not any(other.type is brick.type for other in cell):
+                        type_cells[index] = 0
+
+    def clear(self) -> None:
+        """Remove all bricks"""
+        self._bricks.clear()
+        self._cells.clear()
+        self.layout_version += 1
+        self.version += 1
+        size = self.rows * self.cols
+        self.cell_types = bytearray(size)
+        self._type_cells = {brick_type: bytearray(size) for brick_type in BrickType}
+        self.destructible = 0
+
+    def _resize(self, rows: int, cols: int) -> None:
+        """Rebuild the occupancy maps for a larger level grid
+
+        Args:
+            rows: Grid rows
+            cols: Grid columns
+        """
+        self.rows = rows
+        self.cols = cols
+        self.cell_types = bytearray(rows * cols)
+        self._type_cells = {brick_type: bytearray(rows * cols) for brick_type in BrickType}
+        for (row, col), bricks in self._cells.items():
+            if row >= 0 and col >= 0:
+                index = row * cols + col
+                self.cell_types[index] = TYPE_CODES[bricks[0].type]
+                for brick in bricks:
+                    self._type_cells[brick.type][index] = 1
+
+    def is_clear(self) -> bool:
+        """Check if every destructible brick is gone (gold may remain)
+
+        Returns:
+            True if no destructible brick remains
+        """
+        return self.destructible == 0
+
+    def occupied(self, row: int, col: int) -> bool:
+        """Check if any brick covers a cell of the level grid
+
+        Args:
+            row: Grid row
+            col: Grid column
+
+        Returns:
+            True if the cell holds a brick
+        """
+        return 0 <= row < self.rows and 0 <= col < self.cols \
+            and self.cell_types[row * self.cols + col] != 0
+
+    def type_mask(self, brick_type: BrickType) -> bytearray:
+        """Get the cells holding a brick type
+
+        Args:
+            brick_type: Brick type
+
+        Returns:
+            Live map (do not modify) with byte row * cols + col set to 1 for
+            each such cell
+        """
+        return self._type_cells[brick_type]
+
+    def occupancy(self) -> Tuple[int, int, Tuple[bytes, ...]]:
+        """Snapshot the per-type occupancy maps
+
+        Returns:
+            (rows, cols, copy of each type map in BrickType declaration order)
+        """
+        return self.rows, self.cols, tuple(bytes(cells) for cells in self._type_cells.values())
+
+    def hit(self, brick: Brick) -> bool:
+        """Register a hit on brick, removing it once destroyed
+
+        Args:
+            brick: Brick that was hit
+
+        Returns:
+            True if brick was destroyed
+        """
+        self.version += 1
+        if brick.hit():
+            self.remove(brick)
+            return True
+        return False
+
+    def cells(self) -> Iterator[Tuple[Cell, Brick]]:
+        """Iterate occupied cells with the first brick registered in each
+
+        Returns:
+            Iterator of ((row, col), brick)
+        """
+        for cell, bricks in self._cells.items():
+            yield cell, bricks[0]
+
+    def at(self, row: int, col: int) -> Optional[Brick]:
+        """Get brick occupying a cell
+
+        Args:
+            row: Grid row
+            col: Grid column
+
+        Returns:
+            Brick in cell or None
+        """
+        cell = self._cells.get((row, col))
+        return cell[0] if cell else None
+
+    def first_overlapping(self, rect: pygame.Rect) -> Optional[Brick]:
+        """Find first brick overlapping rect, scanning cells row-major
+
+        Args:
+            rect: Rect to test
+
+        Returns:
+            Overlapping brick or None
+        """
+        first_row, last_row, first_col, last_col = self.cell_range(rect)
+        cells = self._cells
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = cells.get((row, col))
+                if cell:
+                    for brick in cell:
+                        if rect.colliderect(brick.rect):
+                            return brick
+        return None
+
+    def query(self, rect: pygame.Rect) -> List[Brick]:
+        """Find all bricks overlapping rect
+
+        Args:
+            rect: Rect to test
+
+        Returns:
+            Overlapping bricks, row-major order, without duplicates
+        """
+        found: List[Brick] = []
+        first_row, last_row, first_col, last_col = self.cell_range(rect)
+        cells = self._cells
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = cells.get((row, col))
+                if cell:
+                    for brick in cell:
+                        if brick not in found and rect.colliderect(brick.rect):
+                            found.append(brick)
+        return found
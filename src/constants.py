@@ -7,6 +7,18 @@ SCREEN_WIDTH: int = 800
 SCREEN_HEIGHT: int = 600
 FPS: int = 60
 
+# Simulation Timing
+# Speeds (pixels per tick) and *_FRAMES timers count ticks, not seconds, so
+# TICK_RATE sets game time: changing it changes how fast the game plays.
+TICK_RATE: int = FPS           # Game ticks per second at game_speed 1
+RENDER_FPS: int = FPS          # Render frame cap (0 = uncapped)
+MAX_CATCH_UP_STEPS: int = 5    # Max physics ticks run per rendered frame
+DIRTY_RECT_RENDERING: bool = True  # Push only changed screen areas
+
+# Profiling
+PROFILER_WINDOW: int = 600          # Frames kept for rolling percentiles
+PROFILER_OVERLAY_REFRESH: int = 30  # Frames between overlay text updates
+
 # Game Object Dimensions
 PADDLE_WIDTH: int = 100
 PADDLE_HEIGHT: int = 20
@@ -18,6 +30,7 @@ BALL_INITIAL_SPEED_Y: int = -5
 
 BRICK_WIDTH: int = 80
 BRICK_HEIGHT: int = 30
+BRICK_OFFSET_Y: int = 50  # Top of the brick field
 
 POWERUP_WIDTH: int = 30
 POWERUP_HEIGHT: int = 14
@@ -33,6 +46,8 @@ ENEMY_SPEED: int = 2
 BOSS_WIDTH: int = 300
 BOSS_HEIGHT: int = 100
 BOSS_HP: int = 16
+BOSS_HP_BAR_GAP: int = 5  # Space between boss and HP bar
+BOSS_HP_BAR_HEIGHT: int = 5
 
 BOMB_SIZE: int = 20
 BOMB_SPEED: int = 4
@@ -76,12 +91,38 @@ BALL_SLOW_DIVISOR: float = 2.0
 ENEMY_SPAWN_INTERVAL: int = 300  # 5 seconds at 60 FPS
 BOMB_SPAWN_INTERVAL: int = 120   # 2 seconds at 60 FPS
 
+# Entity Pools (instances preallocated per game)
+POWERUP_POOL_SIZE: int = 8
+LASER_POOL_SIZE: int = 32  # Two per click; rapid clicking keeps ~30 in flight
+ENEMY_POOL_SIZE: int = 4
+BOMB_POOL_SIZE: int = 4
+
+# Gameplay Events
+EVENT_BUFFER_SIZE: int = 64  # Preallocated event slots per batch (grows if a tick needs more)
+
+# Learning Environment (src/game_env.py)
+ENV_FRAME_SKIP: int = 4           # Ticks each action is repeated for
+ENV_SCORE_REWARD: float = 1.0     # Reward per point scored
+ENV_LIFE_REWARD: float = 100.0    # Reward per life gained (negative when a life is lost)
+ENV_SERVE_JITTER: float = 1.0     # VectorEnv: max serve dx offset drawn from each game's seed
+
+# Level Loading
+LEVEL_CACHE_SIZE: int = 64  # Compiled levels kept before least recently used are evicted
+
 # Paddle Physics
 PADDLE_HIT_ANGLE_RANGE: float = 16.0  # Max angle deviation from paddle hit
 
+# Ball Physics
+BALL_SWEEP_MAX_CONTACTS: int = 4  # Max contacts resolved per ball per tick
+BALL_SYSTEM_CAPACITY: int = 64  # Initial slots in vectorized ball arrays
+
 # UI Configuration
 FONT_SIZE: int = 36
 FONT_SIZE_SMALL: int = 20
+TEXT_CACHE_SIZE: int = 256  # Max rendered text surfaces kept
+SPRITE_ATLAS_WIDTH: int = 512  # Max atlas surface width (must fit the widest sprite)
+SPRITE_ALIGN: int = 4  # Atlas column alignment in pixels (16 bytes at 32 bpp)
+SPRITE_COLORKEY = (255, 0, 254)  # Transparent atlas pixels (used by no game color)
 
 # Brick Types
 class BrickType(Enum):
@@ -120,10 +161,16 @@ POWERUP_LABELS = {
     PowerUpType.PLAYER: 'P',
 }
 
-# Sound Paths
+# Sound Configuration
 SOUND_BRICK_DESTROY = "sounds/brick_destroy.wav"
 SOUND_POWERUP = "sounds/powerup.wav"
 SOUND_BOUNCE = "sounds/bounce.wav"
+SOUND_VOICE_LIMITS = {  # Max copies of a sound playing at once
+    'bounce': 3,
+    'brick_destroy': 4,
+    'powerup': 2,
+}
+SOUND_POLL_INTERVAL: float = 0.004  # Audio thread sleep when idle (seconds)
 
 # Boss Configuration
 BOSS_LEVEL_INDEX: int = 1  # Level 2 is boss level
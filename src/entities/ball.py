@@ -1,5 +1,6 @@
 """Ball entity for game physics"""
 import pygame
+from typing import Optional, Tuple
 from src.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BALL_RADIUS,
     BALL_INITIAL_SPEED_X, BALL_INITIAL_SPEED_Y,
@@ -19,14 +20,42 @@ class Ball:
         self.dx: float = BALL_INITIAL_SPEED_X
         self.dy: float = BALL_INITIAL_SPEED_Y
         self.is_caught: bool = False
+        self.prev_center: Optional[Tuple[int, int]] = None
+        self.pool_index: int = -1  # Slot in GameState.balls
+
+        # Sub-pixel center; rect holds the rounded position
+        self.pos_x: float = float(self.rect.centerx)
+        self.pos_y: float = float(self.rect.centery)
 
     def move(self) -> None:
         """Update ball position"""
         if self.is_caught:
             return
 
-        self.rect.x += int(self.dx)
-        self.rect.y += int(self.dy)
+        x, y = self.get_center()
+        self.set_center(x + self.dx, y + self.dy)
+
+    def get_center(self) -> Tuple[float, float]:
+        """Get sub-pixel center, resyncing if rect was moved directly
+
+        Returns:
+            (x, y) center
+        """
+        if (round(self.pos_x), round(self.pos_y)) != self.rect.center:
+            self.pos_x = float(self.rect.centerx)
+            self.pos_y = float(self.rect.centery)
+        return self.pos_x, self.pos_y
+
+    def set_center(self, x: float, y: float) -> None:
+        """Place ball at sub-pixel center
+
+        Args:
+            x: Center X coordinate
+            y: Center Y coordinate
+        """
+        self.pos_x = x
+        self.pos_y = y
+        self.rect.center = (round(x), round(y))
 
     def bounce_wall(self) -> bool:
         """Check and handle wall collisions
@@ -35,13 +64,17 @@ class Ball:
             True if ball bounced off a wall
         """
         bounced = False
-        # Side walls
-        if self.rect.left <= 0 or self.rect.right >= SCREEN_WIDTH:
-            self.dx *= -1
+        # Side walls (reflect away from the wall that was touched, so a ball
+        # still overlapping it next tick is not flipped back)
+        if self.rect.left <= 0 and self.dx < 0:
+            self.dx = -self.dx
+            bounced = True
+        elif self.rect.right >= SCREEN_WIDTH and self.dx > 0:
+            self.dx = -self.dx
             bounced = True
         # Top wall
-        if self.rect.top <= 0:
-            self.dy *= -1
+        if self.rect.top <= 0 and self.dy < 0:
+            self.dy = -self.dy
             bounced = True
         return bounced
 
@@ -57,7 +90,19 @@ class Ball:
         if not self.rect.colliderect(paddle.rect):
             return False
 
-        if paddle.catch_active:
+        self.deflect_from_paddle(paddle)
+        return True
+
+    def deflect_from_paddle(self, paddle: 'Paddle') -> None:
+        """Apply paddle response (catch or angled bounce)
+
+        The paddle holds one ball at a time; with a ball already caught,
+        others bounce as usual.
+
+        Args:
+            paddle: Paddle the ball touched
+        """
+        if paddle.catch_active and paddle.caught_ball is None:
             # Catch the ball
             self.is_caught = True
             paddle.caught_ball = self
@@ -70,8 +115,6 @@ class Ball:
             self.dx = (hit_pos - 0.5) * PADDLE_HIT_ANGLE_RANGE
             self.dy = -abs(self.dy)  # Always bounce upward
 
-        return True
-
     def is_out_of_bounds(self) -> bool:
         """Check if ball fell below screen
 
@@ -80,13 +123,35 @@ class Ball:
         """
         return self.rect.bottom >= SCREEN_HEIGHT
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def interpolated_center(self, alpha: float = 1.0) -> Tuple[int, int]:
+        """Get center to draw at between the last two ticks
+
+        Args:
+            alpha: Interpolation factor between previous and current tick
+
+        Returns:
+            (x, y) center
+        """
+        center = self.rect.center
+        if alpha < 1.0 and self.prev_center is not None:
+            prev_x, prev_y = self.prev_center
+            center = (
+                round(prev_x + (center[0] - prev_x) * alpha),
+                round(prev_y + (center[1] - prev_y) * alpha)
+            )
+        return center
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> pygame.Rect:
         """Render ball on screen
 
         Args:
             screen: Pygame surface to draw on
+            alpha: Interpolation factor between previous and current tick
+
+        Returns:
+            Screen area drawn
         """
-        pygame.draw.circle(screen, self.color, self.rect.center, BALL_RADIUS)
+        return pygame.draw.circle(screen, self.color, self.interpolated_center(alpha), BALL_RADIUS)
 
     def slow_down(self) -> None:
         """Reduce ball speed (power-up effect)"""
@@ -8,6 +8,11 @@ from src.constants import (
 class Bomb:
     """Bomb dropped by boss that damages player"""
 
+    __slots__ = ('rect', 'dy', 'pool_index')
+
+    # Shared by all instances
+    color = MAGENTA
+
     def __init__(self, x: int, y: int) -> None:
         """Initialize bomb at position
 
@@ -15,26 +20,34 @@ class Bomb:
             x: Center X coordinate
             y: Top Y coordinate
         """
-        self.rect = pygame.Rect(
-            x - BOMB_SIZE // 2,
-            y,
-            BOMB_SIZE,
-            BOMB_SIZE
-        )
-        self.color = MAGENTA
+        self.rect = pygame.Rect(0, 0, BOMB_SIZE, BOMB_SIZE)
+        self.pool_index: int = -1
+        self.reset(x, y)
+
+    def reset(self, x: int, y: int) -> None:
+        """Move bomb to a new drop position (for pool reuse)
+
+        Args:
+            x: Center X coordinate
+            y: Top Y coordinate
+        """
+        self.rect.topleft = (x - BOMB_SIZE // 2, y)
         self.dy = BOMB_SPEED
 
     def move(self) -> None:
         """Update bomb position (falling)"""
         self.rect.y += self.dy
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """Render bomb on screen
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            Screen area drawn
         """
-        pygame.draw.rect(screen, self.color, self.rect)
+        return pygame.draw.rect(screen, self.color, self.rect)
 
     def is_out_of_bounds(self) -> bool:
         """Check if bomb fell off screen
@@ -1,7 +1,8 @@
 """Boss entity (Doh) for boss level"""
 import pygame
 from src.constants import (
-    SCREEN_WIDTH, BOSS_WIDTH, BOSS_HEIGHT, BOSS_HP, PURPLE
+    SCREEN_WIDTH, BOSS_WIDTH, BOSS_HEIGHT, BOSS_HP, BOSS_HP_BAR_GAP,
+    BOSS_HP_BAR_HEIGHT, PURPLE
 )
 
 
@@ -25,29 +26,35 @@ class Boss:
         self.hp -= 1
         return self.hp <= 0
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """Render boss on screen
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            Screen area drawn
         """
-        pygame.draw.rect(screen, self.color, self.rect)
+        drawn = pygame.draw.rect(screen, self.color, self.rect)
 
         # Draw HP bar
         from src.constants import WHITE, RED
         hp_bar_width = BOSS_WIDTH
-        hp_bar_height = 5
+        hp_bar_height = BOSS_HP_BAR_HEIGHT
         hp_percentage = self.hp / BOSS_HP
 
         # Background (red)
-        hp_bar_bg = pygame.Rect(self.rect.x, self.rect.bottom + 5, hp_bar_width, hp_bar_height)
-        pygame.draw.rect(screen, RED, hp_bar_bg)
+        hp_bar_bg = pygame.Rect(
+            self.rect.x, self.rect.bottom + BOSS_HP_BAR_GAP, hp_bar_width, hp_bar_height
+        )
+        drawn.union_ip(pygame.draw.rect(screen, RED, hp_bar_bg))
 
         # Foreground (white, shows remaining HP)
         hp_bar_fg = pygame.Rect(
             self.rect.x,
-            self.rect.bottom + 5,
+            self.rect.bottom + BOSS_HP_BAR_GAP,
             int(hp_bar_width * hp_percentage),
             hp_bar_height
         )
         pygame.draw.rect(screen, WHITE, hp_bar_fg)
+        return drawn
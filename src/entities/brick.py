@@ -8,9 +8,22 @@ from src.constants import (
 )
 
 
+# Color by (type, damaged)
+BRICK_COLORS = {
+    (BrickType.NORMAL, False): BRICK_NORMAL_COLOR,
+    (BrickType.NORMAL, True): BRICK_NORMAL_COLOR,
+    (BrickType.SILVER, False): BRICK_SILVER_COLOR,
+    (BrickType.SILVER, True): BRICK_SILVER_DAMAGED_COLOR,
+    (BrickType.GOLD, False): BRICK_GOLD_COLOR,
+    (BrickType.GOLD, True): BRICK_GOLD_COLOR,
+}
+
+
 class Brick:
     """Destructible brick obstacle"""
 
+    __slots__ = ('rect', 'type', 'hits')
+
     def __init__(self, x: int, y: int, brick_type: BrickType) -> None:
         """Initialize brick at position with type
 
@@ -22,21 +35,16 @@ class Brick:
         self.rect = pygame.Rect(x, y, BRICK_WIDTH, BRICK_HEIGHT)
         self.type = brick_type
         self.hits: int = 0
-        self.color = self._get_initial_color()
 
-    def _get_initial_color(self) -> Tuple[int, int, int]:
-        """Get initial color based on brick type
+    @property
+    def destructible(self) -> bool:
+        """Whether hits can ever destroy the brick (gold is indestructible)"""
+        return self.type is not BrickType.GOLD
 
-        Returns:
-            RGB color tuple
-        """
-        if self.type == BrickType.NORMAL:
-            return BRICK_NORMAL_COLOR
-        elif self.type == BrickType.SILVER:
-            return BRICK_SILVER_COLOR
-        elif self.type == BrickType.GOLD:
-            return BRICK_GOLD_COLOR
-        return BRICK_NORMAL_COLOR
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        """Current color (silver darkens once damaged)"""
+        return BRICK_COLORS[self.type, self.hits > 0]
 
     def hit(self) -> bool:
         """Register hit on brick
@@ -50,8 +58,6 @@ class Brick:
 
         elif self.type == BrickType.SILVER:
             self.hits += 1
-            if self.hits == 1:
-                self.color = BRICK_SILVER_DAMAGED_COLOR
             return self.hits >= 2
 
         elif self.type == BrickType.GOLD:
@@ -60,10 +66,13 @@ class Brick:
 
         return False
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """Render brick on screen
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            Screen area drawn
         """
-        pygame.draw.rect(screen, self.color, self.rect)
+        return pygame.draw.rect(screen, self.color, self.rect)
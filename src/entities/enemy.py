@@ -1,32 +1,51 @@
 """Enemy entity that falls from top"""
 import pygame
-import random
 from src.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SIZE, ENEMY_SPEED, ORANGE
+    SCREEN_HEIGHT, ENEMY_SIZE, ENEMY_SPEED, ORANGE
 )
 
 
 class Enemy:
     """Falling enemy that player must avoid or destroy"""
 
-    def __init__(self) -> None:
-        """Initialize enemy at random position at top"""
-        x = random.randint(0, SCREEN_WIDTH - ENEMY_SIZE)
-        self.rect = pygame.Rect(x, 0, ENEMY_SIZE, ENEMY_SIZE)
-        self.color = ORANGE
+    __slots__ = ('rect', 'dy', 'pool_index')
+
+    # Shared by all instances
+    color = ORANGE
+
+    def __init__(self, x: int) -> None:
+        """Initialize enemy at top of screen
+
+        Args:
+            x: Left X coordinate
+        """
+        self.rect = pygame.Rect(0, 0, ENEMY_SIZE, ENEMY_SIZE)
+        self.pool_index: int = -1
+        self.reset(x)
+
+    def reset(self, x: int) -> None:
+        """Move enemy back to the top of screen (for pool reuse)
+
+        Args:
+            x: Left X coordinate
+        """
+        self.rect.topleft = (x, 0)
         self.dy = ENEMY_SPEED
 
     def move(self) -> None:
         """Update enemy position (falling)"""
         self.rect.y += self.dy
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """Render enemy on screen
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            Screen area drawn
         """
-        pygame.draw.rect(screen, self.color, self.rect)
+        return pygame.draw.rect(screen, self.color, self.rect)
 
     def is_out_of_bounds(self) -> bool:
         """Check if enemy fell off screen
@@ -8,6 +8,11 @@ from src.constants import (
 class Laser:
     """Laser projectile fired upward from paddle"""
 
+    __slots__ = ('rect', 'dy', 'pool_index')
+
+    # Shared by all instances
+    color = YELLOW
+
     def __init__(self, x: int, y: int) -> None:
         """Initialize laser at position
 
@@ -15,26 +20,34 @@ class Laser:
             x: Center X coordinate
             y: Top Y coordinate
         """
-        self.rect = pygame.Rect(
-            x - LASER_WIDTH // 2,
-            y,
-            LASER_WIDTH,
-            LASER_HEIGHT
-        )
-        self.color = YELLOW
+        self.rect = pygame.Rect(0, 0, LASER_WIDTH, LASER_HEIGHT)
+        self.pool_index: int = -1
+        self.reset(x, y)
+
+    def reset(self, x: int, y: int) -> None:
+        """Move laser to a new firing position (for pool reuse)
+
+        Args:
+            x: Center X coordinate
+            y: Top Y coordinate
+        """
+        self.rect.topleft = (x - LASER_WIDTH // 2, y)
         self.dy = -LASER_SPEED
 
     def move(self) -> None:
         """Update laser position (moving upward)"""
         self.rect.y += self.dy
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """Render laser on screen
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            Screen area drawn
         """
-        pygame.draw.rect(screen, self.color, self.rect)
+        return pygame.draw.rect(screen, self.color, self.rect)
 
     def is_out_of_bounds(self) -> bool:
         """Check if laser left screen
@@ -22,18 +22,29 @@ class Paddle:
         self.laser_active: bool = False
         self.catch_active: bool = False
         self.caught_ball: Optional['Ball'] = None
+        self.prev_x: Optional[int] = None
 
-    def move(self) -> None:
-        """Update paddle position based on mouse and keyboard input"""
+    def move(
+        self,
+        target_x: Optional[int] = None,
+        move_left: bool = False,
+        move_right: bool = False
+    ) -> None:
+        """Update paddle position from sampled input
+
+        Args:
+            target_x: Mouse X to center paddle on (None keeps position)
+            move_left: Left key held
+            move_right: Right key held
+        """
         # Primary control: Mouse
-        mouse_x = pygame.mouse.get_pos()[0]
-        self.rect.centerx = mouse_x
+        if target_x is not None:
+            self.rect.centerx = target_x
 
         # Secondary control: Keyboard
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
+        if move_left:
             self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT]:
+        if move_right:
             self.rect.x += self.speed
 
         # Keep paddle within screen boundaries
@@ -46,13 +57,32 @@ class Paddle:
         if self.caught_ball:
             self.caught_ball.rect.centerx = self.rect.centerx
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def interpolated_rect(self, alpha: float = 1.0) -> pygame.Rect:
+        """Get rect to draw at between the last two ticks
+
+        Args:
+            alpha: Interpolation factor between previous and current tick
+
+        Returns:
+            Paddle rect (a copy when interpolated)
+        """
+        rect = self.rect
+        if alpha < 1.0 and self.prev_x is not None:
+            rect = rect.copy()
+            rect.x = round(self.prev_x + (self.rect.x - self.prev_x) * alpha)
+        return rect
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> pygame.Rect:
         """Render paddle on screen
 
         Args:
             screen: Pygame surface to draw on
+            alpha: Interpolation factor between previous and current tick
+
+        Returns:
+            Screen area drawn
         """
-        pygame.draw.rect(screen, self.color, self.rect)
+        return pygame.draw.rect(screen, self.color, self.interpolated_rect(alpha))
 
     def reset_width(self) -> None:
         """Reset paddle width to normal size"""
@@ -1,15 +1,19 @@
 """Power-up entity for gameplay enhancements"""
 import pygame
+from typing import Tuple
 from src.constants import (
     POWERUP_WIDTH, POWERUP_HEIGHT, POWERUP_SPEED,
     PowerUpType, POWERUP_COLORS, POWERUP_LABELS,
     BLACK, FONT_SIZE_SMALL
 )
+from src.rendering.text_cache import get_text_cache
 
 
 class PowerUp:
     """Falling power-up that grants special abilities"""
 
+    __slots__ = ('rect', 'type', 'dy', 'pool_index')
+
     def __init__(self, x: int, y: int, powerup_type: PowerUpType) -> None:
         """Initialize power-up at position
 
@@ -18,35 +22,52 @@ class PowerUp:
             y: Center Y coordinate
             powerup_type: Type of power-up effect
         """
-        self.rect = pygame.Rect(
-            x - POWERUP_WIDTH // 2,
-            y - POWERUP_HEIGHT // 2,
-            POWERUP_WIDTH,
-            POWERUP_HEIGHT
-        )
+        self.rect = pygame.Rect(0, 0, POWERUP_WIDTH, POWERUP_HEIGHT)
+        self.pool_index: int = -1
+        self.reset(x, y, powerup_type)
+
+    def reset(self, x: int, y: int, powerup_type: PowerUpType) -> None:
+        """Move power-up to a new drop position (for pool reuse)
+
+        Args:
+            x: Center X coordinate
+            y: Center Y coordinate
+            powerup_type: Type of power-up effect
+        """
+        self.rect.topleft = (x - POWERUP_WIDTH // 2, y - POWERUP_HEIGHT // 2)
         self.type = powerup_type
         self.dy = POWERUP_SPEED
-        self.color = POWERUP_COLORS.get(powerup_type, (0, 0, 255))
-        self.label = POWERUP_LABELS.get(powerup_type, '?')
+
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        """Capsule color for this power-up type"""
+        return POWERUP_COLORS.get(self.type, (0, 0, 255))
+
+    @property
+    def label(self) -> str:
+        """Capsule letter for this power-up type"""
+        return POWERUP_LABELS.get(self.type, '?')
 
     def move(self) -> None:
         """Update power-up position (falling)"""
         self.rect.y += self.dy
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """Render power-up on screen
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            Screen area drawn
         """
         # Draw colored rectangle
-        pygame.draw.rect(screen, self.color, self.rect)
+        drawn = pygame.draw.rect(screen, self.color, self.rect)
 
         # Draw label text
-        font = pygame.font.Font(None, FONT_SIZE_SMALL)
-        text = font.render(self.label, True, BLACK)
+        text = get_text_cache().render(self.label, BLACK, FONT_SIZE_SMALL)
         text_rect = text.get_rect(center=self.rect.center)
-        screen.blit(text, text_rect)
+        return drawn.union(screen.blit(text, text_rect))
 
     def is_out_of_bounds(self) -> bool:
         """Check if power-up fell off screen
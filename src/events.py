@@ -0,0 +1,127 @@
+"""Gameplay event stream
+
+Collision code only records what happened (emit()); side effects such as
+scoring, power-up drops, sounds and brick redraws live in subscribers that
+receive each phase's events as one batch (dispatch()). Event records are
+preallocated and reused, so emitting allocates nothing, and an event type
+nobody subscribed to (audio and effects in headless runs) costs no more
+than filling one slot.
+"""
+from enum import Enum
+from typing import Any, Callable, Iterator, List, Optional
+from src.constants import EVENT_BUFFER_SIZE
+
+
+class EventType(Enum):
+    BALL_BOUNCE = 'ball_bounce'              # Ball bounced off a wall, the paddle or the boss
+    BRICK_HIT = 'brick_hit'                  # subject: brick (still standing)
+    BRICK_DESTROYED = 'brick_destroyed'      # subject: brick
+    ENEMY_KILLED = 'enemy_killed'            # subject: enemy
+    BOSS_HIT = 'boss_hit'                    # subject: boss (still alive)
+    BOSS_DEFEATED = 'boss_defeated'          # subject: boss
+    POWERUP_COLLECTED = 'powerup_collected'  # subject: power-up
+    LIFE_LOST = 'life_lost'
+    LEVEL_CLEARED = 'level_cleared'
+
+
+class EventSource(Enum):
+    BALL = 'ball'
+    LASER = 'laser'
+    BOMB = 'bomb'
+    PADDLE = 'paddle'
+
+
+class Event:
+    """Reusable event record (only valid until its batch is dispatched)"""
+
+    __slots__ = ('type', 'subject', 'source')
+
+    def __init__(self) -> None:
+        self.type: Optional[EventType] = None
+        self.subject: Any = None
+        self.source: Optional[EventSource] = None
+
+
+Subscriber = Callable[['EventBus'], None]
+
+
+class EventBus:
+    """Per-tick event buffer with batched dispatch
+
+    Subscribers are called once per dispatch() with the bus and iterate it
+    for the events they care about, in emission order.
+    """
+
+    def __init__(self, capacity: int = EVENT_BUFFER_SIZE) -> None:
+        """Initialize bus
+
+        Args:
+            capacity: Event records to preallocate
+        """
+        self._events: List[Event] = [Event() for _ in range(capacity)]
+        self._count: int = 0
+        self._subscribers: List[Subscriber] = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Event]:
+        events = self._events
+        for index in range(self._count):
+            yield events[index]
+
+    def subscribe(self, handler: Subscriber) -> None:
+        """Receive every dispatched batch
+
+        Args:
+            handler: Called with this bus; subscribers run in subscription order
+        """
+        self._subscribers.append(handler)
+
+    def unsubscribe(self, handler: Subscriber) -> None:
+        """Stop receiving batches
+
+        Args:
+            handler: Subscribed handler
+
+        Raises:
+            ValueError: If handler is not subscribed
+        """
+        self._subscribers.remove(handler)
+
+    def emit(
+        self,
+        event_type: EventType,
+        subject: Any = None,
+        source: Optional[EventSource] = None
+    ) -> None:
+        """Record an event for the next dispatch()
+
+        Args:
+            event_type: What happened
+            subject: Entity it happened to
+            source: What caused it
+        """
+        count = self._count
+        if count == len(self._events):
+            self._events.extend(Event() for _ in range(count))
+        event = self._events[count]
+        event.type = event_type
+        event.subject = subject
+        event.source = source
+        self._count = count + 1
+
+    def dispatch(self) -> None:
+        """Hand the recorded events to all subscribers and empty the buffer"""
+        if not self._count:
+            return
+        for handler in self._subscribers:
+            handler(self)
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop recorded events without dispatching them"""
+        events = self._events
+        for index in range(self._count):
+            events[index].subject = None
+        self._count = 0
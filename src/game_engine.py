@@ -1,51 +1,151 @@
 """Main game engine and loop"""
 import pygame
 import sys
-import random
-from typing import List
+import time
+from typing import Optional, Sequence
 from src.game_state import GameState
-from src.managers.sound_manager import SoundManager
+from src.snapshot import Snapshot
+from src.rng import GameRandom
+from src.brick_grid import BrickGrid
+from src.events import EventBus, EventSource, EventType
+from src.managers.sound_manager import SoundManager, NullSoundManager
+from src.managers.input_manager import (
+    InputFrame, InputManager, ScriptedInputManager
+)
 from src.managers.collision_manager import CollisionManager
 from src.managers.powerup_manager import PowerUpManager
 from src.managers.level_manager import LevelManager
-from src.entities.powerup import PowerUp
-from src.entities.laser import Laser
-from src.entities.enemy import Enemy
-from src.entities.bomb import Bomb
+from src.rendering.renderer import Renderer, NullRenderer
+from src.rendering.dirty_renderer import DirtyRectRenderer
+from src.profiler import FrameProfiler
 from src.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE,
-    FONT_SIZE, PowerUpType, POWERUP_DROP_CHANCE,
+    TICK_RATE, RENDER_FPS, MAX_CATCH_UP_STEPS, DIRTY_RECT_RENDERING,
+    PROFILER_OVERLAY_REFRESH, PowerUpType, POWERUP_DROP_CHANCE,
     ENEMY_SPAWN_INTERVAL, BOMB_SPAWN_INTERVAL,
-    POINTS_PER_BRICK, POINTS_PER_ENEMY, POINTS_PER_BOSS_HIT
+    POINTS_PER_BRICK, POINTS_PER_ENEMY, POINTS_PER_BOSS_HIT,
+    ENEMY_SIZE
 )
 
 
 class GameEngine:
     """Main game engine that manages game loop and updates"""
 
-    def __init__(self, level_data: List[List[str]]) -> None:
+    # Phases timed while profiling: phase name -> engine method
+    PROFILED_PHASES = {
+        'input': '_handle_events',
+        'balls': '_update_balls',
+        'power_ups': '_update_power_ups',
+        'lasers': '_update_lasers',
+        'enemies': '_update_enemies',
+        'bombs': '_update_bombs',
+        'draw': '_draw',
+    }
+
+    def __init__(
+        self,
+        level_data: Sequence,
+        headless: bool = False,
+        input_manager: Optional[InputManager] = None,
+        game_speed: float = 1.0,
+        render_fps: int = RENDER_FPS,
+        max_catch_up_steps: int = MAX_CATCH_UP_STEPS,
+        interpolate: bool = True,
+        seed: Optional[int] = None,
+        vectorized_balls: bool = False,
+        start_level: int = 0
+    ) -> None:
         """Initialize game engine
 
         Args:
-            level_data: List of level layouts
+            level_data: List of level layouts, or a LevelPack
+            headless: Run without display or audio device (simulation mode)
+            input_manager: Input source (defaults to pygame input, or
+                scripted idle input when headless)
+            game_speed: Multiple of real time to play at. A tick is a fixed
+                1 / TICK_RATE seconds of game time (speeds and timers are per
+                tick), so this runs TICK_RATE * game_speed ticks per real
+                second and speeds the game up or slows it down accordingly.
+                The simulation rate cannot be changed apart from gameplay
+                speed; only render_fps is independent of it
+            render_fps: Render frame cap (0 = uncapped)
+            max_catch_up_steps: Max physics ticks per rendered frame before
+                the remaining backlog is dropped
+            interpolate: Draw moving bodies between the last two ticks
+            seed: Game seed. The same seed and input sequence reproduce
+                the same GameState tick for tick (None picks a random seed)
+            vectorized_balls: Simulate balls with the NumPy BallSystem
+                (for very large multiball counts)
+            start_level: Index of the level to start on
+
+        Raises:
+            ValueError: If game_speed is not positive, or start_level is
+                not a level of level_data
         """
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("VC-Arkanoid")
+        if game_speed <= 0:
+            raise ValueError("game_speed must be positive")
+        self.headless = headless
+        self.game_speed = game_speed
+        self.render_fps = render_fps
+        self.max_catch_up_steps = max_catch_up_steps
+        self.interpolate = interpolate
+        self.vectorized_balls = vectorized_balls
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, FONT_SIZE)
+
+        if headless:
+            self.screen: Optional[pygame.Surface] = None
+            self.renderer: Renderer = NullRenderer()
+            self.sound_manager: SoundManager = NullSoundManager()
+        else:
+            pygame.init()
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("VC-Arkanoid")
+            if DIRTY_RECT_RENDERING:
+                self.renderer = DirtyRectRenderer(self.screen)
+            else:
+                self.renderer = Renderer(self.screen)
+            self.sound_manager = SoundManager()
+        self.font = self.renderer.font
+
+        if input_manager is None:
+            input_manager = ScriptedInputManager() if headless else InputManager()
+        self.input_manager = input_manager
+        self.input = InputFrame()
 
         # Game components
-        self.state = GameState()
-        self.sound_manager = SoundManager()
+        self.rng = GameRandom(seed)
+        self.input_manager.on_reset(self.rng.seed)
+        self.state = GameState(vectorized_balls)
         self.collision_manager = CollisionManager()
         self.powerup_manager = PowerUpManager()
         self.level_manager = LevelManager(level_data)
 
+        # Gameplay side effects, run on each phase's events
+        self.events = EventBus()
+        self.events.subscribe(self._score_events)
+        self.events.subscribe(self._drop_powerups)
+        if not headless:
+            self.events.subscribe(self._redraw_hit_bricks)
+            self.events.subscribe(self._play_event_sounds)
+
         # Load first level
-        self._load_level(0)
+        self._check_level_index(start_level)
+        self._load_level(start_level)
 
         self.running: bool = True
+        self.quit_requested: bool = False
+        self.profiler: Optional[FrameProfiler] = None
+        self.profiler_overlay: bool = False
+
+    def _check_level_index(self, level_index: int) -> None:
+        """Validate a level index given by the caller
+
+        Raises:
+            ValueError: If level_index is not a level of the level set
+        """
+        total = self.level_manager.get_total_levels()
+        if not 0 <= level_index < total:
+            raise ValueError(f"Level index {level_index} out of range for {total} levels")
 
     def _load_level(self, level_index: int) -> None:
         """Load specified level
@@ -54,7 +154,7 @@ class GameEngine:
             level_index: Index of level to load
         """
         self.state.level = level_index
-        self.state.bricks = self.level_manager.load_level(level_index)
+        self.state.bricks = BrickGrid(self.level_manager.load_level(level_index))
 
         if self.level_manager.should_spawn_boss(level_index):
             self.state.boss = self.level_manager.create_boss()
@@ -62,45 +162,215 @@ class GameEngine:
             self.state.boss = None
 
     def run(self) -> None:
-        """Main game loop"""
+        """Main game loop
+
+        Physics advances in fixed ticks of 1 / (TICK_RATE * game_speed)
+        real seconds, driven by an accumulator of elapsed real time.
+        Rendering runs once per loop iteration at up to render_fps,
+        interpolating between ticks.
+        """
+        tick_seconds = 1.0 / (TICK_RATE * self.game_speed)
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+
         while self.running:
-            self._handle_events()
-            self._update()
-            self._draw()
-            self.clock.tick(FPS)
+            if self.profiler:
+                self.profiler.begin_frame()
+            now = time.perf_counter()
+            accumulator += now - previous_time
+            previous_time = now
+
+            steps = 0
+            while accumulator >= tick_seconds and self.running:
+                if steps >= self.max_catch_up_steps:
+                    # Drop backlog rather than spiral further behind
+                    accumulator = 0.0
+                    break
+                if self.interpolate:
+                    self._store_previous_positions()
+                self.step()
+                accumulator -= tick_seconds
+                steps += 1
+
+            alpha = accumulator / tick_seconds if self.interpolate else 1.0
+            self._draw(alpha)
+            if self.profiler:
+                self._end_profiled_frame()
+            self.clock.tick(self.render_fps)
+
+        if self.profiler:
+            self.profiler.close()
 
         # Game ended - show appropriate screen
-        if self.state.is_game_over():
+        if self.quit_requested:
+            pass
+        elif self.state.is_game_over():
             if self._show_game_over_screen():
                 self._restart_game()
         else:
             if self._show_game_win_screen():
                 self._restart_game()
 
+        self.close()
         pygame.quit()
         sys.exit()
 
-    def _restart_game(self) -> None:
-        """Restart game from beginning"""
+    def close(self) -> None:
+        """Stop the level prefetch and audio threads
+
+        The engine can still be stepped afterwards; prefetching restarts
+        on the next level load.
+        """
+        self.level_manager.close()
+        self.sound_manager.close()
+
+    def __enter__(self) -> 'GameEngine':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def step(self) -> None:
+        """Advance simulation by one tick without rendering or frame capping"""
+        self._handle_events()
+        if not self.quit_requested:
+            self._update()
+        self.sound_manager.flush()
+
+    def run_headless(self, max_frames: int) -> int:
+        """Step simulation as fast as possible until game ends or frame limit
+
+        Args:
+            max_frames: Maximum number of ticks to simulate
+
+        Returns:
+            Number of ticks simulated
+        """
+        frames = 0
+        profiler = self.profiler
+        while self.running and frames < max_frames:
+            if profiler:
+                profiler.begin_frame()
+                self.step()
+                profiler.end_frame()
+            else:
+                self.step()
+            frames += 1
+        return frames
+
+    def enable_profiling(
+        self,
+        overlay: bool = False,
+        trace_path: Optional[str] = None
+    ) -> FrameProfiler:
+        """Start timing engine phases
+
+        Phase methods are shadowed by timing wrappers on this instance only,
+        so a disabled profiler adds no per-call cost. While enabled the
+        profiler also subscribes to the event bus to count events.
+
+        Args:
+            overlay: Show frame-time percentiles in game
+            trace_path: Write per-frame timings to this CSV/JSONL file
+
+        Returns:
+            Active profiler
+        """
+        self.disable_profiling()
+        self.profiler = FrameProfiler(tuple(self.PROFILED_PHASES), trace_path=trace_path)
+        self.profiler_overlay = overlay
+        for phase, name in self.PROFILED_PHASES.items():
+            setattr(self, name, self.profiler.wrap(phase, getattr(self, name)))
+        self.events.subscribe(self.profiler.count_events)
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Stop timing engine phases and close any trace file"""
+        if self.profiler is None:
+            return
+        for name in self.PROFILED_PHASES.values():
+            self.__dict__.pop(name, None)
+        self.events.unsubscribe(self.profiler.count_events)
+        self.profiler.close()
+        self.profiler = None
+        self.renderer.overlay_lines = None
+
+    def _end_profiled_frame(self) -> None:
+        """Record frame timings and refresh overlay text periodically"""
+        self.profiler.end_frame()
+        if self.profiler_overlay and self.profiler.frame_count % PROFILER_OVERLAY_REFRESH == 1:
+            self.renderer.overlay_lines = self.profiler.overlay_lines()
+
+    def reset(self, seed: Optional[int] = None, start_level: int = 0) -> None:
+        """Start a new game
+
+        Args:
+            seed: Game seed (None picks a random seed)
+            start_level: Index of the level to start on
+
+        Raises:
+            ValueError: If start_level is not a level of the level set
+        """
+        self._check_level_index(start_level)
+        self.rng = GameRandom(seed)
+        self.input_manager.on_reset(self.rng.seed)
         self.state.reset_game()
+        self.events.clear()
         self.powerup_manager = PowerUpManager()
-        self._load_level(0)
+        self._load_level(start_level)
         self.running = True
+        self.quit_requested = False
+
+    def snapshot(self) -> Snapshot:
+        """Checkpoint game state, power-up timers and RNG streams
+
+        Returns:
+            Immutable snapshot for restore()
+        """
+        return self.state.snapshot(self.powerup_manager, self.rng)
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Rewind or branch to a checkpoint from snapshot()
+
+        The engine runs again afterwards (as after reset()) unless the
+        restored state is game over.
+
+        Args:
+            snapshot: Checkpoint to restore
+        """
+        self.state.restore(snapshot, self.powerup_manager, self.rng)
+        self.events.clear()
+        self.running = not self.state.is_game_over()
+        self.quit_requested = False
+
+    def _restart_game(self) -> None:
+        """Restart game from beginning"""
+        self.reset()
         self.run()
 
+    def _store_previous_positions(self) -> None:
+        """Remember positions of moving bodies for render interpolation"""
+        self.state.paddle.prev_x = self.state.paddle.rect.x
+        if self.vectorized_balls:
+            self.state.balls.store_previous()
+            return
+        for ball in self.state.balls:
+            ball.prev_center = ball.rect.center
+
     def _handle_events(self) -> None:
-        """Process input events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+        """Sample input for this tick and process discrete actions"""
+        self.input = self.input_manager.poll()
+
+        if self.input.quit:
+            self.running = False
+            self.quit_requested = True
 
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
-                    self.state.toggle_pause()
+        if self.input.pause:
+            self.state.toggle_pause()
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if not self.state.is_paused:
-                    self._handle_mouse_click()
+        if self.input.fire:
+            if not self.state.is_paused:
+                self._handle_mouse_click()
 
     def _handle_mouse_click(self) -> None:
         """Handle mouse click for laser firing and ball release"""
@@ -109,8 +379,8 @@ class GameEngine:
             left_x = self.state.paddle.rect.left + 10
             right_x = self.state.paddle.rect.right - 10
             y = self.state.paddle.rect.top
-            self.state.lasers.append(Laser(left_x, y))
-            self.state.lasers.append(Laser(right_x, y))
+            self.state.lasers.acquire(left_x, y)
+            self.state.lasers.acquire(right_x, y)
 
         if self.state.paddle.caught_ball:
             self.state.paddle.release_ball()
@@ -121,14 +391,18 @@ class GameEngine:
             return
 
         # Update paddle
-        self.state.paddle.move()
+        self.state.paddle.move(
+            self.input.paddle_x, self.input.move_left, self.input.move_right
+        )
 
-        # Update balls
+        # Update balls (events and removals are deferred until the phase ends)
         self._update_balls()
+        self._end_phase()
 
         # Check for life loss
         if not self.state.has_balls():
             self.state.lose_life()
+            self.events.emit(EventType.LIFE_LOST, source=EventSource.BALL)
             if self.state.is_game_over():
                 self.running = False
             else:
@@ -139,57 +413,155 @@ class GameEngine:
         self._update_lasers()
         self._update_enemies()
         self._update_bombs()
+        self._end_phase()
 
-        # Check for stage clear
+        # Check for stage clear (LEVEL_CLEARED is dispatched in this tick)
         if self.state.is_stage_clear():
             self._advance_level()
+            self.events.dispatch()
 
     def _update_balls(self) -> None:
         """Update all balls and handle collisions"""
-        for ball in self.state.balls[:]:
-            ball.move()
+        if self.vectorized_balls:
+            self._update_balls_vectorized()
+            return
+
+        emit = self.events.emit
+        for ball in self.state.balls:
+            # Move with swept brick/paddle collision
+            hit_bricks, hit_paddle = self.collision_manager.sweep_ball(
+                ball, self.state.bricks, self.state.paddle
+            )
 
             # Wall collisions
             if ball.bounce_wall():
-                self.sound_manager.play_bounce()
+                emit(EventType.BALL_BOUNCE, source=EventSource.BALL)
 
             # Paddle collision
-            if ball.bounce_paddle(self.state.paddle):
-                self.sound_manager.play_bounce()
+            if hit_paddle or ball.bounce_paddle(self.state.paddle):
+                emit(EventType.BALL_BOUNCE, self.state.paddle, EventSource.BALL)
 
             # Brick collisions
-            collided_brick = self.collision_manager.check_ball_brick_collision(
-                ball, self.state.bricks
-            )
-            if collided_brick:
-                if collided_brick.hit():
-                    self.state.bricks.remove(collided_brick)
-                    self.state.add_score(POINTS_PER_BRICK)
-                    self.sound_manager.play_brick_destroy()
-                    self._try_spawn_powerup(collided_brick.rect.centerx, collided_brick.rect.centery)
-                ball.reverse_dy()
+            for brick in hit_bricks:
+                self._hit_brick(brick, EventSource.BALL)
 
             # Enemy collisions
             collided_enemy = self.collision_manager.check_ball_enemy_collision(
                 ball, self.state.enemies
             )
             if collided_enemy:
-                self.state.enemies.remove(collided_enemy)
-                self.state.add_score(POINTS_PER_ENEMY)
+                self.state.enemies.discard(collided_enemy)
+                emit(EventType.ENEMY_KILLED, collided_enemy, EventSource.BALL)
                 ball.reverse_dy()
 
             # Boss collision
             if self.collision_manager.check_ball_boss_collision(ball, self.state.boss):
-                if self.state.boss and self.state.boss.hit():
-                    self.state.boss = None  # Boss defeated
-                else:
-                    self.state.add_score(POINTS_PER_BOSS_HIT)
+                self._hit_boss()
                 ball.reverse_dy()
-                self.sound_manager.play_bounce()
 
             # Out of bounds
             if ball.is_out_of_bounds():
-                self.state.balls.remove(ball)
+                self.state.balls.discard(ball)
+
+    def _update_balls_vectorized(self) -> None:
+        """Update all balls at once through the BallSystem arrays"""
+        balls = self.state.balls
+        hit_bricks, bounced = balls.step(self.state.paddle, self.state.bricks)
+        if bounced:
+            self.events.emit(EventType.BALL_BOUNCE, source=EventSource.BALL)
+
+        # Brick collisions
+        for brick in hit_bricks:
+            self._hit_brick(brick, EventSource.BALL)
+
+        # Enemy collisions (each enemy bounces the first ball touching it)
+        for enemy in self.state.enemies:
+            touching = balls.overlapping(enemy.rect)
+            if len(touching):
+                self.state.enemies.discard(enemy)
+                self.events.emit(EventType.ENEMY_KILLED, enemy, EventSource.BALL)
+                balls.reverse_dy(touching[:1])
+
+        # Boss collision
+        if self.state.boss:
+            for index in balls.overlapping(self.state.boss.rect).tolist():
+                balls.reverse_dy(index)
+                if not self._hit_boss():
+                    break
+
+        # Out of bounds
+        balls.remove_out_of_bounds()
+
+    def _hit_brick(self, brick, source: EventSource) -> None:
+        """Damage a brick and record the hit
+
+        Args:
+            brick: Brick that was hit
+            source: EventSource.BALL or EventSource.LASER
+        """
+        if self.state.bricks.hit(brick):
+            self.events.emit(EventType.BRICK_DESTROYED, brick, source)
+        else:
+            self.events.emit(EventType.BRICK_HIT, brick, source)
+
+    def _hit_boss(self) -> bool:
+        """Damage the boss with a ball and record the hit
+
+        Returns:
+            True if the boss is still alive
+        """
+        boss = self.state.boss
+        self.events.emit(EventType.BALL_BOUNCE, boss, EventSource.BALL)
+        if boss.hit():
+            self.state.boss = None
+            self.events.emit(EventType.BOSS_DEFEATED, boss, EventSource.BALL)
+            return False
+        self.events.emit(EventType.BOSS_HIT, boss, EventSource.BALL)
+        return True
+
+    def _end_phase(self) -> None:
+        """Run the phase's event side effects, then apply deferred removals"""
+        self.events.dispatch()
+        self.state.flush_removals()
+
+    def _score_events(self, events: EventBus) -> None:
+        """Award points for destroyed bricks, killed enemies and boss hits"""
+        points = 0
+        for event in events:
+            event_type = event.type
+            if event_type is EventType.BRICK_DESTROYED:
+                points += POINTS_PER_BRICK
+            elif event_type is EventType.ENEMY_KILLED:
+                points += POINTS_PER_ENEMY
+            elif event_type is EventType.BOSS_HIT:
+                points += POINTS_PER_BOSS_HIT
+        if points:
+            self.state.add_score(points)
+
+    def _drop_powerups(self, events: EventBus) -> None:
+        """Roll for a power-up at each brick destroyed by a ball"""
+        for event in events:
+            if event.type is EventType.BRICK_DESTROYED and event.source is EventSource.BALL:
+                rect = event.subject.rect
+                self._try_spawn_powerup(rect.centerx, rect.centery)
+
+    def _redraw_hit_bricks(self, events: EventBus) -> None:
+        """Tell the renderer which bricks changed"""
+        for event in events:
+            if event.type is EventType.BRICK_HIT or event.type is EventType.BRICK_DESTROYED:
+                self.renderer.invalidate_brick(event.subject)
+
+    def _play_event_sounds(self, events: EventBus) -> None:
+        """Request sounds for bounces, ball-destroyed bricks and power-ups"""
+        for event in events:
+            event_type = event.type
+            if event_type is EventType.BALL_BOUNCE:
+                self.sound_manager.play_bounce()
+            elif event_type is EventType.BRICK_DESTROYED:
+                if event.source is EventSource.BALL:
+                    self.sound_manager.play_brick_destroy()
+            elif event_type is EventType.POWERUP_COLLECTED:
+                self.sound_manager.play_powerup()
 
     def _try_spawn_powerup(self, x: int, y: int) -> None:
         """Try to spawn power-up at position
@@ -198,16 +570,15 @@ class GameEngine:
             x: X coordinate
             y: Y coordinate
         """
-        if random.random() < POWERUP_DROP_CHANCE:
+        if self.rng.drops.random() < POWERUP_DROP_CHANCE:
             powerup_types = list(PowerUpType)
-            powerup_type = random.choice(powerup_types)
-            powerup = PowerUp(x, y, powerup_type)
-            self.state.power_ups.append(powerup)
+            powerup_type = self.rng.drops.choice(powerup_types)
+            self.state.power_ups.acquire(x, y, powerup_type)
 
     def _update_power_ups(self) -> None:
         """Update power-ups and handle collection"""
         # Move power-ups
-        for powerup in self.state.power_ups[:]:
+        for powerup in self.state.power_ups:
             powerup.move()
 
             # Check collision with paddle
@@ -215,8 +586,11 @@ class GameEngine:
                 powerup, self.state.paddle
             ):
                 # Apply power-up effect
+                self.events.emit(EventType.POWERUP_COLLECTED, powerup, EventSource.PADDLE)
                 if powerup.type == PowerUpType.BREAK:
+                    # Level change clears all capsules, including this one
                     self._advance_level()
+                    break
                 else:
                     lives_gained = self.powerup_manager.apply_powerup(
                         powerup, self.state.paddle, self.state.balls
@@ -224,24 +598,23 @@ class GameEngine:
                     if lives_gained > 0:
                         self.state.gain_life()
 
-                self.state.power_ups.remove(powerup)
-                self.sound_manager.play_powerup()
+                self.state.power_ups.discard(powerup)
 
             # Remove if out of bounds
             elif powerup.is_out_of_bounds():
-                self.state.power_ups.remove(powerup)
+                self.state.power_ups.discard(powerup)
 
         # Update power-up timers
         self.powerup_manager.update_timers(self.state.paddle, self.state.balls)
 
     def _update_lasers(self) -> None:
         """Update lasers and handle collisions"""
-        for laser in self.state.lasers[:]:
+        for laser in self.state.lasers:
             laser.move()
 
             # Check out of bounds
             if laser.is_out_of_bounds():
-                self.state.lasers.remove(laser)
+                self.state.lasers.discard(laser)
                 continue
 
             # Check brick collision
@@ -249,10 +622,8 @@ class GameEngine:
                 laser, self.state.bricks
             )
             if collided_brick:
-                if collided_brick.hit():
-                    self.state.bricks.remove(collided_brick)
-                    self.state.add_score(POINTS_PER_BRICK)
-                self.state.lasers.remove(laser)
+                self._hit_brick(collided_brick, EventSource.LASER)
+                self.state.lasers.discard(laser)
                 continue
 
             # Check enemy collision
@@ -260,9 +631,9 @@ class GameEngine:
                 laser, self.state.enemies
             )
             if collided_enemy:
-                self.state.enemies.remove(collided_enemy)
-                self.state.add_score(POINTS_PER_ENEMY)
-                self.state.lasers.remove(laser)
+                self.state.enemies.discard(collided_enemy)
+                self.events.emit(EventType.ENEMY_KILLED, collided_enemy, EventSource.LASER)
+                self.state.lasers.discard(laser)
 
     def _update_enemies(self) -> None:
         """Update enemies and spawn new ones"""
@@ -270,13 +641,14 @@ class GameEngine:
         self.state.enemy_spawn_timer += 1
         if self.state.enemy_spawn_timer >= ENEMY_SPAWN_INTERVAL:
             self.state.enemy_spawn_timer = 0
-            self.state.enemies.append(Enemy())
+            x = self.rng.enemies.randint(0, SCREEN_WIDTH - ENEMY_SIZE)
+            self.state.enemies.acquire(x)
 
         # Move enemies
-        for enemy in self.state.enemies[:]:
+        for enemy in self.state.enemies:
             enemy.move()
             if enemy.is_out_of_bounds():
-                self.state.enemies.remove(enemy)
+                self.state.enemies.discard(enemy)
 
     def _update_bombs(self) -> None:
         """Update bombs dropped by boss"""
@@ -285,11 +657,12 @@ class GameEngine:
             self.state.bomb_spawn_timer += 1
             if self.state.bomb_spawn_timer >= BOMB_SPAWN_INTERVAL:
                 self.state.bomb_spawn_timer = 0
-                bomb = Bomb(self.state.boss.rect.centerx, self.state.boss.rect.bottom)
-                self.state.bombs.append(bomb)
+                self.state.bombs.acquire(
+                    self.state.boss.rect.centerx, self.state.boss.rect.bottom
+                )
 
         # Move bombs
-        for bomb in self.state.bombs[:]:
+        for bomb in self.state.bombs:
             bomb.move()
 
             # Check collision with paddle
@@ -297,17 +670,19 @@ class GameEngine:
                 bomb, self.state.paddle
             ):
                 self.state.lose_life()
-                self.state.bombs.remove(bomb)
+                self.events.emit(EventType.LIFE_LOST, bomb, EventSource.BOMB)
+                self.state.bombs.discard(bomb)
                 if self.state.is_game_over():
                     self.running = False
 
             # Remove if out of bounds
             elif bomb.is_out_of_bounds():
-                self.state.bombs.remove(bomb)
+                self.state.bombs.discard(bomb)
 
     def _advance_level(self) -> None:
         """Advance to next level"""
         next_level = self.state.level + 1
+        self.events.emit(EventType.LEVEL_CLEARED)
 
         if self.level_manager.has_next_level(next_level):
             self.state.reset_for_next_level()
@@ -316,68 +691,14 @@ class GameEngine:
             # Game won!
             self.running = False
 
-    def _draw(self) -> None:
-        """Render game"""
-        self.screen.fill(BLACK)
-
-        # Draw entities
-        self.state.paddle.draw(self.screen)
-
-        for ball in self.state.balls:
-            ball.draw(self.screen)
-
-        for brick in self.state.bricks:
-            brick.draw(self.screen)
-
-        for powerup in self.state.power_ups:
-            powerup.draw(self.screen)
-
-        for laser in self.state.lasers:
-            laser.draw(self.screen)
-
-        for enemy in self.state.enemies:
-            enemy.draw(self.screen)
-
-        if self.state.boss:
-            self.state.boss.draw(self.screen)
-
-        for bomb in self.state.bombs:
-            bomb.draw(self.screen)
-
-        # Draw UI
-        self._draw_ui()
-
-        # Draw pause overlay
-        if self.state.is_paused:
-            self._draw_pause_overlay()
-
-        pygame.display.flip()
+    def _draw(self, alpha: float = 1.0) -> None:
+        """Render game
 
-    def _draw_ui(self) -> None:
-        """Draw UI elements"""
-        score_text = self.font.render(f"Score: {self.state.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
-
-        lives_text = self.font.render(f"Lives: {self.state.lives}", True, WHITE)
-        self.screen.blit(lives_text, (SCREEN_WIDTH - 120, 10))
-
-        level_text = self.font.render(f"Level: {self.state.level + 1}", True, WHITE)
-        self.screen.blit(level_text, (SCREEN_WIDTH // 2 - 50, 10))
-
-    def _draw_pause_overlay(self) -> None:
-        """Draw pause screen overlay"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-
-        pause_text = self.font.render("PAUSED", True, WHITE)
-        text_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(pause_text, text_rect)
-
-        hint_text = self.font.render("Press P or ESC to resume", True, WHITE)
-        hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(hint_text, hint_rect)
+        Args:
+            alpha: Interpolation factor between previous and current tick
+        """
+        self.renderer.draw(self.state, alpha)
+        self.renderer.present()
 
     def _show_game_over_screen(self) -> bool:
         """Show game over screen
@@ -0,0 +1,275 @@
+"""Gym-style single-game environment around a headless GameEngine (requires NumPy)"""
+import numpy as np
+from operator import attrgetter
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+from src.entities.powerup import PowerUp
+from src.game_engine import GameEngine
+from src.managers.input_manager import InputFrame, InputManager
+from src.pool import EntityPool
+from src.rendering.offscreen import OffscreenRenderer
+from src.vector_env import ACTION_NOOP
+from src.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BRICK_WIDTH, BRICK_HEIGHT, BRICK_OFFSET_Y,
+    ENV_FRAME_SKIP, ENV_SCORE_REWARD, ENV_LIFE_REWARD
+)
+
+
+# Actions (NOOP/LEFT/RIGHT match VectorEnv)
+ACTION_FIRE = 3
+NUM_ACTIONS = 4
+
+# Scalar features, followed by the brick map
+FEATURE_FIELDS = (
+    'paddle_x', 'paddle_width', 'ball_x', 'ball_y', 'ball_dx', 'ball_dy',
+    'ball_caught', 'balls', 'bricks_left', 'lives', 'level', 'boss_hp',
+    'capsule_x', 'capsule_y', 'laser_active'
+)
+
+# Brick map: cell type codes (BrickGrid.cell_types) of the on-screen grid
+BRICK_MAP_ROWS = (SCREEN_HEIGHT - BRICK_OFFSET_Y) // BRICK_HEIGHT
+BRICK_MAP_COLS = SCREEN_WIDTH // BRICK_WIDTH
+FEATURE_SIZE = len(FEATURE_FIELDS) + BRICK_MAP_ROWS * BRICK_MAP_COLS
+
+_BALL_Y = attrgetter('pos_y')
+_CAPSULE_BOTTOM = attrgetter('rect.bottom')
+
+Observation = Union[np.ndarray, Dict[str, np.ndarray]]
+
+
+class _ActionInput(InputManager):
+    """Input source that replays the environment's current action"""
+
+    def __init__(self) -> None:
+        """Build one reusable input frame per action (fire only on the first tick)"""
+        self.first_frames = (
+            InputFrame(), InputFrame(move_left=True), InputFrame(move_right=True),
+            InputFrame(fire=True)
+        )
+        self.repeat_frames = self.first_frames[:3] + (InputFrame(),)
+        self.frame = self.first_frames[ACTION_NOOP]
+
+    def poll(self) -> InputFrame:
+        """Return the frame set by the environment
+
+        Returns:
+            InputFrame for this tick
+        """
+        return self.frame
+
+
+class GameEnv:
+    """One game behind reset(seed) / step(action), Gymnasium style
+
+    Observations are a float32 feature vector (FEATURE_FIELDS, then the
+    BRICK_MAP_ROWS x BRICK_MAP_COLS brick type map, row-major; positions
+    in screen pixels) and, if pixel_size is set, a frame drawn offscreen
+    at that size (OffscreenRenderer). Nothing is drawn unless pixel
+    observations are requested.
+
+    The features are written into one preallocated array. The brick map is
+    only refreshed when the brick grid changed, and capsules all fall at the
+    same speed, so the lowest one is only searched again when a capsule is
+    spawned or the tracked one leaves play. The lowest ball is picked by
+    max() over the ball list, with no per-ball Python code.
+    """
+
+    def __init__(
+        self,
+        level_data: Sequence,
+        frame_skip: int = ENV_FRAME_SKIP,
+        score_reward: float = ENV_SCORE_REWARD,
+        life_reward: float = ENV_LIFE_REWARD,
+        pixel_size: Optional[Tuple[int, int]] = None,
+        grayscale: bool = True,
+        max_episode_steps: Optional[int] = None
+    ) -> None:
+        """Initialize environment
+
+        Args:
+            level_data: List of level layouts, or a LevelPack
+            frame_skip: Ticks each action is repeated for (rewards are summed)
+            score_reward: Reward per point scored
+            life_reward: Reward per life gained (negative per life lost)
+            pixel_size: (width, height) of pixel observations (None = features only)
+            grayscale: Pixel observations as (h, w) luma instead of (h, w, 3) RGB
+            max_episode_steps: Truncate episodes after this many steps
+        """
+        if frame_skip < 1:
+            raise ValueError("frame_skip must be at least 1")
+        self.frame_skip = frame_skip
+        self.score_reward = score_reward
+        self.life_reward = life_reward
+        self.pixel_size = pixel_size
+        self.grayscale = grayscale
+        self.max_episode_steps = max_episode_steps
+        self.steps = 0
+
+        self._input = _ActionInput()
+        self.engine = GameEngine(level_data, headless=True, input_manager=self._input)
+
+        self._features = np.zeros(FEATURE_SIZE, dtype=np.float32)
+        self._scalars = self._features[:len(FEATURE_FIELDS)]
+        self._brick_map = self._features[len(FEATURE_FIELDS):].reshape(
+            BRICK_MAP_ROWS, BRICK_MAP_COLS
+        )
+        self._brick_key: Optional[Tuple[Any, int]] = None
+        self._capsule: Optional[PowerUp] = None
+        self._capsule_key: Optional[Tuple[Any, int]] = None
+
+        self._renderer: Optional[OffscreenRenderer] = None
+        if pixel_size is not None:
+            self._renderer = OffscreenRenderer(pixel_size, grayscale)
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Observation, Dict[str, Any]]:
+        """Start a new game
+
+        Args:
+            seed: Game seed (None picks a random seed)
+
+        Returns:
+            (observation, info)
+        """
+        self.engine.reset(seed)
+        self.steps = 0
+        self._brick_key = None
+        self._capsule_key = None
+        return self._observe(), self._info()
+
+    def step(self, action: int) -> Tuple[Observation, float, bool, bool, Dict[str, Any]]:
+        """Play one action for frame_skip ticks
+
+        Args:
+            action: ACTION_NOOP, ACTION_LEFT, ACTION_RIGHT or ACTION_FIRE
+
+        Returns:
+            (observation, reward, terminated, truncated, info); terminated
+            on game over or after the last level
+
+        Raises:
+            RuntimeError: If the game already terminated (call reset())
+        """
+        engine = self.engine
+        if not engine.running:
+            raise RuntimeError("GameEnv.step() called after the game ended; call reset()")
+        state = engine.state
+        score, lives = state.score, state.lives
+
+        self._input.frame = self._input.first_frames[action]
+        engine.step()
+        self._input.frame = self._input.repeat_frames[action]
+        for _ in range(self.frame_skip - 1):
+            if not engine.running:
+                break
+            engine.step()
+
+        self.steps += 1
+        reward = self.score_reward * (state.score - score) \
+            + self.life_reward * (state.lives - lives)
+        truncated = self.max_episode_steps is not None and self.steps >= self.max_episode_steps
+        return self._observe(), float(reward), not engine.running, truncated, self._info()
+
+    def features(self) -> np.ndarray:
+        """Compute the feature vector of the current state
+
+        Returns:
+            Preallocated array, overwritten by the next call (copy to keep)
+        """
+        state = self.engine.state
+        paddle = state.paddle
+        scalars = self._scalars
+
+        # Ball closest to the paddle (first one on ties)
+        lowest = max(state.balls, key=_BALL_Y, default=None)
+        if lowest is None:
+            scalars[2:7] = 0
+        else:
+            scalars[2] = lowest.pos_x
+            scalars[3] = lowest.pos_y
+            scalars[4] = lowest.dx
+            scalars[5] = lowest.dy
+            scalars[6] = lowest.is_caught
+
+        # Capsule closest to the paddle
+        capsule = self._lowest_capsule(state.power_ups)
+        if capsule is None:
+            scalars[12] = scalars[13] = -1
+        else:
+            scalars[12] = capsule.rect.centerx
+            scalars[13] = capsule.rect.centery
+
+        scalars[0] = paddle.rect.centerx
+        scalars[1] = paddle.rect.width
+        scalars[7] = len(state.balls)
+        scalars[8] = state.bricks.destructible
+        scalars[9] = state.lives
+        scalars[10] = state.level
+        scalars[11] = state.boss.hp if state.boss else 0
+        scalars[14] = paddle.laser_active
+
+        bricks = state.bricks
+        key = (bricks, bricks.version)
+        if key != self._brick_key:
+            self._brick_key = key
+            self._brick_map.fill(0)
+            if bricks.rows and bricks.cols:
+                cells = np.frombuffer(bricks.cell_types, dtype=np.uint8).reshape(
+                    bricks.rows, bricks.cols
+                )[:BRICK_MAP_ROWS, :BRICK_MAP_COLS]
+                self._brick_map[:cells.shape[0], :cells.shape[1]] = cells
+        return self._features
+
+    def _lowest_capsule(self, power_ups: EntityPool) -> Optional[PowerUp]:
+        """Get the capsule closest to the paddle, searching only when needed
+
+        Args:
+            power_ups: Capsules in play
+
+        Returns:
+            Lowest capsule or None
+        """
+        key = (power_ups, power_ups.created + power_ups.reused)
+        capsule = self._capsule
+        if key == self._capsule_key and (capsule is None or capsule.pool_index >= 0):
+            return capsule
+        capsule = max(power_ups, key=_CAPSULE_BOTTOM, default=None)
+        self._capsule = capsule
+        self._capsule_key = key
+        return capsule
+
+    def pixels(self) -> np.ndarray:
+        """Render the current state offscreen at pixel_size
+
+        Returns:
+            uint8 array shaped (height, width) or (height, width, 3)
+
+        Raises:
+            RuntimeError: If the environment was created without pixel_size
+        """
+        if self._renderer is None:
+            raise RuntimeError("GameEnv was created without pixel_size")
+        return self._renderer.to_array(self.engine.state)
+
+    def _observe(self) -> Observation:
+        """Build the observation for the current state"""
+        features = self.features().copy()
+        if self._renderer is None:
+            return features
+        return {'features': features, 'pixels': self.pixels()}
+
+    def _info(self) -> Dict[str, Any]:
+        """Episode bookkeeping returned with every observation"""
+        state = self.engine.state
+        return {
+            'score': state.score, 'lives': state.lives, 'level': state.level,
+            'steps': self.steps, 'seed': self.engine.rng.seed,
+        }
+
+    def close(self) -> None:
+        """Release the engine's background threads"""
+        self.engine.close()
+
+    def __enter__(self) -> 'GameEnv':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
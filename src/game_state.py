@@ -1,21 +1,34 @@
 """Game state management"""
-from typing import List, Optional
+import hashlib
+from typing import Optional, Tuple
 from src.entities.paddle import Paddle
 from src.entities.ball import Ball
-from src.entities.brick import Brick
 from src.entities.powerup import PowerUp
 from src.entities.laser import Laser
 from src.entities.enemy import Enemy
 from src.entities.boss import Boss
 from src.entities.bomb import Bomb
-from src.constants import INITIAL_LIVES
+from src.brick_grid import BrickGrid
+from src.pool import EntityList, EntityPool
+from src.snapshot import (
+    Snapshot, encode_core, decode_core, encode_bricks, decode_bricks,
+    encode_rng, decode_rng
+)
+from src.constants import (
+    INITIAL_LIVES, PowerUpType, POWERUP_POOL_SIZE, LASER_POOL_SIZE, ENEMY_POOL_SIZE, BOMB_POOL_SIZE
+)
 
 
 class GameState:
     """Manages game state including entities, score, and level"""
 
-    def __init__(self) -> None:
-        """Initialize game state"""
+    def __init__(self, vectorized_balls: bool = False) -> None:
+        """Initialize game state
+
+        Args:
+            vectorized_balls: Keep balls in a NumPy-backed BallSystem
+                instead of a list (needs NumPy)
+        """
         # Game progress
         self.level: int = 0
         self.score: int = 0
@@ -24,27 +37,48 @@ class GameState:
 
         # Game entities
         self.paddle: Paddle = Paddle()
-        self.balls: List[Ball] = [Ball()]
-        self.bricks: List[Brick] = []
-        self.power_ups: List[PowerUp] = []
-        self.lasers: List[Laser] = []
-        self.enemies: List[Enemy] = []
-        self.bombs: List[Bomb] = []
+        self.balls: EntityList[Ball] = EntityList()
+        if vectorized_balls:
+            from src.ball_system import BallSystem
+            self.balls = BallSystem()
+        self.balls.append(Ball())
+        self.bricks: BrickGrid = BrickGrid()
+        self.power_ups: EntityPool[PowerUp] = EntityPool(
+            lambda: PowerUp(0, 0, PowerUpType.ENLARGE), POWERUP_POOL_SIZE
+        )
+        self.lasers: EntityPool[Laser] = EntityPool(lambda: Laser(0, 0), LASER_POOL_SIZE)
+        self.enemies: EntityPool[Enemy] = EntityPool(lambda: Enemy(0), ENEMY_POOL_SIZE)
+        self.bombs: EntityPool[Bomb] = EntityPool(lambda: Bomb(0, 0), BOMB_POOL_SIZE)
         self.boss: Optional[Boss] = None
 
         # Spawn timers
         self.enemy_spawn_timer: int = 0
         self.bomb_spawn_timer: int = 0
 
+        # Last encoded brick field and RNG state as (source, version, bytes),
+        # shared by snapshots while unchanged
+        self._bricks_blob: Optional[Tuple[BrickGrid, int, bytes]] = None
+        self._rng_blob: Optional[Tuple['GameRandom', int, bytes]] = None
+
+    def flush_removals(self) -> None:
+        """Apply the entity removals deferred during an update phase"""
+        self.balls.flush()
+        self.power_ups.flush()
+        self.lasers.flush()
+        self.enemies.flush()
+        self.bombs.flush()
+
     def reset_for_new_life(self) -> None:
         """Reset entities for new life after ball loss"""
         self.paddle = Paddle()
-        self.balls = [Ball()]
+        self.balls.clear()
+        self.balls.append(Ball())
 
     def reset_for_next_level(self) -> None:
         """Reset entities for next level"""
         self.paddle = Paddle()
-        self.balls = [Ball()]
+        self.balls.clear()
+        self.balls.append(Ball())
         self.power_ups.clear()
         self.lasers.clear()
         self.enemies.clear()
@@ -60,7 +94,8 @@ class GameState:
         self.is_paused = False
 
         self.paddle = Paddle()
-        self.balls = [Ball()]
+        self.balls.clear()
+        self.balls.append(Ball())
         self.bricks.clear()
         self.power_ups.clear()
         self.lasers.clear()
@@ -75,9 +110,9 @@ class GameState:
         """Check if current stage is cleared
 
         Returns:
-            True if no bricks and no boss remain
+            True if no destructible bricks and no boss remain
         """
-        return len(self.bricks) == 0 and self.boss is None
+        return self.bricks.is_clear() and self.boss is None
 
     def has_balls(self) -> bool:
         """Check if any balls remain in play
@@ -111,6 +146,93 @@ class GameState:
         """
         return self.lives <= 0
 
+    def digest(self) -> str:
+        """Hash the full simulation state (for determinism checks)
+
+        Returns:
+            Hex digest that is equal only for bit-identical states
+        """
+        paddle = self.paddle
+        parts = [
+            (self.level, self.score, self.lives, self.is_paused,
+             self.enemy_spawn_timer, self.bomb_spawn_timer),
+            (tuple(paddle.rect), paddle.laser_active, paddle.catch_active),
+            [(float(ball.pos_x), float(ball.pos_y), tuple(ball.rect),
+              float(ball.dx), float(ball.dy), ball.is_caught)
+             for ball in self.balls],
+            [(tuple(brick.rect), brick.type.value, brick.hits) for brick in self.bricks],
+            [(tuple(powerup.rect), powerup.type.value) for powerup in self.power_ups],
+            [tuple(laser.rect) for laser in self.lasers],
+            [tuple(enemy.rect) for enemy in self.enemies],
+            [tuple(bomb.rect) for bomb in self.bombs],
+            (tuple(self.boss.rect), self.boss.hp) if self.boss else None,
+        ]
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def snapshot(
+        self,
+        powerup_manager: Optional['PowerUpManager'] = None,
+        rng: Optional['GameRandom'] = None
+    ) -> Snapshot:
+        """Capture an immutable checkpoint of the simulation
+
+        The brick field and RNG state are re-encoded only when they changed
+        since the previous snapshot; otherwise the same bytes are shared.
+
+        Args:
+            powerup_manager: Include its active power-up timers
+            rng: Include its generator state
+
+        Returns:
+            Snapshot for restore()
+        """
+        timers = powerup_manager.active_timers if powerup_manager else {}
+        core = encode_core(self, timers)
+
+        cached = self._bricks_blob
+        if cached is None or cached[0] is not self.bricks or cached[1] != self.bricks.version:
+            cached = (self.bricks, self.bricks.version, encode_bricks(self.bricks))
+            self._bricks_blob = cached
+
+        rng_bytes = b''
+        if rng is not None:
+            cached_rng = self._rng_blob
+            if cached_rng is None or cached_rng[0] is not rng or cached_rng[1] != rng.version:
+                cached_rng = (rng, rng.version, encode_rng(rng.getstate()))
+                self._rng_blob = cached_rng
+            rng_bytes = cached_rng[2]
+
+        return Snapshot(core, cached[2], rng_bytes)
+
+    def restore(
+        self,
+        snapshot: Snapshot,
+        powerup_manager: Optional['PowerUpManager'] = None,
+        rng: Optional['GameRandom'] = None
+    ) -> None:
+        """Return the simulation to a checkpoint
+
+        The brick grid is kept as is when it still matches the snapshot,
+        otherwise a new grid is built.
+
+        Args:
+            snapshot: Checkpoint from snapshot()
+            powerup_manager: Restore its active power-up timers
+            rng: Restore its generator state
+        """
+        timers = powerup_manager.active_timers if powerup_manager else {}
+        decode_core(snapshot.core, self, timers)
+
+        cached = self._bricks_blob
+        if cached is None or cached[0] is not self.bricks \
+                or cached[1] != self.bricks.version or cached[2] is not snapshot.bricks:
+            self.bricks = decode_bricks(snapshot.bricks)
+            self._bricks_blob = (self.bricks, self.bricks.version, snapshot.bricks)
+
+        if rng is not None and snapshot.rng:
+            rng.setstate(decode_rng(snapshot.rng, rng.STREAMS))
+            self._rng_blob = (rng, rng.version, snapshot.rng)
+
     def toggle_pause(self) -> None:
         """Toggle pause state"""
         self.is_paused = not self.is_paused
@@ -0,0 +1,110 @@
+"""Compiled binary level format
+
+A compiled level is a fixed header followed by one type byte per grid
+cell, row-major:
+
+    magic 'VCLV', format version, rows, cols (LEVEL_HEADER)
+    rows * cols bytes: 0 = empty, otherwise BRICK_CODES index
+
+CompiledLevel.from_buffer() reads it without copying the cells, so levels
+can be served straight from a memory-mapped file.
+"""
+import struct
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from src.entities.brick import Brick
+from src.constants import BRICK_WIDTH, BRICK_HEIGHT, BRICK_OFFSET_Y, BrickType
+
+
+LEVEL_FORMAT_VERSION = 1
+LEVEL_MAGIC = b'VCLV'
+LEVEL_HEADER = struct.Struct('<4sBHH')    # magic, version, rows, cols
+
+# Layout character -> brick type
+BRICK_CHARS: Dict[str, BrickType] = {brick_type.value: brick_type for brick_type in BrickType}
+
+# Cell byte -> brick type (0 = empty)
+BRICK_CODES: Tuple[Optional[BrickType], ...] = (None,) + tuple(BrickType)
+
+# Byte translation table from layout characters to cell bytes (unknown = empty)
+_CELL_TABLE = bytes(
+    BRICK_CODES.index(BRICK_CHARS[chr(byte)]) if chr(byte) in BRICK_CHARS else 0
+    for byte in range(256)
+)
+
+
+class CompiledLevel(NamedTuple):
+    """Brick layout as a rows x cols grid of type bytes"""
+
+    rows: int
+    cols: int
+    cells: Union[bytes, memoryview]
+
+    def to_bytes(self) -> bytes:
+        """Serialize with header
+
+        Returns:
+            Level bytes
+        """
+        return LEVEL_HEADER.pack(LEVEL_MAGIC, LEVEL_FORMAT_VERSION, self.rows, self.cols) \
+            + bytes(self.cells)
+
+    @classmethod
+    def from_buffer(cls, buffer, offset: int = 0) -> 'CompiledLevel':
+        """Read a level written by to_bytes() without copying the cells
+
+        Args:
+            buffer: bytes, bytearray, mmap or other buffer
+            offset: Byte offset of the level header
+
+        Returns:
+            CompiledLevel whose cells are a view into buffer
+
+        Raises:
+            ValueError: If the data is not a supported compiled level
+        """
+        view = memoryview(buffer)
+        if len(view) < offset + LEVEL_HEADER.size:
+            raise ValueError("Compiled level is truncated")
+        magic, version, rows, cols = LEVEL_HEADER.unpack_from(view, offset)
+        if magic != LEVEL_MAGIC or version != LEVEL_FORMAT_VERSION:
+            raise ValueError("Not a supported compiled level")
+        start = offset + LEVEL_HEADER.size
+        if len(view) < start + rows * cols:
+            raise ValueError("Compiled level is truncated")
+        return cls(rows, cols, view[start:start + rows * cols])
+
+    def bricks(self) -> List[Brick]:
+        """Build fresh bricks for play
+
+        Returns:
+            Bricks in row-major order
+        """
+        bricks = []
+        cols = self.cols
+        for index, code in enumerate(self.cells):
+            if code:
+                row, col = divmod(index, cols)
+                bricks.append(Brick(
+                    col * BRICK_WIDTH, row * BRICK_HEIGHT + BRICK_OFFSET_Y, BRICK_CODES[code]
+                ))
+        return bricks
+
+
+def compile_layout(layout: Sequence[str]) -> CompiledLevel:
+    """Compile a string layout from data/levels.py
+
+    Rows shorter than the widest one are padded with empty cells.
+
+    Args:
+        layout: Level rows
+
+    Returns:
+        Compiled level
+    """
+    rows = len(layout)
+    cols = max((len(row) for row in layout), default=0)
+    cells = bytearray(rows * cols)
+    for row_index, row in enumerate(layout):
+        start = row_index * cols
+        cells[start:start + len(row)] = row.encode('ascii', 'replace').translate(_CELL_TABLE)
+    return CompiledLevel(rows, cols, bytes(cells))
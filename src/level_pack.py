@@ -0,0 +1,171 @@
+"""Level packs: many compiled levels in one indexed file
+
+Layout (little-endian):
+    header  magic 'VCLP', format version, level count, index offset,
+            CRC32 of all level records (PACK_HEADER)
+    levels  CompiledLevel.to_bytes() records, back to back
+    index   level count + 1 uint64 file offsets (the last one is the end
+            of the level records)
+
+Usage:
+    python -m src.level_pack levels.vclp --module data.levels
+
+A LevelPack only keeps the header and the index in memory and reads
+levels from disk on demand, so it can stand in for the LEVELS list with
+packs of any size (see LevelManager for caching and prefetch).
+"""
+import argparse
+import importlib
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from typing import Iterable, Sequence, Union
+from src.level_format import CompiledLevel, compile_layout
+
+
+PACK_FORMAT_VERSION = 1
+PACK_MAGIC = b'VCLP'
+PACK_HEADER = struct.Struct('<4sBIQI')    # magic, version, level count, index offset, CRC32
+OFFSET_SIZE = 8
+
+
+def _offsets_to_bytes(offsets: array) -> bytes:
+    """Encode index offsets as little-endian uint64"""
+    if sys.byteorder == 'big':
+        offsets = array('Q', offsets)
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def write_level_pack(
+    path: str,
+    levels: Iterable[Union[Sequence[str], CompiledLevel]]
+) -> int:
+    """Compile levels into a pack file, streaming them to disk
+
+    Args:
+        path: Output file
+        levels: String layouts or compiled levels (any iterable)
+
+    Returns:
+        Number of levels written
+    """
+    offsets = array('Q')
+    checksum = 0
+    with open(path, 'wb') as pack_file:
+        pack_file.write(PACK_HEADER.pack(PACK_MAGIC, PACK_FORMAT_VERSION, 0, 0, 0))
+        for level in levels:
+            if not isinstance(level, CompiledLevel):
+                level = compile_layout(level)
+            data = level.to_bytes()
+            offsets.append(pack_file.tell())
+            pack_file.write(data)
+            checksum = zlib.crc32(data, checksum)
+        offsets.append(pack_file.tell())
+
+        index_offset = pack_file.tell()
+        pack_file.write(_offsets_to_bytes(offsets))
+        pack_file.seek(0)
+        pack_file.write(PACK_HEADER.pack(
+            PACK_MAGIC, PACK_FORMAT_VERSION, len(offsets) - 1, index_offset, checksum
+        ))
+    return len(offsets) - 1
+
+
+class LevelPack:
+    """Read-only level pack, usable wherever a level list is expected
+
+    Indexing returns a CompiledLevel read from disk. Reads are serialized
+    by a lock, so a prefetch thread can share the pack with the game.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open pack and read its index
+
+        Args:
+            path: Pack file
+
+        Raises:
+            ValueError: If the file is not a supported level pack
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        self._lock = threading.Lock()
+        try:
+            header = self._file.read(PACK_HEADER.size)
+            if len(header) < PACK_HEADER.size:
+                raise ValueError("Level pack is truncated")
+            magic, version, count, index_offset, self.checksum = PACK_HEADER.unpack(header)
+            if magic != PACK_MAGIC or version != PACK_FORMAT_VERSION:
+                raise ValueError("Not a supported level pack")
+
+            self._file.seek(index_offset)
+            index = self._file.read((count + 1) * OFFSET_SIZE)
+            if len(index) != (count + 1) * OFFSET_SIZE:
+                raise ValueError("Level pack is truncated")
+            self._offsets = array('Q')
+            self._offsets.frombytes(index)
+            if sys.byteorder == 'big':
+                self._offsets.byteswap()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> CompiledLevel:
+        """Read one level from disk
+
+        Args:
+            index: Level index
+
+        Returns:
+            Compiled level
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Level pack index out of range")
+        start = self._offsets[index]
+        with self._lock:
+            self._file.seek(start)
+            data = self._file.read(self._offsets[index + 1] - start)
+        return CompiledLevel.from_buffer(data)
+
+    def close(self) -> None:
+        """Close the pack file"""
+        self._file.close()
+
+    def __enter__(self) -> 'LevelPack':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main() -> int:
+    """Build a level pack from a module's LEVELS list
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Build a VC-Arkanoid level pack")
+    parser.add_argument("output", help="Pack file to write")
+    parser.add_argument("--module", default="data.levels",
+                        help="Python module defining LEVELS (default: data.levels)")
+    args = parser.parse_args()
+
+    levels = importlib.import_module(args.module).LEVELS
+    count = write_level_pack(args.output, levels)
+    print(f"Wrote {count} levels to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 """Collision detection and handling"""
-from typing import List, Optional
+import math
+import pygame
+from typing import Iterable, List, Optional, Tuple
 from src.entities.ball import Ball
 from src.entities.paddle import Paddle
 from src.entities.brick import Brick
@@ -8,6 +10,16 @@ from src.entities.enemy import Enemy
 from src.entities.boss import Boss
 from src.entities.laser import Laser
 from src.entities.bomb import Bomb
+from src.brick_grid import BrickGrid
+from src.constants import BALL_SWEEP_MAX_CONTACTS
+
+
+# Time of impact and contact normal: (t, normal_x, normal_y)
+Contact = Tuple[float, float, float]
+
+# Penetration (px) a ball must have into a brick at the start of a sweep to
+# count as embedded, so rounding of touching positions is not a new hit
+EMBED_TOLERANCE: float = 1.0
 
 
 class CollisionManager:
@@ -16,32 +28,244 @@ class CollisionManager:
     @staticmethod
     def check_ball_brick_collision(
         ball: Ball,
-        bricks: List[Brick]
+        bricks: BrickGrid
     ) -> Optional[Brick]:
         """Check if ball collides with any brick
 
         Args:
             ball: Ball object
-            bricks: List of brick objects
+            bricks: Brick grid
 
         Returns:
             Collided brick or None
         """
-        for brick in bricks:
-            if ball.rect.colliderect(brick.rect):
-                return brick
+        return bricks.first_overlapping(ball.rect)
+
+    @staticmethod
+    def sweep_ball(
+        ball: Ball,
+        bricks: BrickGrid,
+        paddle: Optional[Paddle] = None,
+        max_contacts: int = BALL_SWEEP_MAX_CONTACTS
+    ) -> Tuple[List[Brick], bool]:
+        """Move ball for one tick, resolving contacts in time-of-impact order
+
+        The ball is swept as a circle along its velocity. The earliest brick
+        or paddle contact on the segment is found, the ball is advanced to it
+        and reflected on the face (or rounded corner) it struck, and the
+        remaining motion is swept again, up to max_contacts times.
+
+        Speeds are pixels per tick, so this is what allows faster balls:
+        raising the BALL_* speeds no longer lets the ball tunnel through
+        bricks or the paddle. Lowering TICK_RATE (or game_speed) on its own
+        slows the whole game down; to keep the same pace at fewer ticks the
+        per-tick speeds have to be raised by the same factor, which the
+        sweep keeps correct.
+
+        Args:
+            ball: Ball to move
+            bricks: Brick grid
+            paddle: Paddle to sweep against while the ball is falling
+            max_contacts: Contacts to resolve before dropping leftover motion
+
+        Returns:
+            (bricks hit in order without duplicates, True if paddle was hit)
+        """
+        hit_bricks: List[Brick] = []
+        hit_paddle = False
+        if ball.is_caught:
+            return hit_bricks, hit_paddle
+
+        x, y = ball.get_center()
+        radius = ball.rect.width / 2
+        remaining = 1.0
+
+        for contact_index in range(max_contacts + 1):
+            dx = ball.dx * remaining
+            dy = ball.dy * remaining
+
+            # Broad phase: bricks under the swept bounds
+            sweep_rect = pygame.Rect(
+                math.floor(min(x, x + dx) - radius) - 1,
+                math.floor(min(y, y + dy) - radius) - 1,
+                math.ceil(abs(dx) + radius * 2) + 3,
+                math.ceil(abs(dy) + radius * 2) + 3
+            )
+
+            best: Optional[Contact] = None
+            best_brick: Optional[Brick] = None
+            for brick in bricks.query(sweep_rect):
+                contact = CollisionManager._sweep_circle_rect(
+                    x, y, radius, dx, dy, brick.rect
+                )
+                if contact is None and brick not in hit_bricks:
+                    contact = CollisionManager._embedded_contact(
+                        x, y, radius, dy, brick.rect
+                    )
+                if contact and (best is None or contact[0] < best[0]):
+                    best = contact
+                    best_brick = brick
+
+            if paddle and ball.dy > 0 and sweep_rect.colliderect(paddle.rect):
+                contact = CollisionManager._sweep_circle_rect(
+                    x, y, radius, dx, dy, paddle.rect
+                )
+                if contact and (best is None or contact[0] < best[0]):
+                    best = contact
+                    best_brick = None
+
+            if best is None or contact_index == max_contacts:
+                if best is None:
+                    x += dx
+                    y += dy
+                break
+
+            t, normal_x, normal_y = best
+            x += dx * t
+            y += dy * t
+            remaining *= 1.0 - t
+
+            if best_brick is None:
+                # Paddle decides the new direction from the hit position
+                ball.set_center(x, y)
+                ball.deflect_from_paddle(paddle)
+                hit_paddle = True
+                if ball.is_caught:
+                    return hit_bricks, hit_paddle
+                continue
+
+            dot = ball.dx * normal_x + ball.dy * normal_y
+            if dot < 0:
+                ball.dx -= 2 * dot * normal_x
+                ball.dy -= 2 * dot * normal_y
+            if best_brick not in hit_bricks:
+                hit_bricks.append(best_brick)
+
+        ball.set_center(x, y)
+        return hit_bricks, hit_paddle
+
+    @staticmethod
+    def _sweep_circle_rect(
+        x: float,
+        y: float,
+        radius: float,
+        dx: float,
+        dy: float,
+        rect: pygame.Rect
+    ) -> Optional[Contact]:
+        """Find first contact of a moving circle with a rect
+
+        Args:
+            x: Circle center X at t=0
+            y: Circle center Y at t=0
+            radius: Circle radius
+            dx: X displacement over the segment
+            dy: Y displacement over the segment
+            rect: Static rect
+
+        Returns:
+            Contact with t in [0, 1], or None if no entering contact
+        """
+        left = rect.left - radius
+        right = rect.right + radius
+        top = rect.top - radius
+        bottom = rect.bottom + radius
+
+        # Slab test against the rect expanded by the radius
+        if dx > 0:
+            tx_enter, tx_exit, face_x = (left - x) / dx, (right - x) / dx, -1.0
+        elif dx < 0:
+            tx_enter, tx_exit, face_x = (right - x) / dx, (left - x) / dx, 1.0
+        elif left < x < right:
+            tx_enter, tx_exit, face_x = -math.inf, math.inf, 0.0
+        else:
+            return None
+
+        if dy > 0:
+            ty_enter, ty_exit, face_y = (top - y) / dy, (bottom - y) / dy, -1.0
+        elif dy < 0:
+            ty_enter, ty_exit, face_y = (bottom - y) / dy, (top - y) / dy, 1.0
+        elif top < y < bottom:
+            ty_enter, ty_exit, face_y = -math.inf, math.inf, 0.0
+        else:
+            return None
+
+        t_enter = max(tx_enter, ty_enter)
+        t_exit = min(tx_exit, ty_exit)
+        if t_enter > t_exit or t_enter > 1.0 or t_enter < 0.0:
+            return None
+
+        hit_x = x + dx * t_enter
+        hit_y = y + dy * t_enter
+
+        # Entry point beside a corner: test the rounded corner instead
+        corner_x = None
+        if hit_x < rect.left:
+            corner_x = rect.left
+        elif hit_x > rect.right:
+            corner_x = rect.right
+        corner_y = None
+        if hit_y < rect.top:
+            corner_y = rect.top
+        elif hit_y > rect.bottom:
+            corner_y = rect.bottom
+
+        if corner_x is not None and corner_y is not None:
+            offset_x = x - corner_x
+            offset_y = y - corner_y
+            a = dx * dx + dy * dy
+            b = 2 * (offset_x * dx + offset_y * dy)
+            c = offset_x * offset_x + offset_y * offset_y - radius * radius
+            discriminant = b * b - 4 * a * c
+            if discriminant < 0:
+                return None
+            t = (-b - math.sqrt(discriminant)) / (2 * a)
+            if t < 0.0 or t > 1.0:
+                return None
+            normal_x = (offset_x + dx * t) / radius
+            normal_y = (offset_y + dy * t) / radius
+            return t, normal_x, normal_y
+
+        if tx_enter > ty_enter:
+            return t_enter, face_x, 0.0
+        return t_enter, 0.0, face_y
+
+    @staticmethod
+    def _embedded_contact(
+        x: float,
+        y: float,
+        radius: float,
+        dy: float,
+        rect: pygame.Rect
+    ) -> Optional[Contact]:
+        """Contact for a ball that starts the sweep already inside a brick
+
+        Args:
+            x: Circle center X
+            y: Circle center Y
+            radius: Circle radius
+            dy: Y displacement (legacy response reverses vertical motion)
+            rect: Brick rect
+
+        Returns:
+            Contact at t=0, or None if not embedded
+        """
+        margin = radius - EMBED_TOLERANCE
+        if (rect.left - margin < x < rect.right + margin
+                and rect.top - margin < y < rect.bottom + margin):
+            return 0.0, 0.0, -1.0 if dy > 0 else 1.0
         return None
 
     @staticmethod
     def check_ball_enemy_collision(
         ball: Ball,
-        enemies: List[Enemy]
+        enemies: Iterable[Enemy]
     ) -> Optional[Enemy]:
         """Check if ball collides with any enemy
 
         Args:
             ball: Ball object
-            enemies: List of enemy objects
+            enemies: Active enemies
 
         Returns:
             Collided enemy or None
@@ -88,32 +312,29 @@ class CollisionManager:
     @staticmethod
     def check_laser_brick_collision(
         laser: Laser,
-        bricks: List[Brick]
+        bricks: BrickGrid
     ) -> Optional[Brick]:
         """Check if laser collides with any brick
 
         Args:
             laser: Laser object
-            bricks: List of brick objects
+            bricks: Brick grid
 
         Returns:
             Collided brick or None
         """
-        for brick in bricks:
-            if laser.rect.colliderect(brick.rect):
-                return brick
-        return None
+        return bricks.first_overlapping(laser.rect)
 
     @staticmethod
     def check_laser_enemy_collision(
         laser: Laser,
-        enemies: List[Enemy]
+        enemies: Iterable[Enemy]
     ) -> Optional[Enemy]:
         """Check if laser collides with any enemy
 
         Args:
             laser: Laser object
-            enemies: List of enemy objects
+            enemies: Active enemies
 
         Returns:
             Collided enemy or None
@@ -0,0 +1,160 @@
+"""Player input sampling"""
+import pygame
+import random
+from collections import deque
+from typing import Deque, Iterable, Optional
+
+
+class InputFrame:
+    """Player input sampled for a single simulation tick"""
+
+    def __init__(
+        self,
+        paddle_x: Optional[int] = None,
+        move_left: bool = False,
+        move_right: bool = False,
+        fire: bool = False,
+        pause: bool = False,
+        quit: bool = False
+    ) -> None:
+        """Initialize input frame
+
+        Args:
+            paddle_x: Target paddle center X (None keeps current position)
+            move_left: Left key held
+            move_right: Right key held
+            fire: Fire/release button pressed this tick
+            pause: Pause toggle pressed this tick
+            quit: Window close requested
+        """
+        self.paddle_x = paddle_x
+        self.move_left = move_left
+        self.move_right = move_right
+        self.fire = fire
+        self.pause = pause
+        self.quit = quit
+
+
+class InputManager:
+    """Samples player input from pygame mouse, keyboard and event queue"""
+
+    def on_reset(self, seed: int) -> None:
+        """Notify input source that a new game started
+
+        Args:
+            seed: Seed of the new game
+        """
+        return None
+
+    def poll(self) -> InputFrame:
+        """Sample input for the next tick
+
+        Returns:
+            InputFrame describing this tick's input
+        """
+        frame = InputFrame()
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                frame.quit = True
+
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
+                    frame.pause = True
+
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                frame.fire = True
+
+        # Primary control: Mouse
+        frame.paddle_x = pygame.mouse.get_pos()[0]
+
+        # Secondary control: Keyboard
+        keys = pygame.key.get_pressed()
+        frame.move_left = bool(keys[pygame.K_LEFT])
+        frame.move_right = bool(keys[pygame.K_RIGHT])
+
+        return frame
+
+
+class ScriptedInputManager(InputManager):
+    """Feeds pre-built input frames to the engine (headless runs)"""
+
+    def __init__(self, frames: Optional[Iterable[InputFrame]] = None) -> None:
+        """Initialize scripted input
+
+        Args:
+            frames: Initial queue of input frames
+        """
+        self.frames: Deque[InputFrame] = deque(frames or ())
+        self._idle = InputFrame()
+
+    def push(self, frame: InputFrame) -> None:
+        """Queue input for a future tick
+
+        Args:
+            frame: Input frame to queue
+        """
+        self.frames.append(frame)
+
+    def poll(self) -> InputFrame:
+        """Return next queued frame, or idle input when queue is empty
+
+        Returns:
+            InputFrame for this tick
+        """
+        if self.frames:
+            return self.frames.popleft()
+        return self._idle
+
+
+class AutopilotInput(ScriptedInputManager):
+    """Computer player that keeps the paddle under the lowest ball
+
+    Set engine after constructing the GameEngine. With jitter the paddle
+    aims a random distance beside the ball, so returns leave the paddle at
+    varied angles instead of settling into a vertical loop.
+    """
+
+    def __init__(
+        self,
+        fire_interval: int = 0,
+        jitter: int = 0,
+        jitter_interval: int = 30,
+        seed: Optional[int] = None
+    ) -> None:
+        """Initialize autopilot
+
+        Args:
+            fire_interval: Click every N ticks (0 never clicks)
+            jitter: Max aim offset from the ball center in pixels
+            jitter_interval: Ticks between new aim offsets
+            seed: Seed for the aim offsets
+        """
+        super().__init__()
+        self.engine: 'GameEngine' = None
+        self.fire_interval = fire_interval
+        self.jitter = jitter
+        self.jitter_interval = jitter_interval
+        self.tick = 0
+        self._offset = 0
+        self._random = random.Random(seed)
+
+    def poll(self) -> InputFrame:
+        """Follow the lowest ball and click on the fire interval
+
+        Returns:
+            InputFrame for this tick
+        """
+        self.tick += 1
+        if self.jitter and self.tick % self.jitter_interval == 1:
+            self._offset = self._random.randint(-self.jitter, self.jitter)
+
+        balls = self.engine.state.balls
+        if not balls:
+            paddle_x = None
+        elif self.engine.vectorized_balls:
+            paddle_x = balls[int(balls.y[:len(balls)].argmax())].rect.centerx + self._offset
+        else:
+            paddle_x = max(balls, key=lambda ball: ball.rect.bottom).rect.centerx + self._offset
+        fire = self.fire_interval > 0 and self.tick % self.fire_interval == 0
+        return InputFrame(paddle_x=paddle_x, fire=fire)
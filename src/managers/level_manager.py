@@ -1,23 +1,44 @@
 """Level management and progression"""
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
 from src.entities.brick import Brick
 from src.entities.boss import Boss
-from src.constants import (
-    BRICK_WIDTH, BRICK_HEIGHT, BrickType, BOSS_LEVEL_INDEX
-)
+from src.level_format import CompiledLevel, compile_layout
+from src.level_pack import LevelPack
+from src.constants import BOSS_LEVEL_INDEX, LEVEL_CACHE_SIZE
 
 
 class LevelManager:
-    """Manages level loading and progression"""
-
-    def __init__(self, level_data: List[List[str]]) -> None:
+    """Manages level loading and progression
+
+    Levels come from a list of string layouts or from any sequence of
+    CompiledLevel, such as a LevelPack read lazily from disk. Compiled
+    levels are kept in a bounded LRU cache; with prefetch on, loading a
+    level also starts reading the next one on a background thread.
+    """
+
+    def __init__(
+        self,
+        level_data: Sequence,
+        cache_size: int = LEVEL_CACHE_SIZE,
+        prefetch: Optional[bool] = None
+    ) -> None:
         """Initialize level manager
 
         Args:
-            level_data: List of level layouts
+            level_data: List of level layouts, or a LevelPack
+            cache_size: Compiled levels kept before least recently used are evicted
+            prefetch: Read the next level in the background after each load
+                (default: only for a LevelPack)
         """
         self.level_data = level_data
         self.current_level: int = 0
+        self.cache_size = cache_size
+        self.prefetch_next = isinstance(level_data, LevelPack) if prefetch is None else prefetch
+        self._compiled: 'OrderedDict[int, CompiledLevel]' = OrderedDict()
+        self._pending: Dict[int, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def load_level(self, level_index: int) -> List[Brick]:
         """Load bricks for specified level
@@ -28,40 +49,75 @@ class LevelManager:
         Returns:
             List of brick objects
         """
-        bricks = []
-
         if level_index >= len(self.level_data):
-            return bricks
+            return []
+        bricks = self.get_compiled_level(level_index).bricks()
+        if self.prefetch_next:
+            self.prefetch(level_index + 1)
+        return bricks
 
-        layout = self.level_data[level_index]
+    def get_compiled_level(self, level_index: int) -> CompiledLevel:
+        """Get compiled layout, reading or compiling it on cache miss
 
-        for row_index, row in enumerate(layout):
-            for col_index, brick_char in enumerate(row):
-                if brick_char != ' ':
-                    brick_type = self._char_to_brick_type(brick_char)
-                    if brick_type:
-                        x = col_index * BRICK_WIDTH
-                        y = row_index * BRICK_HEIGHT + 50
-                        brick = Brick(x, y, brick_type)
-                        bricks.append(brick)
+        Args:
+            level_index: Index of level
 
-        return bricks
+        Returns:
+            Compiled level
+        """
+        compiled = self._compiled.get(level_index)
+        if compiled is not None:
+            self._compiled.move_to_end(level_index)
+            return compiled
+
+        future = self._pending.pop(level_index, None)
+        compiled = future.result() if future is not None else self._read_level(level_index)
+        self._compiled[level_index] = compiled
+        if len(self._compiled) > self.cache_size:
+            self._compiled.popitem(last=False)
+        return compiled
+
+    def prefetch(self, level_index: int) -> None:
+        """Start reading a level on the background thread
 
-    def _char_to_brick_type(self, char: str) -> Optional[BrickType]:
-        """Convert character to brick type
+        Only the latest prefetch is kept; older ones that have not started
+        are cancelled.
+
+        Args:
+            level_index: Index of level (ignored if cached or out of range)
+        """
+        if level_index in self._compiled or level_index in self._pending \
+                or not 0 <= level_index < len(self.level_data):
+            return
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='level-prefetch'
+            )
+        self._pending[level_index] = self._executor.submit(self._read_level, level_index)
+
+    def _read_level(self, level_index: int) -> CompiledLevel:
+        """Read a level from the level source (runs on any thread)
 
         Args:
-            char: Character representing brick type
+            level_index: Index of level
 
         Returns:
-            BrickType or None if invalid
+            Compiled level
         """
-        brick_map = {
-            'n': BrickType.NORMAL,
-            's': BrickType.SILVER,
-            'g': BrickType.GOLD,
-        }
-        return brick_map.get(char)
+        level = self.level_data[level_index]
+        return level if isinstance(level, CompiledLevel) else compile_layout(level)
+
+    def close(self) -> None:
+        """Stop the prefetch thread (a level being read is waited for)"""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def should_spawn_boss(self, level_index: int) -> bool:
         """Check if boss should spawn for this level
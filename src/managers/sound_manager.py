@@ -1,53 +1,146 @@
-"""Sound management for game audio"""
+"""Sound management for game audio
+
+Sounds are decoded on a background loader thread into a process-wide
+cache, so startup and game restarts never wait on disk. Gameplay only
+records which sounds a tick wants; flush() hands that set (one entry per
+sound, however many bounces happened) to the audio thread through a
+deque, whose append/popleft are atomic, so the simulation never waits on
+a lock or on the mixer. The audio thread skips sounds that are already
+playing on their voice limit.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, FrozenSet, Optional, Set
 import pygame
-from typing import Optional
 from src.constants import (
-    SOUND_BRICK_DESTROY, SOUND_POWERUP, SOUND_BOUNCE
+    SOUND_BRICK_DESTROY, SOUND_POWERUP, SOUND_BOUNCE, SOUND_VOICE_LIMITS,
+    SOUND_POLL_INTERVAL
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Project root; relative sound paths are resolved against it, not the CWD
+ASSET_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Sound name -> file
+SOUND_FILES: Dict[str, str] = {
+    'brick_destroy': SOUND_BRICK_DESTROY,
+    'powerup': SOUND_POWERUP,
+    'bounce': SOUND_BOUNCE,
+}
+
+# Decoded sounds by absolute path (None = failed to load), shared by all
+# SoundManagers of the process
+_decoded: Dict[str, Optional[pygame.mixer.Sound]] = {}
+_decoded_lock = threading.Lock()
+
+
+def load_sound(path: str) -> Optional[pygame.mixer.Sound]:
+    """Decode a sound file once per process
+
+    Args:
+        path: Sound file, relative to the project root or absolute
+
+    Returns:
+        Sound object or None if loading failed (logged once)
+    """
+    path = os.path.join(ASSET_ROOT, path)
+    with _decoded_lock:
+        if path in _decoded:
+            return _decoded[path]
+    try:
+        sound = pygame.mixer.Sound(path)
+    except (pygame.error, FileNotFoundError) as e:
+        logger.warning("Cannot load sound %s: %s", path, e)
+        sound = None
+    with _decoded_lock:
+        return _decoded.setdefault(path, sound)
+
+
 class SoundManager:
     """Manages loading and playing game sounds"""
 
     def __init__(self) -> None:
-        """Initialize sound system and load sound files"""
+        """Initialize mixer and start the loader/playback thread"""
         pygame.mixer.init()
-        self.brick_destroy: Optional[pygame.mixer.Sound] = self._load_sound(SOUND_BRICK_DESTROY)
-        self.powerup: Optional[pygame.mixer.Sound] = self._load_sound(SOUND_POWERUP)
-        self.bounce: Optional[pygame.mixer.Sound] = self._load_sound(SOUND_BOUNCE)
+        self.sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
+        self._requested: Set[str] = set()
+        self._queue: Deque[FrozenSet[str]] = deque()
+        self._running = True
+        self._thread = threading.Thread(target=self._audio_loop, name='audio', daemon=True)
+        self._thread.start()
 
-    def _load_sound(self, path: str) -> Optional[pygame.mixer.Sound]:
-        """Load sound file with error handling
+    def _audio_loop(self) -> None:
+        """Audio thread: decode all sounds, then play queued requests"""
+        for name, path in SOUND_FILES.items():
+            self.sounds[name] = load_sound(path)
 
-        Args:
-            path: Path to sound file
-
-        Returns:
-            Sound object or None if loading failed
-        """
-        try:
-            return pygame.mixer.Sound(path)
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"Cannot load sound: {path} - {e}")
-            return None
+        queue = self._queue
+        while self._running:
+            if not queue:
+                time.sleep(SOUND_POLL_INTERVAL)
+                continue
+            for name in queue.popleft():
+                sound = self.sounds.get(name)
+                if sound is not None and \
+                        sound.get_num_channels() < SOUND_VOICE_LIMITS.get(name, 1):
+                    sound.play()
 
-    def play(self, sound: Optional[pygame.mixer.Sound]) -> None:
-        """Play sound if available
+    def play(self, name: str) -> None:
+        """Request a sound for the current tick
 
         Args:
-            sound: Sound object to play
+            name: Key of SOUND_FILES
         """
-        if sound:
-            sound.play()
+        self._requested.add(name)
+
+    def flush(self) -> None:
+        """Send this tick's sound requests to the audio thread"""
+        if self._requested:
+            self._queue.append(frozenset(self._requested))
+            self._requested.clear()
+
+    def close(self) -> None:
+        """Stop the audio thread"""
+        self._running = False
+        self._thread.join()
 
     def play_brick_destroy(self) -> None:
         """Play brick destruction sound"""
-        self.play(self.brick_destroy)
+        self.play('brick_destroy')
 
     def play_powerup(self) -> None:
         """Play power-up collection sound"""
-        self.play(self.powerup)
+        self.play('powerup')
 
     def play_bounce(self) -> None:
         """Play bounce sound"""
-        self.play(self.bounce)
+        self.play('bounce')
+
+
+class NullSoundManager(SoundManager):
+    """Silent sound manager for headless runs (no mixer initialization)"""
+
+    def __init__(self) -> None:
+        """Initialize without touching the audio device"""
+        self.sounds = {}
+
+    def play(self, name: str) -> None:
+        """Discard playback request
+
+        Args:
+            name: Ignored
+        """
+        return None
+
+    def flush(self) -> None:
+        """Nothing to send"""
+        return None
+
+    def close(self) -> None:
+        """No thread to stop"""
+        return None
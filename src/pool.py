@@ -0,0 +1,192 @@
+"""Entity containers with O(1) removal and preallocated pools"""
+from typing import Callable, Dict, Generic, Iterator, List, TypeVar
+
+
+T = TypeVar('T')
+
+
+class EntityList(Generic[T]):
+    """Unordered entity container with O(1) and deferred removal
+
+    Each entity stores its slot in pool_index, so remove() swaps the last
+    entity into the freed slot instead of scanning the list. discard()
+    only leaves a hole (None) in the slot and queues the entity; holes are
+    skipped by iteration and filled by flush(), so update loops can iterate
+    the container directly and discard entities (the current one or any
+    other) without copying it first. Call flush() at the end of the phase.
+
+    Iterates, indexes and sizes like a list of the live entities (indexing
+    is only meaningful after flush()).
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty container"""
+        self.active: List[T] = []
+        self._discarded: List[T] = []
+
+    def __len__(self) -> int:
+        return len(self.active) - len(self._discarded)
+
+    def __iter__(self) -> Iterator[T]:
+        # Entities are always truthy, so filter(None) only drops the holes
+        return filter(None, self.active)
+
+    def __getitem__(self, index):
+        return self.active[index]
+
+    def append(self, entity: T) -> None:
+        """Add an entity (safe while iterating; it is visited this pass)
+
+        Args:
+            entity: Entity with a pool_index attribute
+        """
+        entity.pool_index = len(self.active)
+        self.active.append(entity)
+
+    def _check_active(self, entity: T) -> int:
+        """Get the slot of an entity in play
+
+        Raises:
+            ValueError: If entity is not in play in this container
+        """
+        index = entity.pool_index
+        if index < 0 or index >= len(self.active) or self.active[index] is not entity:
+            raise ValueError(f"{type(self).__name__}: entity not in play")
+        return index
+
+    def remove(self, entity: T) -> None:
+        """Remove an entity now (reorders; not while iterating)
+
+        Args:
+            entity: Entity in play
+
+        Raises:
+            ValueError: If entity is not in play in this container
+        """
+        index = self._check_active(entity)
+        last = self.active.pop()
+        if last is not entity:
+            self.active[index] = last
+            last.pool_index = index
+        entity.pool_index = -1
+        self._recycle(entity)
+
+    def discard(self, entity: T) -> None:
+        """Take an entity out of play at the next flush()
+
+        The entity is no longer iterated or counted from now on.
+
+        Args:
+            entity: Entity in play
+
+        Raises:
+            ValueError: If entity is not in play in this container
+        """
+        self.active[self._check_active(entity)] = None
+        self._discarded.append(entity)
+
+    def flush(self) -> None:
+        """Fill the holes left by discard() by swapping in the last entities"""
+        if not self._discarded:
+            return
+        active = self.active
+        # Highest slot first: everything behind the slot is then live
+        self._discarded.sort(key=lambda entity: entity.pool_index, reverse=True)
+        for entity in self._discarded:
+            index = entity.pool_index
+            last = active.pop()
+            if index < len(active):
+                active[index] = last
+                last.pool_index = index
+            entity.pool_index = -1
+            self._recycle(entity)
+        self._discarded.clear()
+
+    def clear(self) -> None:
+        """Remove every entity, including pending discards"""
+        for entity in self.active:
+            if entity is not None:
+                entity.pool_index = -1
+                self._recycle(entity)
+        for entity in self._discarded:
+            entity.pool_index = -1
+            self._recycle(entity)
+        self.active.clear()
+        self._discarded.clear()
+
+    def _recycle(self, entity: T) -> None:
+        """Hook called for every entity leaving the container"""
+
+
+class EntityPool(EntityList[T]):
+    """EntityList that recycles removed entities through a free list
+
+    acquire() reuses a removed instance (re-initialized through its reset()
+    method) and only calls the factory when the free list is empty, so
+    steady-state spawning allocates nothing.
+    """
+
+    def __init__(self, factory: Callable[[], T], capacity: int = 0) -> None:
+        """Initialize pool
+
+        Args:
+            factory: Creates a blank entity (needs reset() and a
+                pool_index attribute)
+            capacity: Entities to preallocate
+        """
+        super().__init__()
+        self.factory = factory
+        self._free: List[T] = [factory() for _ in range(capacity)]
+        self.created: int = capacity
+        self.reused: int = 0
+        self.peak: int = 0
+
+    def acquire(self, *args) -> T:
+        """Put an entity into play
+
+        Args:
+            *args: Passed to the entity's reset()
+
+        Returns:
+            Entity, now in the container
+        """
+        if self._free:
+            entity = self._free.pop()
+            self.reused += 1
+        else:
+            entity = self.factory()
+            self.created += 1
+        entity.reset(*args)
+        self.append(entity)
+        if len(self) > self.peak:
+            self.peak = len(self)
+        return entity
+
+    def release(self, entity: T) -> None:
+        """Take an entity out of play now and keep it for reuse
+
+        Args:
+            entity: Entity returned by acquire()
+
+        Raises:
+            ValueError: If entity is not in play in this pool
+        """
+        self.remove(entity)
+
+    def _recycle(self, entity: T) -> None:
+        self._free.append(entity)
+
+    def stats(self) -> Dict[str, int]:
+        """Get capacity statistics
+
+        Returns:
+            active, free, capacity (all instances ever created), peak
+            active count, and acquires served from the free list
+        """
+        return {
+            'active': len(self),
+            'free': len(self._free),
+            'capacity': self.created,
+            'peak': self.peak,
+            'reused': self.reused,
+        }
@@ -0,0 +1,151 @@
+"""Per-frame profiling and frame-time telemetry"""
+import json
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+from src.constants import PROFILER_WINDOW
+from src.events import EventBus
+
+
+class FrameProfiler:
+    """Times engine phases per frame and keeps rolling frame-time statistics
+
+    Phase durations are accumulated by wrappers from wrap() and folded into
+    fixed-size ring buffers by end_frame(), so memory use stays constant no
+    matter how long the game runs. Subscribed to an event bus, it also
+    counts gameplay events by type. Optionally each frame is appended to a
+    CSV or JSONL trace file.
+    """
+
+    def __init__(
+        self,
+        phases: Sequence[str],
+        window: int = PROFILER_WINDOW,
+        trace_path: Optional[str] = None
+    ) -> None:
+        """Initialize profiler
+
+        Args:
+            phases: Names of the phases that will be timed
+            window: Frames kept in the rolling buffers
+            trace_path: Write one row per frame here (.csv, otherwise JSONL)
+        """
+        self.phases: Tuple[str, ...] = tuple(phases)
+        self.window = window
+        self.frame_count: int = 0
+        self.totals_ns: Dict[str, int] = {phase: 0 for phase in self.phases}
+        self.event_counts: Dict[str, int] = {}
+
+        self._frame_ms = array('d', bytes(8 * window))
+        self._phase_ms = {phase: array('d', bytes(8 * window)) for phase in self.phases}
+        self._current_ns: Dict[str, int] = {phase: 0 for phase in self.phases}
+        self._frame_start: int = 0
+
+        self._trace: Optional[TextIO] = None
+        self._trace_csv: bool = False
+        if trace_path:
+            self._trace = open(trace_path, 'w')
+            self._trace_csv = trace_path.endswith('.csv')
+            if self._trace_csv:
+                self._trace.write(','.join(('frame', 'frame_ms') + self.phases) + '\n')
+
+    def wrap(self, phase: str, method: Callable) -> Callable:
+        """Wrap a callable so its duration is added to phase
+
+        Args:
+            phase: Phase name
+            method: Callable to time
+
+        Returns:
+            Wrapper with the same call signature
+        """
+        clock = time.perf_counter_ns
+        current = self._current_ns
+        totals = self.totals_ns
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                current[phase] += elapsed
+                totals[phase] += elapsed
+        return timed
+
+    def count_events(self, events: EventBus) -> None:
+        """Event bus subscriber adding each dispatched event to event_counts
+
+        Args:
+            events: Bus being dispatched
+        """
+        counts = self.event_counts
+        for event in events:
+            name = event.type.value
+            counts[name] = counts.get(name, 0) + 1
+
+    def begin_frame(self) -> None:
+        """Mark start of a frame"""
+        self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self) -> None:
+        """Mark end of a frame and record its timings"""
+        frame_ms = (time.perf_counter_ns() - self._frame_start) / 1e6
+        slot = self.frame_count % self.window
+        self._frame_ms[slot] = frame_ms
+        phase_ms = []
+        for phase in self.phases:
+            elapsed_ms = self._current_ns[phase] / 1e6
+            self._phase_ms[phase][slot] = elapsed_ms
+            self._current_ns[phase] = 0
+            phase_ms.append(elapsed_ms)
+        self.frame_count += 1
+
+        if self._trace:
+            if self._trace_csv:
+                self._trace.write(','.join(
+                    [str(self.frame_count), f"{frame_ms:.4f}"] + [f"{ms:.4f}" for ms in phase_ms]
+                ) + '\n')
+            else:
+                record = {'frame': self.frame_count, 'frame_ms': round(frame_ms, 4)}
+                record.update((phase, round(ms, 4)) for phase, ms in zip(self.phases, phase_ms))
+                self._trace.write(json.dumps(record) + '\n')
+
+    def percentiles(self, phase: Optional[str] = None) -> Tuple[float, float, float]:
+        """Get p50/p95/p99 over the rolling window
+
+        Args:
+            phase: Phase name (None for whole-frame time)
+
+        Returns:
+            (p50, p95, p99) in milliseconds
+        """
+        samples = self._frame_ms if phase is None else self._phase_ms[phase]
+        count = min(self.frame_count, self.window)
+        if count == 0:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(samples[:count])
+        last = count - 1
+        return (
+            ordered[round(last * 0.50)],
+            ordered[round(last * 0.95)],
+            ordered[round(last * 0.99)],
+        )
+
+    def overlay_lines(self) -> List[str]:
+        """Format current statistics for the in-game overlay
+
+        Returns:
+            Text lines, frame percentiles first, then per-phase p95
+        """
+        p50, p95, p99 = self.percentiles()
+        lines = [f"frame p50 {p50:.2f}  p95 {p95:.2f}  p99 {p99:.2f} ms"]
+        for phase in self.phases:
+            lines.append(f"{phase:<10} p95 {self.percentiles(phase)[1]:.3f} ms")
+        return lines
+
+    def close(self) -> None:
+        """Flush and close the trace file"""
+        if self._trace:
+            self._trace.close()
+            self._trace = None
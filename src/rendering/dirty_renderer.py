@@ -0,0 +1,120 @@
+"""Dirty-rectangle rendering"""
+import pygame
+from typing import List, Optional
+from src.game_state import GameState
+from src.brick_grid import BrickGrid
+from src.entities.brick import Brick
+from src.rendering.renderer import Renderer
+from src.constants import BLACK
+
+
+class DirtyRectRenderer(Renderer):
+    """Renderer that only redraws and pushes the screen areas that changed
+
+    The brick field is baked into a background surface when a level is
+    loaded. Each frame the areas covered by last frame's sprites are
+    restored from the background, sprites and HUD are drawn on top, and
+    only those rects are sent to the display. Bricks that were hit are
+    re-baked cell by cell via invalidate_brick().
+    """
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        """Initialize renderer
+
+        Args:
+            screen: Display surface to draw on
+        """
+        super().__init__(screen)
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self._baked_bricks: Optional[BrickGrid] = None
+        self._invalid_bricks: List[pygame.Rect] = []
+        self._sprite_rects: List[pygame.Rect] = []
+        self._dirty_rects: List[pygame.Rect] = []
+        self._full_update: bool = True
+
+    def invalidate_brick(self, brick: Brick) -> None:
+        """Queue a brick cell for re-baking
+
+        Args:
+            brick: Brick that was damaged or destroyed
+        """
+        self._invalid_bricks.append(brick.rect.copy())
+
+    def draw(self, state: GameState, alpha: float = 1.0) -> None:
+        """Render changed areas of the frame
+
+        Args:
+            state: Game state to render
+            alpha: Interpolation factor between previous and current tick
+        """
+        if state.bricks is not self._baked_bricks:
+            self._bake_background(state.bricks)
+
+        dirty = self._dirty_rects
+        dirty.clear()
+
+        # Re-bake damaged or destroyed bricks
+        for rect in self._invalid_bricks:
+            self._rebake_cell(state.bricks, rect)
+            dirty.append(rect)
+        self._invalid_bricks.clear()
+
+        # Restore areas covered by last frame's sprites and HUD
+        if self._full_update or state.is_paused:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self._sprite_rects:
+                self.screen.blit(self.background, rect, rect)
+            for rect in dirty:
+                self.screen.blit(self.background, rect, rect)
+            dirty.extend(self._sprite_rects)
+
+        # Draw moving entities and HUD
+        screen = self.screen
+        sprite_rects = screen.blits(self._sprite_blits(state, alpha))
+        sprite_rects.append(self.score_label.draw(screen, state.score))
+        sprite_rects.append(self.lives_label.draw(screen, state.lives))
+        sprite_rects.append(self.level_label.draw(screen, state.level + 1))
+        sprite_rects.extend(self._draw_telemetry())
+        dirty.extend(sprite_rects)
+        self._sprite_rects = sprite_rects
+
+        if state.is_paused:
+            self._draw_pause_overlay()
+            # Whole screen is covered; restore everything after unpausing
+            self._full_update = True
+        elif self._full_update:
+            self._full_update = False
+            dirty.clear()
+            dirty.append(self.screen.get_rect())
+
+    def present(self) -> None:
+        """Push changed areas to the display"""
+        if self._full_update:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._dirty_rects)
+
+    def _bake_background(self, bricks: BrickGrid) -> None:
+        """Draw the whole brick field into the background layer
+
+        Args:
+            bricks: Brick grid of the current level
+        """
+        self.background.fill(BLACK)
+        self.background.blits(self._brick_blits(bricks), False)
+        self._baked_bricks = bricks
+        self._invalid_bricks.clear()
+        self._full_update = True
+
+    def _rebake_cell(self, bricks: BrickGrid, rect: pygame.Rect) -> None:
+        """Redraw the background inside rect from the current brick field
+
+        Args:
+            bricks: Brick grid of the current level
+            rect: Area to redraw
+        """
+        self.background.set_clip(rect)
+        self.background.fill(BLACK, rect)
+        self.background.blits(self._brick_blits(bricks.query(rect)), False)
+        self.background.set_clip(None)
@@ -0,0 +1,49 @@
+"""HUD widgets"""
+import pygame
+from typing import Optional, Tuple
+from src.rendering.text_cache import TextCache, Color
+from src.constants import FONT_SIZE, WHITE
+
+
+class HudLabel:
+    """Formatted HUD value that re-renders only when the value changes"""
+
+    def __init__(
+        self,
+        template: str,
+        position: Tuple[int, int],
+        text_cache: TextCache,
+        color: Color = WHITE,
+        size: int = FONT_SIZE
+    ) -> None:
+        """Initialize label
+
+        Args:
+            template: Format string with one {} placeholder
+            position: Top-left screen position
+            text_cache: Cache providing the font
+            color: Text color
+            size: Font size
+        """
+        self.template = template
+        self.position = position
+        self.color = color
+        self.font = text_cache.get_font(size)
+        self._value: object = None
+        self._surface: Optional[pygame.Surface] = None
+
+    def draw(self, screen: pygame.Surface, value: object) -> pygame.Rect:
+        """Draw label with value
+
+        Args:
+            screen: Pygame surface to draw on
+            value: Value to display
+
+        Returns:
+            Screen area drawn
+        """
+        if self._surface is None or value != self._value:
+            self._value = value
+            self._surface = self.font.render(self.template.format(value), True, self.color)
+        return screen.blit(self._surface, self.position)
+
@@ -0,0 +1,301 @@
+"""Offscreen rendering to surfaces, NumPy arrays and frame files (requires NumPy)"""
+import os
+import numpy as np
+import pygame
+from typing import Iterable, List, Optional, Tuple, Union
+from src.game_state import GameState
+from src.rendering.renderer import Renderer, Blit
+from src.rendering.hud import HudLabel
+from src.rendering.sprite_atlas import SpriteAtlas
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_SIZE, BLACK, WHITE
+
+
+# ITU-R 601 luma weights in 8-bit fixed point (sum to 256)
+GRAY_WEIGHTS = (77, 150, 29)
+
+
+class OffscreenRenderer(Renderer):
+    """Draws game states at any resolution without a window
+
+    Sprites come from an atlas scaled to the target size and positions are
+    scaled at blit time, so small frames cost less to draw than full ones
+    instead of being downscaled from a full-size frame. At the game's own
+    resolution the output is identical to Renderer.
+
+    render() returns the RGB surface; to_array() and render_batch() return
+    uint8 arrays shaped (height, width, 3), or (height, width) luma when
+    grayscale. Arrays are always new unless out is given.
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+        grayscale: bool = False,
+        hud: bool = True
+    ) -> None:
+        """Initialize renderer
+
+        Args:
+            size: Output (width, height) in pixels
+            grayscale: Produce luma arrays instead of RGB
+            hud: Draw score, lives and level (scaled with the frame)
+        """
+        if not pygame.font.get_init():
+            pygame.font.init()
+        width, height = size
+        self.size = size
+        self.grayscale = grayscale
+        self.hud = hud
+        self.scale_x = width / SCREEN_WIDTH
+        self.scale_y = height / SCREEN_HEIGHT
+        screen = pygame.Surface(size, 0, 32)
+        super().__init__(screen, SpriteAtlas(screen, (self.scale_x, self.scale_y)))
+
+        self.font_size = max(1, round(FONT_SIZE * self.scale_y))
+        self.score_label = HudLabel("Score: {}", self._scaled((10, 10)), self.text_cache,
+                                    size=self.font_size)
+        self.lives_label = HudLabel("Lives: {}", self._scaled((SCREEN_WIDTH - 120, 10)),
+                                    self.text_cache, size=self.font_size)
+        self.level_label = HudLabel("Level: {}", self._scaled((SCREEN_WIDTH // 2 - 50, 10)),
+                                    self.text_cache, size=self.font_size)
+        self.pause_overlay = pygame.Surface(size)
+        self.pause_overlay.set_alpha(128)
+        self.pause_overlay.fill(BLACK)
+
+        self._luma = np.empty(size, dtype=np.uint16)
+        self._channel = np.empty(size, dtype=np.uint16)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of one array frame"""
+        width, height = self.size
+        return (height, width) if self.grayscale else (height, width, 3)
+
+    def _scaled(self, position) -> Tuple[int, int]:
+        """Map a game position to the output resolution"""
+        return int(position[0] * self.scale_x), int(position[1] * self.scale_y)
+
+    def _scale_blits(self, blits: List[Blit]) -> List[Blit]:
+        """Move blits built in game coordinates to the output resolution"""
+        if self.scale_x == 1.0 and self.scale_y == 1.0:
+            return blits
+        scale_x, scale_y = self.scale_x, self.scale_y
+        return [
+            (image, (int(dest[0] * scale_x), int(dest[1] * scale_y)), area)
+            for image, dest, area in blits
+        ]
+
+    def _brick_blits(self, bricks) -> List[Blit]:
+        return self._scale_blits(super()._brick_blits(bricks))
+
+    def _sprite_blits(self, state: GameState, alpha: float) -> List[Blit]:
+        return self._scale_blits(super()._sprite_blits(state, alpha))
+
+    def _draw_ui(self, state: GameState) -> None:
+        if self.hud:
+            super()._draw_ui(state)
+
+    def _draw_pause_overlay(self) -> None:
+        """Dim the frame and, with the HUD, show the pause title"""
+        self.screen.blit(self.pause_overlay, (0, 0))
+        if self.hud:
+            text = self.text_cache.render("PAUSED", WHITE, self.font_size)
+            width, height = self.size
+            self.screen.blit(text, text.get_rect(center=(width // 2, height // 2)))
+
+    def present(self) -> None:
+        """Nothing to present offscreen"""
+        return None
+
+    def render(self, state: GameState, alpha: float = 1.0) -> pygame.Surface:
+        """Draw a state
+
+        Args:
+            state: Game state to render
+            alpha: Interpolation factor between previous and current tick
+
+        Returns:
+            RGB surface, overwritten by the next call
+        """
+        self.draw(state, alpha)
+        return self.screen
+
+    def to_array(
+        self,
+        state: GameState,
+        alpha: float = 1.0,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Draw a state into an array
+
+        Args:
+            state: Game state to render
+            alpha: Interpolation factor between previous and current tick
+            out: uint8 array of self.shape to fill instead of a new one
+
+        Returns:
+            Frame array
+        """
+        if out is None:
+            out = np.empty(self.shape, dtype=np.uint8)
+        self.draw(state, alpha)
+        rgb = pygame.surfarray.pixels3d(self.screen)
+        try:
+            if self.grayscale:
+                luma, channel = self._luma, self._channel
+                red, green, blue = GRAY_WEIGHTS
+                np.multiply(rgb[..., 0], red, out=luma, dtype=np.uint16)
+                np.multiply(rgb[..., 1], green, out=channel, dtype=np.uint16)
+                luma += channel
+                np.multiply(rgb[..., 2], blue, out=channel, dtype=np.uint16)
+                luma += channel
+                luma >>= 8
+                np.copyto(out, luma.T, casting='unsafe')
+            else:
+                np.copyto(out, rgb.transpose(1, 0, 2))
+        finally:
+            del rgb  # Unlock the surface
+        return out
+
+    def render_batch(
+        self,
+        states: Iterable[GameState],
+        alpha: float = 1.0,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Draw many states into one array
+
+        Args:
+            states: Game states to render
+            alpha: Interpolation factor for every state
+            out: uint8 array shaped (len(states),) + self.shape to fill
+
+        Returns:
+            Frames stacked on the first axis
+        """
+        states = list(states)
+        if out is None:
+            out = np.empty((len(states),) + self.shape, dtype=np.uint8)
+        for index, state in enumerate(states):
+            self.to_array(state, alpha, out[index])
+        return out
+
+
+class ImageSequenceWriter:
+    """Saves frames as numbered image files"""
+
+    def __init__(self, pattern: str) -> None:
+        """Initialize writer
+
+        Args:
+            pattern: File name with a format field for the frame number,
+                e.g. 'frames/{:06d}.png' (format from the extension)
+        """
+        self.pattern = pattern
+        self.frames = 0
+        directory = os.path.dirname(pattern)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, frame: np.ndarray) -> None:
+        """Save one frame
+
+        Args:
+            frame: uint8 array shaped (height, width) or (height, width, 3)
+        """
+        if frame.ndim == 2:
+            frame = np.repeat(frame[..., np.newaxis], 3, axis=2)
+        surface = pygame.surfarray.make_surface(frame.transpose(1, 0, 2))
+        pygame.image.save(surface, self.pattern.format(self.frames))
+        self.frames += 1
+
+    def close(self) -> None:
+        """Nothing is held open"""
+        return None
+
+    def __enter__(self) -> 'ImageSequenceWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RawVideoWriter:
+    """Streams frames to a headerless raw video file
+
+    Frames are appended as they come (rgb24, or gray for 2-D frames), so
+    clips of any length are written in constant memory. Encode with the
+    command from ffmpeg_command().
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open output file
+
+        Args:
+            path: Raw video file
+        """
+        self.path = path
+        self.frames = 0
+        self.shape: Optional[Tuple[int, ...]] = None
+        self._file = open(path, 'wb')
+
+    def write(self, frame: np.ndarray) -> None:
+        """Append one frame
+
+        Args:
+            frame: uint8 array shaped (height, width) or (height, width, 3)
+
+        Raises:
+            ValueError: If the frame shape differs from the first frame
+        """
+        if self.shape is None:
+            self.shape = frame.shape
+        elif frame.shape != self.shape:
+            raise ValueError(f"Frame shape {frame.shape} differs from {self.shape}")
+        self._file.write(np.ascontiguousarray(frame, dtype=np.uint8).data)
+        self.frames += 1
+
+    def ffmpeg_command(self, fps: int, output: str = 'out.mp4') -> str:
+        """Build an ffmpeg command that encodes the file
+
+        Args:
+            fps: Frames per second of the clip
+            output: Encoded file name
+
+        Returns:
+            Shell command
+
+        Raises:
+            ValueError: If no frame was written yet
+        """
+        if self.shape is None:
+            raise ValueError("No frames written")
+        pixel_format = 'gray' if len(self.shape) == 2 else 'rgb24'
+        return (f"ffmpeg -f rawvideo -pixel_format {pixel_format} "
+                f"-video_size {self.shape[1]}x{self.shape[0]} -framerate {fps} "
+                f"-i {self.path} -pix_fmt yuv420p {output}")
+
+    def close(self) -> None:
+        """Close output file"""
+        self._file.close()
+
+    def __enter__(self) -> 'RawVideoWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_frame_writer(path: str) -> Union[ImageSequenceWriter, RawVideoWriter]:
+    """Pick a frame writer for a path
+
+    Args:
+        path: Image file pattern containing '{' (see ImageSequenceWriter),
+            otherwise a raw video file
+
+    Returns:
+        ImageSequenceWriter or RawVideoWriter
+    """
+    if '{' in path:
+        return ImageSequenceWriter(path)
+    return RawVideoWriter(path)
@@ -0,0 +1,201 @@
+"""Game state rendering"""
+import pygame
+from typing import Iterable, List, Optional, Tuple
+from src.game_state import GameState
+from src.entities.brick import Brick
+from src.rendering.text_cache import get_text_cache
+from src.rendering.hud import HudLabel
+from src.rendering.sprite_atlas import SpriteAtlas
+from src.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, GREEN, FONT_SIZE,
+    FONT_SIZE_SMALL, BALL_RADIUS, BOSS_HP_BAR_GAP
+)
+
+
+# (source, dest, area) argument of Surface.blits()
+Blit = Tuple[pygame.Surface, object, pygame.Rect]
+
+
+class Renderer:
+    """Draws the game state onto the display surface"""
+
+    def __init__(self, screen: pygame.Surface, atlas: Optional[SpriteAtlas] = None) -> None:
+        """Initialize renderer
+
+        Args:
+            screen: Surface to draw on
+            atlas: Sprites to draw with (default: built for screen)
+        """
+        self.screen: Optional[pygame.Surface] = screen
+        self.text_cache = get_text_cache()
+        self.font: Optional[pygame.font.Font] = self.text_cache.get_font(FONT_SIZE)
+        self.atlas = atlas if atlas is not None else SpriteAtlas(screen)
+
+        # HUD
+        self.score_label = HudLabel("Score: {}", (10, 10), self.text_cache)
+        self.lives_label = HudLabel("Lives: {}", (SCREEN_WIDTH - 120, 10), self.text_cache)
+        self.level_label = HudLabel("Level: {}", (SCREEN_WIDTH // 2 - 50, 10), self.text_cache)
+
+        # Pause overlay
+        self.pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.pause_overlay.set_alpha(128)
+        self.pause_overlay.fill(BLACK)
+
+        # Telemetry overlay (set by the engine while profiling)
+        self.overlay_lines: Optional[List[str]] = None
+        self._overlay_source: Optional[List[str]] = None
+        self._overlay_surfaces: List[pygame.Surface] = []
+
+    def draw(self, state: GameState, alpha: float = 1.0) -> None:
+        """Render a full frame of the game
+
+        Args:
+            state: Game state to render
+            alpha: Interpolation factor between previous and current tick
+        """
+        self.screen.fill(BLACK)
+
+        # Draw entities
+        self.screen.blits(self._brick_blits(state.bricks), False)
+        self.screen.blits(self._sprite_blits(state, alpha), False)
+
+        # Draw UI
+        self._draw_ui(state)
+        self._draw_telemetry()
+
+        # Draw pause overlay
+        if state.is_paused:
+            self._draw_pause_overlay()
+
+    def present(self) -> None:
+        """Push the rendered frame to the display"""
+        pygame.display.flip()
+
+    def invalidate_brick(self, brick: Brick) -> None:
+        """Notify renderer that a brick was damaged or destroyed
+
+        Args:
+            brick: Brick that changed
+        """
+        return None
+
+    def _brick_blits(self, bricks: Iterable[Brick]) -> List[Blit]:
+        """Build atlas blits for bricks
+
+        Args:
+            bricks: Bricks to draw
+
+        Returns:
+            Surface.blits() sequence
+        """
+        sprites = self.atlas.sprites
+        blits = []
+        for brick in bricks:
+            image, area = sprites['brick', brick.type, brick.hits > 0]
+            blits.append((image, brick.rect, area))
+        return blits
+
+    def _sprite_blits(self, state: GameState, alpha: float) -> List[Blit]:
+        """Build atlas blits for all moving entities, in drawing order
+
+        Args:
+            state: Game state to render
+            alpha: Interpolation factor between previous and current tick
+
+        Returns:
+            Surface.blits() sequence
+        """
+        sprites = self.atlas.sprites
+        paddle_rect = state.paddle.interpolated_rect(alpha)
+        image, area = sprites['paddle', paddle_rect.width]
+        blits = [(image, paddle_rect, area)]
+
+        image, area = sprites['ball']
+        for ball in state.balls:
+            x, y = ball.interpolated_center(alpha)
+            blits.append((image, (x - BALL_RADIUS, y - BALL_RADIUS), area))
+
+        for powerup in state.power_ups:
+            image, area = sprites['powerup', powerup.type]
+            blits.append((image, powerup.rect, area))
+        image, area = sprites['laser']
+        blits.extend((image, laser.rect, area) for laser in state.lasers)
+        image, area = sprites['enemy']
+        blits.extend((image, enemy.rect, area) for enemy in state.enemies)
+
+        boss = state.boss
+        if boss:
+            image, area = sprites['boss']
+            blits.append((image, boss.rect, area))
+            image, area = sprites['boss_hp', max(0, boss.hp)]
+            blits.append((image, (boss.rect.x, boss.rect.bottom + BOSS_HP_BAR_GAP), area))
+
+        image, area = sprites['bomb']
+        blits.extend((image, bomb.rect, area) for bomb in state.bombs)
+        return blits
+
+    def _draw_ui(self, state: GameState) -> None:
+        """Draw UI elements
+
+        Args:
+            state: Game state to read score, lives and level from
+        """
+        self.score_label.draw(self.screen, state.score)
+        self.lives_label.draw(self.screen, state.lives)
+        self.level_label.draw(self.screen, state.level + 1)
+
+    def _draw_telemetry(self) -> List[pygame.Rect]:
+        """Draw profiler text lines below the HUD, if any
+
+        Returns:
+            Screen areas drawn
+        """
+        if not self.overlay_lines:
+            return []
+        if self.overlay_lines is not self._overlay_source:
+            font = self.text_cache.get_font(FONT_SIZE_SMALL)
+            self._overlay_surfaces = [
+                font.render(line, True, GREEN, BLACK) for line in self.overlay_lines
+            ]
+            self._overlay_source = self.overlay_lines
+        rects = []
+        y = 40
+        for surface in self._overlay_surfaces:
+            rects.append(self.screen.blit(surface, (10, y)))
+            y += surface.get_height()
+        return rects
+
+    def _draw_pause_overlay(self) -> None:
+        """Draw pause screen overlay"""
+        self.screen.blit(self.pause_overlay, (0, 0))
+
+        pause_text = self.text_cache.render("PAUSED", WHITE)
+        text_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+        self.screen.blit(pause_text, text_rect)
+
+        hint_text = self.text_cache.render("Press P or ESC to resume", WHITE)
+        hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.screen.blit(hint_text, hint_rect)
+
+
+class NullRenderer(Renderer):
+    """Renderer that draws nothing (headless runs)"""
+
+    def __init__(self) -> None:
+        """Initialize without a display surface or fonts"""
+        self.screen = None
+        self.font = None
+        self.overlay_lines = None
+
+    def draw(self, state: GameState, alpha: float = 1.0) -> None:
+        """Skip rendering
+
+        Args:
+            state: Ignored
+            alpha: Ignored
+        """
+        return None
+
+    def present(self) -> None:
+        """Skip display update"""
+        return None
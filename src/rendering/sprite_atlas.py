@@ -0,0 +1,167 @@
+"""Pre-rendered sprite atlas"""
+import math
+import pygame
+from typing import Dict, Hashable, List, Tuple
+from src.entities.brick import BRICK_COLORS
+from src.rendering.text_cache import get_text_cache
+from src.constants import (
+    BRICK_WIDTH, BRICK_HEIGHT, BALL_RADIUS, PADDLE_WIDTH, PADDLE_HEIGHT,
+    PADDLE_ENLARGE_MULTIPLIER, POWERUP_WIDTH, POWERUP_HEIGHT, LASER_WIDTH,
+    LASER_HEIGHT, ENEMY_SIZE, BOMB_SIZE, BOSS_WIDTH, BOSS_HEIGHT, BOSS_HP,
+    BOSS_HP_BAR_HEIGHT, PowerUpType, POWERUP_COLORS, POWERUP_LABELS,
+    SPRITE_ATLAS_WIDTH, SPRITE_ALIGN, SPRITE_COLORKEY, BLACK, WHITE, RED, YELLOW, ORANGE,
+    MAGENTA, PURPLE, FONT_SIZE_SMALL
+)
+
+
+def _align(x: int) -> int:
+    """Round up to SPRITE_ALIGN pixels
+
+    SDL's fast blit path needs 16-byte aligned source rows; blitting from a
+    misaligned atlas column is almost twice as slow.
+    """
+    return -(-x // SPRITE_ALIGN) * SPRITE_ALIGN
+
+
+class SpriteAtlas:
+    """Every entity image rendered once into two atlas surfaces
+
+    Keys:
+        ('brick', type, damaged), 'ball', ('paddle', width),
+        ('powerup', type), 'laser', 'enemy', 'bomb', 'boss', ('boss_hp', hp)
+
+    sprites[key] is a (surface, area) pair; renderers draw by passing
+    (surface, dest, area) tuples to Surface.blits(). Rectangular sprites
+    share an opaque surface. Sprites with transparent pixels (the ball)
+    are packed separately on a SPRITE_COLORKEY surface, since colorkeyed
+    blits cost about twice as much as opaque ones.
+
+    With a scale, every sprite is resized once (rounded up, so sprites
+    placed at scaled positions still tile without gaps) for renderers that
+    draw at another resolution.
+    """
+
+    # Sprites that need transparency
+    KEYED = frozenset(['ball'])
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        scale: Tuple[float, float] = (1.0, 1.0)
+    ) -> None:
+        """Render all sprites
+
+        Args:
+            screen: Surface the sprites will be blitted to (sets pixel format)
+            scale: Horizontal and vertical scale of the target resolution
+        """
+        sprites = self._render_sprites()
+        if scale != (1.0, 1.0):
+            sprites = {
+                key: self._scale_sprite(sprite, scale, key in self.KEYED)
+                for key, sprite in sprites.items()
+            }
+        self.sprites: Dict[Hashable, Tuple[pygame.Surface, pygame.Rect]] = {}
+        for keyed in (False, True):
+            page = {key: sprite for key, sprite in sprites.items() if (key in self.KEYED) == keyed}
+            areas = self._pack(page)
+            width = _align(max((area.right for area in areas.values()), default=1))
+            height = max((area.bottom for area in areas.values()), default=1)
+            # Created in the screen's pixel format: same as convert(), but
+            # also works for offscreen targets without an initialized display
+            image = pygame.Surface((width, height), 0, screen)
+            image.fill(SPRITE_COLORKEY)
+            for key, sprite in page.items():
+                image.blit(sprite, areas[key])
+            if keyed:
+                image.set_colorkey(SPRITE_COLORKEY)
+            for key, area in areas.items():
+                self.sprites[key] = (image, area)
+
+    @staticmethod
+    def _render_sprites() -> Dict[Hashable, pygame.Surface]:
+        """Draw each sprite on its own surface
+
+        Returns:
+            Key -> sprite surface
+        """
+        def solid(width: int, height: int, color) -> pygame.Surface:
+            surface = pygame.Surface((width, height))
+            surface.fill(color)
+            return surface
+
+        sprites: Dict[Hashable, pygame.Surface] = {}
+        for (brick_type, damaged), color in BRICK_COLORS.items():
+            sprites['brick', brick_type, damaged] = solid(BRICK_WIDTH, BRICK_HEIGHT, color)
+
+        ball = solid(BALL_RADIUS * 2, BALL_RADIUS * 2, SPRITE_COLORKEY)
+        pygame.draw.circle(ball, RED, (BALL_RADIUS, BALL_RADIUS), BALL_RADIUS)
+        sprites['ball'] = ball
+
+        for width in (PADDLE_WIDTH, int(PADDLE_WIDTH * PADDLE_ENLARGE_MULTIPLIER)):
+            sprites['paddle', width] = solid(width, PADDLE_HEIGHT, WHITE)
+
+        text_cache = get_text_cache()
+        for powerup_type in PowerUpType:
+            color = POWERUP_COLORS.get(powerup_type, (0, 0, 255))
+            capsule = solid(POWERUP_WIDTH, POWERUP_HEIGHT, color)
+            text = text_cache.render(POWERUP_LABELS.get(powerup_type, '?'), BLACK, FONT_SIZE_SMALL)
+            capsule.blit(text, text.get_rect(center=capsule.get_rect().center))
+            sprites['powerup', powerup_type] = capsule
+
+        sprites['laser'] = solid(LASER_WIDTH, LASER_HEIGHT, YELLOW)
+        sprites['enemy'] = solid(ENEMY_SIZE, ENEMY_SIZE, ORANGE)
+        sprites['bomb'] = solid(BOMB_SIZE, BOMB_SIZE, MAGENTA)
+        sprites['boss'] = solid(BOSS_WIDTH, BOSS_HEIGHT, PURPLE)
+        for hp in range(BOSS_HP + 1):
+            bar = solid(BOSS_WIDTH, BOSS_HP_BAR_HEIGHT, RED)
+            bar.fill(WHITE, (0, 0, int(BOSS_WIDTH * hp / BOSS_HP), BOSS_HP_BAR_HEIGHT))
+            sprites['boss_hp', hp] = bar
+        return sprites
+
+    @staticmethod
+    def _scale_sprite(
+        sprite: pygame.Surface,
+        scale: Tuple[float, float],
+        keyed: bool
+    ) -> pygame.Surface:
+        """Resize a sprite, rounding its size up
+
+        Args:
+            sprite: Sprite at game resolution
+            scale: Horizontal and vertical scale
+            keyed: Sprite has SPRITE_COLORKEY pixels (scaled without
+                filtering so the key color does not bleed)
+
+        Returns:
+            Scaled sprite
+        """
+        width, height = sprite.get_size()
+        size = (max(1, math.ceil(width * scale[0])), max(1, math.ceil(height * scale[1])))
+        if keyed:
+            return pygame.transform.scale(sprite, size)
+        return pygame.transform.smoothscale(sprite, size)
+
+    @staticmethod
+    def _pack(sprites: Dict[Hashable, pygame.Surface]) -> Dict[Hashable, pygame.Rect]:
+        """Place sprites on shelves, tallest first, at aligned columns
+
+        Args:
+            sprites: Key -> sprite surface
+
+        Returns:
+            Key -> area in the atlas
+        """
+        areas: Dict[Hashable, pygame.Rect] = {}
+        order: List[Tuple[Hashable, pygame.Surface]] = sorted(
+            sprites.items(), key=lambda item: -item[1].get_height()
+        )
+        x = y = shelf_height = 0
+        for key, sprite in order:
+            width, height = sprite.get_size()
+            if x + width > SPRITE_ATLAS_WIDTH:
+                x, y, shelf_height = 0, y + shelf_height + 1, 0
+            areas[key] = pygame.Rect(x, y, width, height)
+            x = _align(x + width)
+            shelf_height = max(shelf_height, height)
+        return areas
@@ -0,0 +1,90 @@
+"""Cached text rendering"""
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from src.constants import FONT_SIZE, TEXT_CACHE_SIZE
+
+
+Color = Tuple[int, int, int]
+TextKey = Tuple[Optional[str], int, str, Color]
+
+
+class TextCache:
+    """Rendered text surfaces keyed by (font, size, text, color) with LRU eviction"""
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE) -> None:
+        """Initialize cache
+
+        Args:
+            max_entries: Surfaces kept before least recently used are evicted
+        """
+        self.max_entries = max_entries
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self._surfaces: 'OrderedDict[TextKey, pygame.Surface]' = OrderedDict()
+
+    def get_font(self, size: int = FONT_SIZE, font_name: Optional[str] = None) -> pygame.font.Font:
+        """Get font, constructing it only on first use
+
+        Args:
+            size: Font size
+            font_name: Font file (None for pygame default font)
+
+        Returns:
+            Font object
+        """
+        key = (font_name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(font_name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(
+        self,
+        text: str,
+        color: Color,
+        size: int = FONT_SIZE,
+        font_name: Optional[str] = None
+    ) -> pygame.Surface:
+        """Get antialiased surface for text, rendering it on cache miss
+
+        Args:
+            text: Text to render
+            color: Text color
+            size: Font size
+            font_name: Font file (None for pygame default font)
+
+        Returns:
+            Rendered text surface (shared; do not modify)
+        """
+        key = (font_name, size, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = self.get_font(size, font_name).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """Drop all cached surfaces and fonts"""
+        self._surfaces.clear()
+        self._fonts.clear()
+
+
+_shared_cache: Optional[TextCache] = None
+
+
+def get_text_cache() -> TextCache:
+    """Get process-wide text cache
+
+    Returns:
+        Shared TextCache instance
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = TextCache()
+    return _shared_cache
@@ -0,0 +1,377 @@
+"""Input replay recording and playback
+
+Replay file layout (little-endian):
+    header  '<4sBQIIB32s'  magic, version, seed, level checksum, run count,
+                           has-digest flag, final GameState digest
+    counts  uint16[runs]   ticks covered by each run
+    paddle  int16[runs]    paddle target X (PADDLE_X_NONE = no mouse input)
+    flags   uint8[runs]    FLAG_* bits
+
+Consecutive ticks with identical input are stored as one run, so idle
+stretches and held positions cost a few bytes regardless of length.
+"""
+import struct
+import sys
+import zlib
+from array import array
+from typing import Optional, Sequence
+import pygame
+from src.game_engine import GameEngine
+from src.level_format import CompiledLevel, compile_layout
+from src.level_pack import LevelPack
+from src.managers.input_manager import InputFrame, InputManager
+from src.constants import MAX_CATCH_UP_STEPS
+
+
+REPLAY_MAGIC = b'VCRP'
+REPLAY_VERSION = 2  # 2: level checksum over compiled records
+HEADER_FORMAT = '<4sBQIIB32s'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+PADDLE_X_NONE = -32768
+MAX_RUN_LENGTH = 0xFFFF
+
+FLAG_LEFT = 1
+FLAG_RIGHT = 2
+FLAG_FIRE = 4
+FLAG_PAUSE = 8
+FLAG_QUIT = 16
+
+
+def level_checksum(level_data: Sequence) -> int:
+    """Checksum level layouts so a replay is only played on its own levels
+
+    Layouts are compiled and their records hashed in order, which is the
+    CRC a LevelPack stores for the same levels, so a list and a pack built
+    from it give the same checksum.
+
+    Args:
+        level_data: List of level layouts (or compiled levels), or a LevelPack
+
+    Returns:
+        CRC32 of the compiled level records
+    """
+    if isinstance(level_data, LevelPack):
+        return level_data.checksum
+    checksum = 0
+    for level in level_data:
+        if not isinstance(level, CompiledLevel):
+            level = compile_layout(level)
+        checksum = zlib.crc32(level.to_bytes(), checksum)
+    return checksum
+
+
+def encode_frame(frame: InputFrame) -> int:
+    """Pack boolean input into FLAG_* bits
+
+    Args:
+        frame: Input frame
+
+    Returns:
+        Flag byte
+    """
+    flags = 0
+    if frame.move_left:
+        flags |= FLAG_LEFT
+    if frame.move_right:
+        flags |= FLAG_RIGHT
+    if frame.fire:
+        flags |= FLAG_FIRE
+    if frame.pause:
+        flags |= FLAG_PAUSE
+    if frame.quit:
+        flags |= FLAG_QUIT
+    return flags
+
+
+class Replay:
+    """Recorded game: seed, level checksum and run-length encoded tick input"""
+
+    def __init__(self, seed: int, checksum: int) -> None:
+        """Initialize empty replay
+
+        Args:
+            seed: Game seed
+            checksum: level_checksum() of the level set played
+        """
+        self.seed = seed
+        self.checksum = checksum
+        self.counts = array('H')
+        self.paddle_x = array('h')
+        self.flags = array('B')
+        self.final_digest: Optional[str] = None
+
+    def __len__(self) -> int:
+        """Number of recorded ticks"""
+        return sum(self.counts)
+
+    def append(self, frame: InputFrame) -> None:
+        """Record input for one tick
+
+        Args:
+            frame: Input sampled this tick
+        """
+        paddle_x = PADDLE_X_NONE if frame.paddle_x is None else frame.paddle_x
+        flags = encode_frame(frame)
+        if (self.counts and self.paddle_x[-1] == paddle_x
+                and self.flags[-1] == flags and self.counts[-1] < MAX_RUN_LENGTH):
+            self.counts[-1] += 1
+        else:
+            self.counts.append(1)
+            self.paddle_x.append(paddle_x)
+            self.flags.append(flags)
+
+    def to_bytes(self) -> bytes:
+        """Serialize replay
+
+        Returns:
+            Replay file contents
+        """
+        digest = bytes.fromhex(self.final_digest) if self.final_digest else bytes(32)
+        header = struct.pack(
+            HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, self.seed,
+            self.checksum, len(self.counts), self.final_digest is not None, digest
+        )
+        body = [self.counts, self.paddle_x, self.flags]
+        if sys.byteorder != 'little':
+            body = [array(values.typecode, values) for values in body]
+            for values in body:
+                values.byteswap()
+        return header + b''.join(values.tobytes() for values in body)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Replay':
+        """Deserialize replay
+
+        Args:
+            data: Replay file contents
+
+        Returns:
+            Replay object
+
+        Raises:
+            ValueError: If data is not a supported replay
+        """
+        if len(data) < HEADER_SIZE:
+            raise ValueError("Replay data is truncated")
+        magic, version, seed, checksum, runs, has_digest, digest = struct.unpack_from(
+            HEADER_FORMAT, data
+        )
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("Not a supported replay file")
+        if len(data) != HEADER_SIZE + runs * 5:
+            raise ValueError("Replay data is truncated")
+
+        replay = cls(seed, checksum)
+        offset = HEADER_SIZE
+        for values, size in ((replay.counts, 2), (replay.paddle_x, 2), (replay.flags, 1)):
+            values.frombytes(data[offset:offset + runs * size])
+            if sys.byteorder != 'little':
+                values.byteswap()
+            offset += runs * size
+        if has_digest:
+            replay.final_digest = digest.hex()
+        return replay
+
+    def save(self, path: str) -> None:
+        """Write replay to file
+
+        Args:
+            path: Output file path
+        """
+        with open(path, 'wb') as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        """Read replay from file
+
+        Args:
+            path: Replay file path
+
+        Returns:
+            Replay object
+        """
+        with open(path, 'rb') as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+
+class ReplayRecorder(InputManager):
+    """Input source that records every frame polled from another source"""
+
+    def __init__(self, source: InputManager, level_data: Sequence) -> None:
+        """Initialize recorder
+
+        Args:
+            source: Input source to record
+            level_data: Level set being played
+        """
+        self.source = source
+        self.checksum = level_checksum(level_data)
+        self.replay = Replay(0, self.checksum)
+
+    def on_reset(self, seed: int) -> None:
+        """Start a fresh recording for the new game
+
+        Args:
+            seed: Seed of the new game
+        """
+        self.source.on_reset(seed)
+        self.replay = Replay(seed, self.checksum)
+
+    def poll(self) -> InputFrame:
+        """Sample and record input for the next tick
+
+        Returns:
+            InputFrame from the wrapped source
+        """
+        frame = self.source.poll()
+        self.replay.append(frame)
+        return frame
+
+
+class ReplayInputManager(InputManager):
+    """Input source that re-drives the engine from a replay
+
+    Once the recording is exhausted it requests quit, so headless playback
+    stops exactly where the recorded session ended.
+    """
+
+    def __init__(self, replay: Replay) -> None:
+        """Initialize playback
+
+        Args:
+            replay: Replay to play
+        """
+        self.replay = replay
+        self._run = -1
+        self._remaining = 0
+        self._frame = InputFrame()
+        self.finished: bool = False
+
+    def poll(self) -> InputFrame:
+        """Return recorded input for the next tick
+
+        Returns:
+            InputFrame for this tick (shared object, overwritten every run)
+        """
+        window_quit = False
+        if pygame.display.get_init():
+            # Keep a watched window responsive; closing it stops playback
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    window_quit = True
+
+        if self._remaining == 0:
+            self._run += 1
+            if self._run >= len(self.replay.counts):
+                self.finished = True
+                return InputFrame(quit=True)
+            self._remaining = self.replay.counts[self._run]
+            paddle_x = self.replay.paddle_x[self._run]
+            flags = self.replay.flags[self._run]
+            frame = self._frame
+            frame.paddle_x = None if paddle_x == PADDLE_X_NONE else paddle_x
+            frame.move_left = bool(flags & FLAG_LEFT)
+            frame.move_right = bool(flags & FLAG_RIGHT)
+            frame.fire = bool(flags & FLAG_FIRE)
+            frame.pause = bool(flags & FLAG_PAUSE)
+            frame.quit = bool(flags & FLAG_QUIT)
+
+        self._remaining -= 1
+        if window_quit:
+            return InputFrame(quit=True)
+        return self._frame
+
+
+def play_replay(
+    replay: Replay,
+    level_data: Sequence,
+    headless: bool = True,
+    speed: float = 1.0
+) -> GameEngine:
+    """Re-run a recorded game
+
+    Headless playback steps as fast as possible. Rendered playback runs the
+    fixed-timestep loop with game_speed=speed, so physics is
+    unchanged and only wall-clock pacing differs.
+
+    Args:
+        replay: Replay to play
+        level_data: Level set the replay was recorded on
+        headless: Play without display or audio
+        speed: Multiple of real time for rendered playback
+
+    Returns:
+        Engine in its final state (compare state.digest() with
+        replay.final_digest to verify reproduction)
+
+    Raises:
+        ValueError: If level_data differs from the recorded level set
+    """
+    if level_checksum(level_data) != replay.checksum:
+        raise ValueError("Replay was recorded on a different level set")
+
+    engine = GameEngine(
+        level_data,
+        headless=headless,
+        input_manager=ReplayInputManager(replay),
+        game_speed=speed,
+        max_catch_up_steps=max(MAX_CATCH_UP_STEPS, round(MAX_CATCH_UP_STEPS * speed)),
+        seed=replay.seed
+    )
+    if headless:
+        engine.run_headless(len(replay) + 1)
+        engine.close()
+    else:
+        try:
+            engine.run()
+        except SystemExit:
+            pass
+    return engine
+
+
+def export_replay(
+    replay: Replay,
+    level_data: Sequence,
+    renderer: 'OffscreenRenderer',
+    writer,
+    frame_step: int = 1
+) -> GameEngine:
+    """Re-run a recorded game headless and stream its frames to a writer
+
+    Args:
+        replay: Replay to export
+        level_data: Level set the replay was recorded on
+        renderer: Draws the frames (sets size and color mode)
+        writer: ImageSequenceWriter, RawVideoWriter or any object with
+            write(frame_array)
+        frame_step: Write every Nth tick (the starting frame is always written)
+
+    Returns:
+        Engine in its final state
+
+    Raises:
+        ValueError: If level_data differs from the recorded level set
+    """
+    if level_checksum(level_data) != replay.checksum:
+        raise ValueError("Replay was recorded on a different level set")
+
+    engine = GameEngine(
+        level_data,
+        headless=True,
+        input_manager=ReplayInputManager(replay),
+        seed=replay.seed
+    )
+    frame = renderer.to_array(engine.state)
+    writer.write(frame)
+    ticks = 0
+    while engine.running and ticks <= len(replay):
+        engine.step()
+        if engine.quit_requested:
+            break
+        ticks += 1
+        if ticks % frame_step == 0:
+            writer.write(renderer.to_array(engine.state, out=frame))
+    engine.close()
+    return engine
@@ -0,0 +1,270 @@
+"""Compact binary game state snapshots
+
+A Snapshot is three immutable byte strings:
+    core    scalars, paddle, balls, capsules, lasers, enemies, bombs, boss
+            and power-up timers (small, re-encoded every snapshot)
+    bricks  the brick field, 10 bytes per brick
+    rng     Mersenne Twister state of every GameRandom stream
+
+The bricks and rng parts are only re-encoded when they changed, so
+consecutive snapshots share the same bytes objects for them and a
+snapshot per tick costs about as much as encoding the moving bodies.
+"""
+import struct
+from typing import Dict, List, NamedTuple, Tuple
+import pygame
+from src.entities.paddle import Paddle
+from src.entities.ball import Ball
+from src.entities.brick import Brick
+from src.entities.boss import Boss
+from src.brick_grid import BrickGrid
+from src.constants import BrickType, PowerUpType
+
+
+SNAPSHOT_VERSION = 1
+
+BRICK_TYPES: List[BrickType] = list(BrickType)
+POWERUP_TYPES: List[PowerUpType] = list(PowerUpType)
+
+CORE_HEADER = struct.Struct('<BiqiBii')   # version, level, score, lives, paused, timers
+PADDLE = struct.Struct('<4hBBh')          # rect, laser, catch, caught ball index
+TIMER = struct.Struct('<Bi')              # power-up type index, frames left
+BALL = struct.Struct('<dd4hddB')          # pos, rect, dx, dy, caught
+POWERUP = struct.Struct('<hhB')           # top-left, type index
+POSITION = struct.Struct('<hh')           # top-left (lasers, enemies, bombs)
+BOSS = struct.Struct('<hhi')              # top-left, hp
+BRICK = struct.Struct('<iiBB')            # top-left, type index, hits
+COUNT = struct.Struct('<I')
+MT_STATE = struct.Struct('<B625IBd')      # version, key + position, has gauss, gauss
+
+PARTS = struct.Struct('<4sBIII')          # magic, version, part lengths
+SNAPSHOT_MAGIC = b'VCSS'
+
+
+class Snapshot(NamedTuple):
+    """Immutable game state checkpoint"""
+
+    core: bytes
+    bricks: bytes
+    rng: bytes
+
+    def to_bytes(self) -> bytes:
+        """Serialize as one blob
+
+        Returns:
+            Snapshot file contents
+        """
+        header = PARTS.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(self.core), len(self.bricks), len(self.rng)
+        )
+        return header + self.core + self.bricks + self.rng
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Snapshot':
+        """Deserialize a blob from to_bytes()
+
+        Args:
+            data: Snapshot blob
+
+        Returns:
+            Snapshot
+
+        Raises:
+            ValueError: If data is not a supported snapshot
+        """
+        if len(data) < PARTS.size:
+            raise ValueError("Snapshot data is truncated")
+        magic, version, core_size, bricks_size, rng_size = PARTS.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError("Not a supported snapshot")
+        if len(data) != PARTS.size + core_size + bricks_size + rng_size:
+            raise ValueError("Snapshot data is truncated")
+        offset = PARTS.size
+        core = data[offset:offset + core_size]
+        offset += core_size
+        bricks = data[offset:offset + bricks_size]
+        return cls(core, bricks, data[offset + bricks_size:])
+
+
+def encode_core(state: 'GameState', timers: Dict[PowerUpType, int]) -> bytes:
+    """Encode everything except bricks and RNG
+
+    Args:
+        state: Game state
+        timers: PowerUpManager.active_timers
+
+    Returns:
+        Core bytes
+    """
+    paddle = state.paddle
+    caught_index = -1
+    if paddle.caught_ball is not None:
+        for index, ball in enumerate(state.balls):
+            if ball is paddle.caught_ball:
+                caught_index = index
+                break
+
+    parts = [
+        CORE_HEADER.pack(
+            SNAPSHOT_VERSION, state.level, state.score, state.lives, state.is_paused,
+            state.enemy_spawn_timer, state.bomb_spawn_timer
+        ),
+        PADDLE.pack(*paddle.rect, paddle.laser_active, paddle.catch_active, caught_index),
+        COUNT.pack(len(timers)),
+    ]
+    parts.extend(
+        TIMER.pack(POWERUP_TYPES.index(powerup_type), frames)
+        for powerup_type, frames in timers.items()
+    )
+    parts.append(COUNT.pack(len(state.balls)))
+    parts.extend(
+        BALL.pack(ball.pos_x, ball.pos_y, *ball.rect, ball.dx, ball.dy, ball.is_caught)
+        for ball in state.balls
+    )
+    parts.append(COUNT.pack(len(state.power_ups)))
+    parts.extend(
+        POWERUP.pack(powerup.rect.x, powerup.rect.y, POWERUP_TYPES.index(powerup.type))
+        for powerup in state.power_ups
+    )
+    for bodies in (state.lasers, state.enemies, state.bombs):
+        parts.append(COUNT.pack(len(bodies)))
+        parts.extend(POSITION.pack(body.rect.x, body.rect.y) for body in bodies)
+    boss = state.boss
+    parts.append(COUNT.pack(boss is not None))
+    if boss is not None:
+        parts.append(BOSS.pack(boss.rect.x, boss.rect.y, boss.hp))
+    return b''.join(parts)
+
+
+def decode_core(data: bytes, state: 'GameState', timers: Dict[PowerUpType, int]) -> None:
+    """Restore everything except bricks and RNG
+
+    Args:
+        data: Bytes from encode_core()
+        state: Game state to overwrite
+        timers: PowerUpManager.active_timers to overwrite
+
+    Raises:
+        ValueError: If data was written by another snapshot version
+    """
+    (version, state.level, state.score, state.lives, paused,
+     state.enemy_spawn_timer, state.bomb_spawn_timer) = CORE_HEADER.unpack_from(data)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("Not a supported snapshot")
+    state.is_paused = bool(paused)
+    offset = CORE_HEADER.size
+
+    x, y, width, height, laser, catch, caught_index = PADDLE.unpack_from(data, offset)
+    offset += PADDLE.size
+    paddle = Paddle()
+    paddle.rect = pygame.Rect(x, y, width, height)
+    paddle.laser_active = bool(laser)
+    paddle.catch_active = bool(catch)
+    state.paddle = paddle
+
+    def records(record: struct.Struct) -> List[Tuple]:
+        nonlocal offset
+        count, = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        values = list(record.iter_unpack(data[offset:offset + count * record.size]))
+        offset += count * record.size
+        return values
+
+    timers.clear()
+    for type_index, frames in records(TIMER):
+        timers[POWERUP_TYPES[type_index]] = frames
+
+    state.balls.clear()
+    for pos_x, pos_y, x, y, width, height, dx, dy, caught in records(BALL):
+        ball = Ball()
+        ball.rect = pygame.Rect(x, y, width, height)
+        ball.pos_x, ball.pos_y = pos_x, pos_y
+        ball.dx, ball.dy = dx, dy
+        ball.is_caught = bool(caught)
+        state.balls.append(ball)
+    if caught_index >= 0:
+        paddle.caught_ball = state.balls[caught_index]
+
+    # Refill the entity pools in recorded order; reset() arguments are
+    # placeholders, the exact top-left is written afterwards
+    state.power_ups.clear()
+    for x, y, type_index in records(POWERUP):
+        powerup = state.power_ups.acquire(0, 0, POWERUP_TYPES[type_index])
+        powerup.rect.topleft = (x, y)
+
+    for pool, spawn_args in ((state.lasers, (0, 0)), (state.enemies, (0,)),
+                             (state.bombs, (0, 0))):
+        pool.clear()
+        for x, y in records(POSITION):
+            body = pool.acquire(*spawn_args)
+            body.rect.topleft = (x, y)
+
+    state.boss = None
+    for x, y, hp in records(BOSS):
+        state.boss = Boss()
+        state.boss.rect.topleft = (x, y)
+        state.boss.hp = hp
+
+
+def encode_bricks(bricks: BrickGrid) -> bytes:
+    """Encode the brick field
+
+    Args:
+        bricks: Brick grid
+
+    Returns:
+        Brick bytes (insertion order is kept)
+    """
+    return b''.join(
+        BRICK.pack(brick.rect.x, brick.rect.y, BRICK_TYPES.index(brick.type), brick.hits)
+        for brick in bricks
+    )
+
+
+def decode_bricks(data: bytes) -> BrickGrid:
+    """Rebuild a brick grid
+
+    Args:
+        data: Bytes from encode_bricks()
+
+    Returns:
+        New BrickGrid
+    """
+    bricks = []
+    for x, y, type_index, hits in BRICK.iter_unpack(data):
+        brick = Brick(x, y, BRICK_TYPES[type_index])
+        brick.hits = hits
+        bricks.append(brick)
+    return BrickGrid(bricks)
+
+
+def encode_rng(state: Dict[str, tuple]) -> bytes:
+    """Encode GameRandom.getstate()
+
+    Args:
+        state: Stream name -> random.Random state
+
+    Returns:
+        RNG bytes, streams in GameRandom.STREAMS order
+    """
+    parts = []
+    for version, internal, gauss in state.values():
+        parts.append(MT_STATE.pack(version, *internal, gauss is not None, gauss or 0.0))
+    return b''.join(parts)
+
+
+def decode_rng(data: bytes, streams: Tuple[str, ...]) -> Dict[str, tuple]:
+    """Decode bytes from encode_rng() for GameRandom.setstate()
+
+    Args:
+        data: RNG bytes
+        streams: Stream names in encoding order
+
+    Returns:
+        Stream name -> random.Random state
+    """
+    state = {}
+    for name, values in zip(streams, MT_STATE.iter_unpack(data)):
+        version, internal, has_gauss, gauss = values[0], values[1:626], values[626], values[627]
+        state[name] = (version, internal, gauss if has_gauss else None)
+    return state
@@ -0,0 +1,414 @@
+"""Parallel parameter sweeps over headless games
+
+Usage:
+    python -m src.sweep --param POWERUP_DROP_CHANCE=0.1,0.2,0.3 \\
+        --param BALL_SLOW_DIVISOR=1.5,2.0 --seeds 200 --levels 0,2,3
+
+Every combination of parameter values is played on every listed level
+with every seed. Only constants that the game reads while running can be
+swept; ones baked in when a module is imported (class attributes, default
+arguments, values derived from other constants) are rejected, see
+python -m src.sweep --list-unsweepable.
+
+Games run on a process pool in chunks; each chunk sends back only
+per-game (cleared, score, ticks) triples, which are folded into
+fixed-size aggregates as they arrive, so memory does not grow with the
+number of games.
+"""
+import argparse
+import ast
+import itertools
+import json
+import math
+import os
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import src.constants as constants
+from src.constants import PADDLE_WIDTH
+
+
+SWEEP_MAX_TICKS = 36_000  # 10 minutes of play at 60 ticks/s
+SWEEP_CHUNK_SIZE = 16
+SCORE_BUCKET = 10
+AUTOPILOT_JITTER = PADDLE_WIDTH * 2 // 5
+
+
+GameResult = Tuple[bool, int, int]
+
+
+class _ImportTimeNames(ast.NodeVisitor):
+    """Collect names a module reads while it is being imported
+
+    Module and class bodies, decorators and default arguments run at import
+    time; function and lambda bodies run later and are skipped.
+    """
+
+    def __init__(self) -> None:
+        self.lines: Dict[str, List[int]] = defaultdict(list)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, ast.Load):
+            self.lines[node.id].append(node.lineno)
+
+    def _visit_signature(self, node) -> None:
+        for child in node.args.defaults + [d for d in node.args.kw_defaults if d]:
+            self.visit(child)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        self._visit_signature(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_Lambda = _visit_signature
+
+    def visit_If(self, node: ast.If) -> None:
+        # Skip the script entry point
+        test = node.test
+        if isinstance(test, ast.Compare) and isinstance(test.left, ast.Name) \
+                and test.left.id == '__name__':
+            return
+        self.generic_visit(node)
+
+
+@lru_cache(maxsize=None)
+def import_time_uses() -> Dict[str, Tuple[str, ...]]:
+    """Find constants that src modules read at import time
+
+    Such reads copy the value into a class attribute, default argument or
+    derived constant, where apply_overrides cannot reach it.
+
+    Returns:
+        Constant name -> 'path:line' locations
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    root = os.path.dirname(package_dir)
+    uses: Dict[str, List[str]] = defaultdict(list)
+    for directory, _, files in os.walk(package_dir):
+        for file_name in sorted(files):
+            if not file_name.endswith('.py'):
+                continue
+            path = os.path.join(directory, file_name)
+            with open(path, encoding='utf-8') as source_file:
+                tree = ast.parse(source_file.read(), path)
+            visitor = _ImportTimeNames()
+            visitor.visit(tree)
+            relative = os.path.relpath(path, root).replace(os.sep, '/')
+            for name, lines in visitor.lines.items():
+                if name.isupper() and hasattr(constants, name):
+                    uses[name].extend(f"{relative}:{line}" for line in lines)
+    return {name: tuple(locations) for name, locations in uses.items()}
+
+
+def check_overrides(names: Sequence[str]) -> None:
+    """Make sure every name can be swept
+
+    Args:
+        names: Constant names
+
+    Raises:
+        ValueError: If a name is not defined in src.constants or is read at
+            import time somewhere in src
+    """
+    uses = import_time_uses()
+    for name in names:
+        if not hasattr(constants, name):
+            raise ValueError(f"Unknown constant: {name}")
+        if name in uses:
+            raise ValueError(
+                f"{name} cannot be swept: read at import time by {', '.join(uses[name])}"
+            )
+
+
+def apply_overrides(overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace constants in src.constants and every src module importing them
+
+    Nothing is changed unless every name passes check_overrides().
+
+    Args:
+        overrides: Constant name -> new value
+
+    Returns:
+        Previous values (pass back in to restore)
+
+    Raises:
+        ValueError: If a name cannot be swept (see check_overrides)
+    """
+    check_overrides(list(overrides))
+    previous = {}
+    for name, value in overrides.items():
+        previous[name] = getattr(constants, name)
+        for module_name, module in list(sys.modules.items()):
+            if (module_name == 'src' or module_name.startswith('src.')) \
+                    and name in vars(module):
+                setattr(module, name, value)
+    return previous
+
+
+def play_game(
+    level_data: List[List[str]],
+    level_index: int,
+    seed: int,
+    max_ticks: int
+) -> GameResult:
+    """Play one level headless with the autopilot
+
+    Args:
+        level_data: Level set
+        level_index: Level to play
+        seed: Game seed
+        max_ticks: Tick limit before the attempt counts as failed
+
+    Returns:
+        (cleared, score, ticks played)
+    """
+    from src.game_engine import GameEngine
+    from src.managers.input_manager import AutopilotInput
+
+    autopilot = AutopilotInput(jitter=AUTOPILOT_JITTER, seed=seed)
+    with GameEngine(level_data, headless=True, input_manager=autopilot, seed=seed,
+                    start_level=level_index) as engine:
+        autopilot.engine = engine
+
+        ticks = 0
+        while engine.running and engine.state.level == level_index and ticks < max_ticks:
+            engine.step()
+            ticks += 1
+        cleared = engine.state.level != level_index or (
+            not engine.running and not engine.state.is_game_over()
+        )
+        return cleared, engine.state.score, ticks
+
+
+def _run_chunk(
+    key: int,
+    overrides: Dict[str, Any],
+    level_index: int,
+    seeds: Sequence[int],
+    max_ticks: int
+) -> Tuple[int, List[GameResult]]:
+    """Worker entry point: play a chunk of seeds under one set of overrides
+
+    Args:
+        key: Aggregate key returned with the results
+        overrides: Constant overrides for these games
+        level_index: Level to play
+        seeds: Game seeds
+        max_ticks: Tick limit per game
+
+    Returns:
+        (key, per-game results)
+    """
+    from data.levels import LEVELS
+
+    previous = apply_overrides(overrides)
+    try:
+        return key, [play_game(LEVELS, level_index, seed, max_ticks) for seed in seeds]
+    finally:
+        apply_overrides(previous)
+
+
+class Aggregate:
+    """Running statistics for one (overrides, level) cell of a sweep"""
+
+    def __init__(self, overrides: Dict[str, Any], level_index: int) -> None:
+        """Initialize empty aggregate
+
+        Args:
+            overrides: Constant overrides of this cell
+            level_index: Level played
+        """
+        self.overrides = overrides
+        self.level_index = level_index
+        self.games: int = 0
+        self.clears: int = 0
+        self.clear_ticks_total: int = 0
+        self.score_total: int = 0
+        self.score_squares: int = 0
+        self.score_buckets: Counter = Counter()
+
+    def add(self, cleared: bool, score: int, ticks: int) -> None:
+        """Fold in one game result
+
+        Args:
+            cleared: Level was cleared
+            score: Final score
+            ticks: Ticks played
+        """
+        self.games += 1
+        self.score_total += score
+        self.score_squares += score * score
+        self.score_buckets[score // SCORE_BUCKET] += 1
+        if cleared:
+            self.clears += 1
+            self.clear_ticks_total += ticks
+
+    def score_percentile(self, fraction: float) -> int:
+        """Estimate a score percentile from the bucket counts
+
+        Args:
+            fraction: Percentile as a fraction (0.5 = median)
+
+        Returns:
+            Lower bound of the bucket holding the percentile
+        """
+        target = fraction * (self.games - 1)
+        seen = 0
+        for bucket in sorted(self.score_buckets):
+            seen += self.score_buckets[bucket]
+            if seen > target:
+                return bucket * SCORE_BUCKET
+        return 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize for reports
+
+        Returns:
+            JSON-serializable summary
+        """
+        games = max(1, self.games)
+        mean = self.score_total / games
+        variance = max(0.0, self.score_squares / games - mean * mean)
+        return {
+            'overrides': self.overrides,
+            'level': self.level_index,
+            'games': self.games,
+            'clear_rate': self.clears / games,
+            'score_mean': round(mean, 2),
+            'score_std': round(math.sqrt(variance), 2),
+            'score_p10': self.score_percentile(0.10),
+            'score_p50': self.score_percentile(0.50),
+            'score_p90': self.score_percentile(0.90),
+            'ticks_to_clear_mean': (
+                round(self.clear_ticks_total / self.clears, 1) if self.clears else None
+            ),
+        }
+
+
+def run_sweep(
+    grid: Dict[str, Sequence[Any]],
+    seeds: Sequence[int],
+    levels: Sequence[int],
+    max_ticks: int = SWEEP_MAX_TICKS,
+    workers: Optional[int] = None,
+    chunk_size: int = SWEEP_CHUNK_SIZE
+) -> Iterator[Tuple[int, int, List[Aggregate]]]:
+    """Play every override combination on every level and seed in parallel
+
+    Only a bounded number of chunks is in flight at a time, and results are
+    folded into the aggregates as soon as a chunk finishes.
+
+    Args:
+        grid: Constant name -> values to try
+        seeds: Game seeds played for every cell
+        levels: Level indices
+        max_ticks: Tick limit per game
+        workers: Worker processes (None = CPU count)
+        chunk_size: Games per worker task
+
+    Yields:
+        (games finished, games total, aggregates) after every chunk
+    """
+    names = list(grid)
+    aggregates = [
+        Aggregate(dict(zip(names, values)), level_index)
+        for values in itertools.product(*(grid[name] for name in names))
+        for level_index in levels
+    ]
+    total = len(aggregates) * len(seeds)
+    tasks = (
+        (key, aggregate.overrides, aggregate.level_index,
+         seeds[start:start + chunk_size], max_ticks)
+        for key, aggregate in enumerate(aggregates)
+        for start in range(0, len(seeds), chunk_size)
+    )
+
+    workers = workers or os.cpu_count() or 1
+    finished = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for task in itertools.islice(tasks, workers * 2):
+            pending.add(pool.submit(_run_chunk, *task))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, results = future.result()
+                for result in results:
+                    aggregates[key].add(*result)
+                finished += len(results)
+                for task in itertools.islice(tasks, 1):
+                    pending.add(pool.submit(_run_chunk, *task))
+            yield finished, total, aggregates
+
+
+def _parse_param(text: str) -> Tuple[str, List[Any]]:
+    """Parse NAME=v1,v2,... into a name and literal values
+
+    Args:
+        text: Command line parameter
+
+    Returns:
+        (name, values)
+    """
+    name, _, values = text.partition('=')
+    if not values:
+        raise argparse.ArgumentTypeError(f"Expected NAME=v1,v2,...: {text}")
+    return name.strip(), [ast.literal_eval(value.strip()) for value in values.split(',')]
+
+
+def main() -> int:
+    """Run a sweep from the command line
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="VC-Arkanoid parameter sweep")
+    parser.add_argument("--param", type=_parse_param, action="append", default=[],
+                        metavar="NAME=V1,V2", help="Constant to sweep (repeatable)")
+    parser.add_argument("--seeds", type=int, default=100, help="Seeds per cell")
+    parser.add_argument("--first-seed", type=int, default=0, help="First seed")
+    parser.add_argument("--levels", default="0", help="Comma-separated level indices")
+    parser.add_argument("--max-ticks", type=int, default=SWEEP_MAX_TICKS,
+                        help="Tick limit per game")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--chunk-size", type=int, default=SWEEP_CHUNK_SIZE, help="Games per task")
+    parser.add_argument("--output", default="sweep_results.jsonl", help="Write summaries here")
+    parser.add_argument("--list-unsweepable", action="store_true",
+                        help="List constants read at import time and exit")
+    args = parser.parse_args()
+
+    if args.list_unsweepable:
+        for name, locations in sorted(import_time_uses().items()):
+            print(f"{name:<28}{', '.join(locations)}")
+        return 0
+
+    grid = dict(args.param)
+    try:
+        check_overrides(list(grid))
+    except ValueError as error:
+        parser.error(str(error))
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    levels = [int(level) for level in args.levels.split(',')]
+
+    aggregates: List[Aggregate] = []
+    for finished, total, aggregates in run_sweep(
+        grid, seeds, levels, args.max_ticks, args.workers, args.chunk_size
+    ):
+        print(f"\r{finished}/{total} games", end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+
+    with open(args.output, 'w') as output_file:
+        for aggregate in aggregates:
+            summary = aggregate.to_dict()
+            output_file.write(json.dumps(summary) + '\n')
+            print(f"{json.dumps(summary['overrides']):<50} level {summary['level']:>2}  "
+                  f"clear {summary['clear_rate']:6.1%}  score {summary['score_mean']:>8.1f}"
+                  f" (p50 {summary['score_p50']})  ticks {summary['ticks_to_clear_mean']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,378 @@
+"""Batched lockstep simulation of many games (requires NumPy)"""
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+from src.managers.level_manager import LevelManager
+from src.rng import GameRandom
+from src.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BALL_RADIUS, BALL_INITIAL_SPEED_X,
+    BALL_INITIAL_SPEED_Y, PADDLE_WIDTH, PADDLE_HEIGHT, PADDLE_SPEED,
+    PADDLE_HIT_ANGLE_RANGE, BRICK_WIDTH, BRICK_HEIGHT, BRICK_OFFSET_Y,
+    BOSS_WIDTH, BOSS_HEIGHT, BOSS_HP, INITIAL_LIVES, POINTS_PER_BRICK,
+    POINTS_PER_BOSS_HIT, ENV_SERVE_JITTER, BrickType
+)
+
+
+# Actions
+ACTION_NOOP = 0
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+
+# Observation row layout
+OBSERVATION_FIELDS = (
+    'paddle_x', 'ball_x', 'ball_y', 'ball_dx', 'ball_dy', 'bricks_left', 'lives'
+)
+
+# Brick hit points in the brick arrays (0 = empty cell)
+GOLD_HP = -1
+BRICK_HP = {BrickType.NORMAL: 1, BrickType.SILVER: 2, BrickType.GOLD: GOLD_HP}
+
+BALL_SIZE = BALL_RADIUS * 2
+PADDLE_TOP = SCREEN_HEIGHT - PADDLE_HEIGHT - 10
+BALL_START_X = float(SCREEN_WIDTH // 2 + BALL_RADIUS)
+BALL_START_Y = float(SCREEN_HEIGHT // 2 + BALL_RADIUS)
+PADDLE_START_X = (SCREEN_WIDTH - PADDLE_WIDTH) // 2
+BOSS_LEFT = SCREEN_WIDTH // 2 - BOSS_WIDTH // 2
+BOSS_TOP = 50
+
+# SplitMix64 constants for the per-game serve draws
+_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_SHIFTS = (np.uint64(30), np.uint64(27), np.uint64(31), np.uint64(11))
+
+
+class VectorEnv:
+    """N independent games stepped in lockstep on shared NumPy arrays
+
+    Every per-game quantity (paddle, ball, brick hit points, boss HP,
+    lives, score, level) is one row of an array, so a step is a fixed
+    number of array operations regardless of how many games run. The rules
+    mirror GameEngine._update for the paddle, a single ball, bricks, the
+    boss, life loss and level progression.
+
+    Not simulated: power-up capsules (and with them catch, multi-ball,
+    paddle size, extra lives and BREAK), lasers, enemies and boss bombs.
+    Use headless GameEngine instances (GameEnv) when those matter.
+
+    Each game's seed drives its serves: every time the ball is put back in
+    play its horizontal speed is offset by up to serve_jitter, drawn from
+    a counter-based stream of that seed. With serve_jitter=0 a game here
+    matches GameEngine(vectorized_balls=True) with drops, enemy spawns and
+    boss bombs disabled, since brick contacts use the same overlap
+    response as BallSystem.
+    """
+
+    def __init__(
+        self,
+        level_data: List[List[str]],
+        num_envs: int,
+        serve_jitter: float = ENV_SERVE_JITTER
+    ) -> None:
+        """Initialize environment
+
+        Args:
+            level_data: List of level layouts
+            num_envs: Number of games stepped together
+            serve_jitter: Max serve dx offset in pixels per tick (0 = fixed serve)
+        """
+        self.num_envs = num_envs
+        self.serve_jitter = serve_jitter
+        self.level_manager = LevelManager(level_data)
+        self.num_levels = self.level_manager.get_total_levels()
+        self.level_bricks, self.level_brick_counts = self._compile_levels()
+        self.level_boss_hp = np.array(
+            [BOSS_HP if self.level_manager.should_spawn_boss(index) else 0
+             for index in range(self.num_levels)],
+            dtype=np.int64
+        )
+
+        n = num_envs
+        self.seeds = np.zeros(n, dtype=np.int64)
+        self.serve_keys = np.zeros(n, dtype=np.uint64)  # Serve stream seed per game
+        self.serves = np.zeros(n, dtype=np.uint64)  # Serves drawn so far
+        self.paddle_x = np.full(n, PADDLE_START_X, dtype=np.int64)  # Paddle left edge
+        self.ball_x = np.zeros(n)
+        self.ball_y = np.zeros(n)
+        self.ball_dx = np.zeros(n)
+        self.ball_dy = np.zeros(n)
+        self.bricks = np.zeros((n,) + self.level_bricks.shape[1:], dtype=np.int8)
+        self.bricks_left = np.zeros(n, dtype=np.int64)  # Destructible bricks remaining
+        self.boss_hp = np.zeros(n, dtype=np.int64)
+        self.level = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int64)
+        self.done = np.ones(n, dtype=bool)
+        self.won = np.zeros(n, dtype=bool)
+
+    def _compile_levels(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert level layouts to brick hit point grids
+
+        Returns:
+            (hit points shaped (levels, rows, cols), destructible bricks
+            per level)
+        """
+        levels = [self.level_manager.load_level(index) for index in range(self.num_levels)]
+        cells = [
+            [((brick.rect.top - BRICK_OFFSET_Y) // BRICK_HEIGHT,
+              brick.rect.left // BRICK_WIDTH, BRICK_HP[brick.type]) for brick in bricks]
+            for bricks in levels
+        ]
+        rows = max((row for level in cells for row, _, _ in level), default=-1) + 1
+        cols = max((col for level in cells for _, col, _ in level), default=-1) + 1
+        grids = np.zeros((self.num_levels, rows, cols), dtype=np.int8)
+        for index, level in enumerate(cells):
+            for row, col, hp in level:
+                grids[index, row, col] = hp
+        counts = np.array(
+            [sum(brick.destructible for brick in bricks) for bricks in levels], dtype=np.int64
+        )
+        return grids, counts
+
+    def reset(
+        self,
+        seeds: Sequence[int],
+        indices: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """Start new games
+
+        Args:
+            seeds: One seed per game being reset (drives its serves)
+            indices: Games to reset (None resets all)
+
+        Returns:
+            Observations for all games, shaped (num_envs, len(OBSERVATION_FIELDS))
+        """
+        mask = np.zeros(self.num_envs, dtype=bool)
+        if indices is None:
+            mask[:] = True
+        else:
+            mask[np.asarray(indices)] = True
+        seeds = np.asarray(seeds, dtype=np.int64)
+        self.seeds[mask] = seeds
+        self.serve_keys[mask] = [GameRandom.derive_seed(int(seed), 'serve') for seed in seeds]
+        self.serves[mask] = 0
+        self.score[mask] = 0
+        self.lives[mask] = INITIAL_LIVES
+        self.done[mask] = False
+        self.won[mask] = False
+        self._load_level(mask, 0)
+        return self.observe()
+
+    def _load_level(self, mask: np.ndarray, level) -> None:
+        """Load a level and reset paddle and ball for some games
+
+        Args:
+            mask: Games to change
+            level: Level index (scalar or per-game array)
+        """
+        self.level[mask] = level
+        self.bricks[mask] = self.level_bricks[self.level[mask]]
+        self.bricks_left[mask] = self.level_brick_counts[self.level[mask]]
+        self.boss_hp[mask] = self.level_boss_hp[self.level[mask]]
+        self._reset_bodies(mask)
+
+    def _reset_bodies(self, mask: np.ndarray) -> None:
+        """Put paddle and ball back at their starting positions
+
+        Args:
+            mask: Games to change
+        """
+        self.paddle_x[mask] = PADDLE_START_X
+        self.ball_x[mask] = BALL_START_X
+        self.ball_y[mask] = BALL_START_Y
+        self.ball_dx[mask] = BALL_INITIAL_SPEED_X
+        self.ball_dy[mask] = BALL_INITIAL_SPEED_Y
+        if self.serve_jitter:
+            self.ball_dx[mask] += self.serve_jitter * (2 * self._draw_serves(mask) - 1)
+
+    def _draw_serves(self, mask: np.ndarray) -> np.ndarray:
+        """Draw the next serve value of some games (SplitMix64 of seed and count)
+
+        Args:
+            mask: Games serving
+
+        Returns:
+            One float in [0, 1) per selected game
+        """
+        counts = self.serves[mask] + np.uint64(1)
+        self.serves[mask] = counts
+        z = self.serve_keys[mask] + counts * _GAMMA
+        z = (z ^ (z >> _SHIFTS[0])) * _MIX_1
+        z = (z ^ (z >> _SHIFTS[1])) * _MIX_2
+        z ^= z >> _SHIFTS[2]
+        return (z >> _SHIFTS[3]) * 2.0 ** -53
+
+    def observe(self) -> np.ndarray:
+        """Build the observation matrix
+
+        Returns:
+            float32 array, one row per game, columns in OBSERVATION_FIELDS
+            order (positions are screen pixels, velocities pixels per tick)
+        """
+        return np.stack((
+            self.paddle_x + PADDLE_WIDTH / 2, self.ball_x, self.ball_y,
+            self.ball_dx, self.ball_dy, self.bricks_left, self.lives
+        ), axis=1).astype(np.float32)
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Advance every running game by one tick
+
+        Finished games stay frozen (zero reward) until they are reset.
+
+        Args:
+            actions: One ACTION_* per game
+
+        Returns:
+            (observations, rewards, done flags); rewards are points scored
+            this tick, done is set on game over or after the last level
+        """
+        actions = np.asarray(actions)
+        running = ~self.done
+        score_before = self.score.copy()
+
+        # Paddle
+        self.paddle_x[running & (actions == ACTION_LEFT)] -= PADDLE_SPEED
+        self.paddle_x[running & (actions == ACTION_RIGHT)] += PADDLE_SPEED
+        np.clip(self.paddle_x, 0, SCREEN_WIDTH - PADDLE_WIDTH, out=self.paddle_x)
+
+        # Ball
+        self.ball_x[running] += self.ball_dx[running]
+        self.ball_y[running] += self.ball_dy[running]
+        left = np.rint(self.ball_x).astype(np.int64) - BALL_RADIUS
+        top = np.rint(self.ball_y).astype(np.int64) - BALL_RADIUS
+        right = left + BALL_SIZE
+        bottom = top + BALL_SIZE
+        self._collide_bricks(running, left, top, right, bottom)
+        self._collide_walls_and_paddle(running, left, top, right, bottom)
+        self._collide_boss(running, left, top, right, bottom)
+
+        # Life loss
+        lost = running & (bottom >= SCREEN_HEIGHT)
+        self.lives[lost] -= 1
+        game_over = lost & (self.lives <= 0)
+        self.done |= game_over
+        self._reset_bodies(lost & ~game_over)
+
+        # Stage clear
+        cleared = running & ~self.done & (self.bricks_left == 0) & (self.boss_hp <= 0)
+        if cleared.any():
+            next_level = self.level + 1
+            advance = cleared & (next_level + 1 < self.num_levels)
+            self._load_level(advance, next_level[advance])
+            finished = cleared & ~advance
+            self.done |= finished
+            self.won |= finished
+
+        return self.observe(), (self.score - score_before).astype(np.float32), self.done.copy()
+
+    def _collide_bricks(
+        self,
+        running: np.ndarray,
+        left: np.ndarray,
+        top: np.ndarray,
+        right: np.ndarray,
+        bottom: np.ndarray
+    ) -> None:
+        """Bounce balls off the first brick cell they overlap
+
+        Args:
+            running: Games being stepped
+            left, top, right, bottom: Ball rects
+        """
+        _, rows, cols = self.bricks.shape
+        if rows == 0:
+            return
+        first_col = left // BRICK_WIDTH
+        last_col = (right - 1) // BRICK_WIDTH
+        first_row = (top - BRICK_OFFSET_Y) // BRICK_HEIGHT
+        last_row = (bottom - 1 - BRICK_OFFSET_Y) // BRICK_HEIGHT
+        cell_rows = np.stack((first_row, first_row, last_row, last_row))
+        cell_cols = np.stack((first_col, last_col, first_col, last_col))
+        inside = (running & (cell_rows >= 0) & (cell_rows < rows)
+                  & (cell_cols >= 0) & (cell_cols < cols))
+        games = np.broadcast_to(np.arange(self.num_envs), cell_rows.shape)
+        hp = np.zeros(cell_rows.shape, dtype=np.int8)
+        hp[inside] = self.bricks[games[inside], cell_rows[inside], cell_cols[inside]]
+
+        occupied = hp != 0
+        touching = np.flatnonzero(occupied.any(axis=0))
+        if len(touching) == 0:
+            return
+        corner = occupied[:, touching].argmax(axis=0)
+        row = cell_rows[corner, touching]
+        col = cell_cols[corner, touching]
+        bl = col * BRICK_WIDTH
+        bt = row * BRICK_HEIGHT + BRICK_OFFSET_Y
+        br = bl + BRICK_WIDTH
+        bb = bt + BRICK_HEIGHT
+        overlap_x = np.minimum(right[touching], br) - np.maximum(left[touching], bl)
+        overlap_y = np.minimum(bottom[touching], bb) - np.maximum(top[touching], bt)
+        horizontal = overlap_x < overlap_y
+
+        away_x = np.where(self.ball_x[touching] * 2 < bl + br, -1.0, 1.0)
+        away_y = np.where(self.ball_y[touching] * 2 < bt + bb, -1.0, 1.0)
+        dx = self.ball_dx[touching]
+        dy = self.ball_dy[touching]
+        into = np.where(horizontal, dx * away_x < 0, dy * away_y < 0)
+        self.ball_dx[touching] = np.where(horizontal, np.abs(dx) * away_x, dx)
+        self.ball_dy[touching] = np.where(horizontal, dy, np.abs(dy) * away_y)
+
+        # Damage the brick (gold is indestructible)
+        hit = into & (hp[corner, touching] > 0)
+        games, row, col = touching[hit], row[hit], col[hit]
+        self.bricks[games, row, col] -= 1
+        destroyed = games[self.bricks[games, row, col] == 0]
+        self.bricks_left[destroyed] -= 1
+        self.score[destroyed] += POINTS_PER_BRICK
+
+    def _collide_walls_and_paddle(
+        self,
+        running: np.ndarray,
+        left: np.ndarray,
+        top: np.ndarray,
+        right: np.ndarray,
+        bottom: np.ndarray
+    ) -> None:
+        """Reflect balls off the walls and paddles
+
+        Args:
+            running: Games being stepped
+            left, top, right, bottom: Ball rects
+        """
+        dx, dy = self.ball_dx, self.ball_dy
+        wall_x = running & (((left <= 0) & (dx < 0)) | ((right >= SCREEN_WIDTH) & (dx > 0)))
+        wall_y = running & (top <= 0) & (dy < 0)
+        dx[wall_x] = -dx[wall_x]
+        dy[wall_y] = -dy[wall_y]
+
+        on_paddle = (
+            running & (dy > 0)
+            & (left < self.paddle_x + PADDLE_WIDTH) & (right > self.paddle_x)
+            & (top < PADDLE_TOP + PADDLE_HEIGHT) & (bottom > PADDLE_TOP)
+        )
+        hit_pos = (np.rint(self.ball_x[on_paddle]) - self.paddle_x[on_paddle]) / PADDLE_WIDTH
+        dx[on_paddle] = (hit_pos - 0.5) * PADDLE_HIT_ANGLE_RANGE
+        dy[on_paddle] = -np.abs(dy[on_paddle])
+
+    def _collide_boss(
+        self,
+        running: np.ndarray,
+        left: np.ndarray,
+        top: np.ndarray,
+        right: np.ndarray,
+        bottom: np.ndarray
+    ) -> None:
+        """Damage bosses touched by a ball
+
+        Args:
+            running: Games being stepped
+            left, top, right, bottom: Ball rects
+        """
+        hit = (
+            running & (self.boss_hp > 0)
+            & (left < BOSS_LEFT + BOSS_WIDTH) & (right > BOSS_LEFT)
+            & (top < BOSS_TOP + BOSS_HEIGHT) & (bottom > BOSS_TOP)
+        )
+        self.ball_dy[hit] = -self.ball_dy[hit]
+        self.boss_hp[hit] -= 1
+        self.score[hit & (self.boss_hp > 0)] += POINTS_PER_BOSS_HIT
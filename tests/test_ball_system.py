@@ -0,0 +1,150 @@
+"""Tests for the NumPy ball system"""
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from src.ball_system import BallSystem, BallView
+from src.brick_grid import BrickGrid
+from src.constants import (
+    BALL_RADIUS, BRICK_HEIGHT, BRICK_OFFSET_Y, BRICK_WIDTH, SCREEN_WIDTH, BrickType
+)
+from src.entities.ball import Ball
+from src.entities.brick import Brick
+from src.entities.paddle import Paddle
+from src.events import EventType
+from src.game_engine import GameEngine
+
+
+BALL_COUNT = 500
+
+
+def ball_at(x, y, dx, dy):
+    ball = Ball()
+    ball.set_center(x, y)
+    ball.dx = dx
+    ball.dy = dy
+    return ball
+
+
+def test_views_read_and_write_arrays():
+    system = BallSystem(capacity=1)
+    views = [system.append(ball_at(100 + i, 200, 3, -4)) for i in range(5)]
+
+    assert len(system) == 5
+    assert all(isinstance(view, BallView) for view in system)
+    views[3].dx = -7
+    views[3].reverse_dy()
+    assert system.vx[3] == -7
+    assert system.vy[3] == 4
+    assert views[4].get_center() == (104, 200)
+
+
+def test_remove_keeps_order_and_reindexes():
+    system = BallSystem()
+    views = [system.append(ball_at(100 + i, 200, 0, 0)) for i in range(4)]
+
+    system.remove(views[1])
+
+    assert list(system) == [views[0], views[2], views[3]]
+    assert [view.index for view in system] == [0, 1, 2]
+    assert views[1].index == -1
+    assert views[3].pos_x == 103
+    with pytest.raises(ValueError):
+        system.remove(views[1])
+
+
+def test_step_moves_and_bounces_off_walls():
+    system = BallSystem()
+    free = system.append(ball_at(400, 300, 3, 2))
+    wall = system.append(ball_at(BALL_RADIUS + 1, 300, -5, 0))
+
+    system.step(Paddle(), BrickGrid())
+
+    assert free.get_center() == (403, 302)
+    assert wall.dx == 5
+
+
+def test_step_hits_brick_once():
+    brick = Brick(360, 200, BrickType.NORMAL)
+    system = BallSystem()
+    ball = system.append(ball_at(400, 200 + 30 + BALL_RADIUS + 2, 0, -5))
+
+    hit, _ = system.step(Paddle(), BrickGrid([brick]))
+
+    assert hit == [brick]
+    assert ball.dy == 5
+
+
+def place_balls(rng, count, paddle):
+    """Random ball states, each set to touch one thing this tick
+
+    Returns (x, y, dx, dy, kind) tuples. Brick balls rise into the bottom
+    face of a gold brick in row 3, fully inside its column, so sweeping
+    and overlap resolution agree on the brick and the bounce.
+    """
+    brick_bottom = BRICK_OFFSET_Y + 4 * BRICK_HEIGHT
+    states = []
+    for index in range(count):
+        kind = ('free', 'side', 'top', 'paddle', 'brick')[index % 5]
+        speed = rng.uniform(3.0, 7.0)
+        if kind == 'free':
+            x, y = rng.uniform(100, 700), rng.uniform(250, 450)
+            dx, dy = rng.uniform(-5, 5), rng.choice((-speed, speed))
+        elif kind == 'side':
+            side = rng.choice((-1, 1))
+            x = SCREEN_WIDTH / 2 + side * (SCREEN_WIDTH / 2 - BALL_RADIUS - rng.uniform(0, 2))
+            y, dx, dy = rng.uniform(250, 450), side * speed, rng.uniform(-3, 3)
+        elif kind == 'top':
+            x, y = rng.uniform(100, 700), BALL_RADIUS + rng.uniform(0, 2)
+            dx, dy = rng.uniform(-3, 3), -speed
+        elif kind == 'paddle':
+            x = rng.uniform(paddle.rect.left + 5, paddle.rect.right - 5)
+            y = paddle.rect.top - BALL_RADIUS - rng.uniform(0.5, speed - 1.5)
+            dx, dy = 0.0, speed
+        else:
+            column = rng.randrange(SCREEN_WIDTH // BRICK_WIDTH)
+            x = column * BRICK_WIDTH + rng.uniform(BALL_RADIUS + 4, BRICK_WIDTH - BALL_RADIUS - 4)
+            y = brick_bottom + BALL_RADIUS + rng.uniform(0.5, speed - 1.5)
+            dx, dy = rng.uniform(-1, 1), -speed
+        states.append((x, y, dx, dy, kind))
+    return states
+
+
+def test_step_matches_scalar_path_with_balls_held():
+    levels = [["", "", "", "gggggggggg"]]
+    engines = [GameEngine(levels, headless=True, seed=1, vectorized_balls=vectorized)
+               for vectorized in (False, True)]
+    hits = []
+    for engine in engines:
+        engine.state.balls.clear()
+        for _ in range(BALL_COUNT):
+            engine.state.balls.append(Ball())
+        hit = set()
+        engine.events.subscribe(lambda events, hit=hit: hit.update(
+            event.subject.rect.topleft for event in events if event.type is EventType.BRICK_HIT))
+        hits.append(hit)
+    rng = random.Random(5)
+
+    for _ in range(10):
+        states = place_balls(rng, BALL_COUNT, engines[0].state.paddle)
+        for engine, hit in zip(engines, hits):
+            for ball, (x, y, dx, dy, _) in zip(engine.state.balls, states):
+                ball.set_center(x, y)
+                ball.dx, ball.dy = dx, dy
+            hit.clear()
+            engine.step()
+
+        scalar, vectorized = (list(engine.state.balls) for engine in engines)
+        assert len(scalar) == len(vectorized) == BALL_COUNT
+        for one, other, (_, _, dx, dy, kind) in zip(scalar, vectorized, states):
+            assert (one.dx, one.dy) == pytest.approx((other.dx, other.dy)), kind
+            if kind == 'side':
+                assert one.dx == -dx
+            elif kind != 'free':
+                assert one.dy == pytest.approx(-dy), kind
+            if kind not in ('paddle', 'brick'):  # Sweeping stops at the contact point
+                assert one.get_center() == pytest.approx(other.get_center()), kind
+        assert hits[0] == hits[1]
+        assert len(hits[0]) > 1
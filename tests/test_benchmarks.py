@@ -0,0 +1,83 @@
+"""Tests for benchmark scenarios and baseline comparison"""
+import pytest
+
+from benchmarks.harness import compare
+from benchmarks.scenarios import SCENARIOS
+from src.constants import SCREEN_WIDTH
+
+
+def scenario(name):
+    return next(scenario for scenario in SCENARIOS if scenario.name == name)
+
+
+BASELINE = {
+    'level_01': {'ticks_per_sec': 80000},
+    'multiball_50': {'ticks_per_sec': 8000},
+}
+
+
+def results(reference_speed, multiball_speed):
+    return [
+        {'scenario': 'level_01', 'ticks_per_sec': reference_speed},
+        {'scenario': 'multiball_50', 'ticks_per_sec': multiball_speed},
+        {'scenario': 'not_in_baseline', 'ticks_per_sec': 1},
+    ]
+
+
+def test_relative_comparison_ignores_machine_speed():
+    # Half as fast overall: absolute comparison flags it, relative does not
+    slow_machine = results(40000, 4000)
+    assert compare(slow_machine, BASELINE, 0.2, 'level_01') == []
+    assert len(compare(slow_machine, BASELINE, 0.2)) == 2
+
+
+def test_relative_comparison_flags_scenario_slowdown():
+    regressions = compare(results(40000, 2000), BASELINE, 0.2, 'level_01')
+    assert len(regressions) == 1
+    assert regressions[0].startswith('multiball_50')
+    assert '-50.0%' in regressions[0]
+
+
+def test_tolerance_is_applied():
+    assert compare(results(80000, 6500), BASELINE, 0.2, 'level_01') == []
+    assert len(compare(results(80000, 6500), BASELINE, 0.1, 'level_01')) == 1
+
+
+def test_missing_reference_raises():
+    with pytest.raises(ValueError):
+        compare(results(80000, 8000)[1:], BASELINE, 0.2, 'level_01')
+
+
+@pytest.mark.parametrize('name', ['multiball_50', 'vectorized_multiball_2000'])
+def test_multiball_scenarios_keep_their_balls(name):
+    if 'vectorized' in name:
+        pytest.importorskip('numpy')
+    held = scenario(name)
+    with held.build() as engine:
+        levels = set()
+        for _ in range(1500):
+            held.hold_balls(engine)
+            assert len(engine.state.balls) == held.balls
+            engine.step()
+            levels.add(engine.state.level)
+        held.hold_balls(engine)
+        held.check(engine)
+    assert len(levels) > 1  # The fan is served again after a level change
+
+
+def test_check_reports_lost_balls():
+    held = scenario('multiball_3')
+    with held.build() as engine:
+        engine.state.balls.remove(engine.state.balls[0])
+        with pytest.raises(RuntimeError):
+            held.check(engine)
+
+
+def test_dense_playfield_fits_above_the_paddle():
+    with scenario('dense_playfield_50').build() as engine:
+        paddle = engine.state.paddle
+        bricks = list(engine.state.bricks)
+        assert len(bricks) >= 100
+        assert all(0 <= brick.rect.left and brick.rect.right <= SCREEN_WIDTH for brick in bricks)
+        assert max(brick.rect.bottom for brick in bricks) < min(
+            ball.rect.top for ball in engine.state.balls) < paddle.rect.top
@@ -0,0 +1,118 @@
+"""Tests for the brick grid index and occupancy maps"""
+import pygame
+
+from data.levels import LEVELS
+from src.brick_grid import BrickGrid, TYPE_CODES
+from src.constants import BRICK_HEIGHT, BRICK_OFFSET_Y, BRICK_WIDTH, BrickType
+from src.entities.brick import Brick
+from src.game_state import GameState
+from src.level_format import compile_layout
+
+
+def brick(row, col, brick_type=BrickType.NORMAL):
+    return Brick(col * BRICK_WIDTH, row * BRICK_HEIGHT + BRICK_OFFSET_Y, brick_type)
+
+
+def set_cells(mask):
+    """Indices of the cells marked in a type map"""
+    return [index for index, value in enumerate(mask) if value]
+
+
+def test_occupancy_matches_bricks():
+    bricks = [brick(0, 0), brick(0, 2, BrickType.SILVER), brick(3, 1, BrickType.GOLD)]
+    grid = BrickGrid(bricks)
+
+    assert (grid.rows, grid.cols) == (4, 3)
+    assert grid.occupied(0, 0) and grid.occupied(0, 2) and grid.occupied(3, 1)
+    assert not grid.occupied(1, 1)
+    assert not grid.occupied(-1, 0) and not grid.occupied(0, 99)
+    assert set_cells(grid.type_mask(BrickType.NORMAL)) == [0]
+    assert set_cells(grid.type_mask(BrickType.SILVER)) == [2]
+    assert set_cells(grid.type_mask(BrickType.GOLD)) == [3 * 3 + 1]
+    assert grid.cell_types[2] == TYPE_CODES[BrickType.SILVER]
+
+
+def test_compiled_level_cells_match_occupancy():
+    level = compile_layout(LEVELS[0])
+    grid = BrickGrid(level.bricks())
+    for index, code in enumerate(level.cells):
+        row, col = divmod(index, level.cols)
+        assert grid.occupied(row, col) == bool(code)
+        if code:
+            assert grid.cell_types[row * grid.cols + col] == code
+
+
+def test_hit_and_remove_update_type_maps_and_count():
+    silver = brick(1, 1, BrickType.SILVER)
+    normal = brick(0, 0)
+    grid = BrickGrid([normal, silver, brick(2, 2, BrickType.GOLD)])
+    assert grid.destructible == 2
+
+    assert not grid.hit(silver)
+    assert grid.occupied(1, 1)
+    assert grid.hit(silver)
+    assert not grid.occupied(1, 1)
+    assert set_cells(grid.type_mask(BrickType.SILVER)) == []
+
+    before = grid.occupancy()
+    grid.hit(normal)
+    assert grid.occupancy() != before
+    assert set_cells(before[2][list(BrickType).index(BrickType.NORMAL)]) == [0]  # Unchanged
+    assert grid.destructible == 0
+    assert grid.is_clear()
+    assert len(grid) == 1
+
+
+def test_grid_grows_for_bricks_added_later():
+    grid = BrickGrid([brick(0, 0)])
+    grid.add(brick(5, 4, BrickType.SILVER))
+    assert (grid.rows, grid.cols) == (6, 5)
+    assert grid.occupied(0, 0) and grid.occupied(5, 4)
+    assert set_cells(grid.type_mask(BrickType.SILVER)) == [5 * 5 + 4]
+    assert set_cells(grid.type_mask(BrickType.NORMAL)) == [0]
+
+
+def test_query_returns_overlapping_bricks_once():
+    bricks = [brick(0, col) for col in range(4)]
+    grid = BrickGrid(bricks)
+    rect = pygame.Rect(BRICK_WIDTH - 5, BRICK_OFFSET_Y, BRICK_WIDTH + 10, 5)
+    assert grid.query(rect) == bricks[:3]
+    assert grid.first_overlapping(rect) is bricks[0]
+    assert grid.at(0, 3) is bricks[3]
+
+
+def test_stage_clear_ignores_gold_but_waits_for_boss():
+    state = GameState()
+    state.bricks = BrickGrid([brick(0, 0, BrickType.GOLD)])
+    state.boss = None
+    assert state.is_stage_clear()
+    state.bricks.add(brick(0, 1))
+    assert not state.is_stage_clear()
+    state.bricks.clear()
+    state.boss = object()
+    assert not state.is_stage_clear()
+
+
+def test_query_matches_brute_force_on_dense_grid():
+    bricks = [brick(row, col, BrickType.SILVER if (row + col) % 3 else BrickType.NORMAL)
+              for row in range(8) for col in range(10) if (row * 7 + col) % 4]
+    grid = BrickGrid(bricks)
+    for x in range(-40, 820, 37):
+        for y in range(0, 340, 23):
+            rect = pygame.Rect(x, y, 20 + x % 50, 20 + y % 40)
+            expected = [item for item in bricks if rect.colliderect(item.rect)]
+            assert sorted(map(id, grid.query(rect))) == sorted(map(id, expected))
+            first = grid.first_overlapping(rect)
+            assert (first is None) == (not expected)
+
+
+def test_overlapping_bricks_of_one_type_share_a_cell():
+    left = brick(0, 0)
+    shifted = Brick(BRICK_WIDTH // 2, BRICK_OFFSET_Y, BrickType.NORMAL)
+    grid = BrickGrid([left, shifted])
+    assert set_cells(grid.type_mask(BrickType.NORMAL)) == [0, 1]
+
+    grid.remove(left)
+    assert set_cells(grid.type_mask(BrickType.NORMAL)) == [0, 1]  # shifted still covers both
+    grid.remove(shifted)
+    assert set_cells(grid.type_mask(BrickType.NORMAL)) == []
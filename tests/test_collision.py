@@ -0,0 +1,111 @@
+"""Tests for swept ball collision"""
+import pytest
+
+from src.brick_grid import BrickGrid
+from src.constants import BALL_RADIUS, BRICK_HEIGHT, BrickType
+from src.entities.ball import Ball
+from src.entities.brick import Brick
+from src.entities.paddle import Paddle
+from src.managers.collision_manager import CollisionManager
+
+
+def ball_at(x, y, dx, dy):
+    ball = Ball()
+    ball.set_center(x, y)
+    ball.dx = dx
+    ball.dy = dy
+    return ball
+
+
+@pytest.mark.parametrize('speed', [10, 45, 90])
+def test_fast_ball_does_not_tunnel_through_brick(speed):
+    brick = Brick(360, 200, BrickType.NORMAL)
+    grid = BrickGrid([brick])
+    # Starts below the brick; moves further than its height in one tick
+    ball = ball_at(400, 200 + BRICK_HEIGHT + BALL_RADIUS + 5, 0, -speed)
+
+    hit, hit_paddle = CollisionManager.sweep_ball(ball, grid)
+
+    assert hit == [brick]
+    assert not hit_paddle
+    assert ball.dy == speed
+    assert ball.pos_y >= brick.rect.bottom + BALL_RADIUS - 1e-6
+
+
+def test_side_hit_reflects_dx():
+    brick = Brick(400, 200, BrickType.NORMAL)
+    grid = BrickGrid([brick])
+    ball = ball_at(400 - BALL_RADIUS - 5, 215, 40, 0)
+
+    hit, _ = CollisionManager.sweep_ball(ball, grid)
+
+    assert hit == [brick]
+    assert ball.dx == -40
+    assert ball.dy == 0
+    assert ball.pos_x <= brick.rect.left - BALL_RADIUS + 1e-6
+
+
+def test_earliest_brick_is_hit_first():
+    near = Brick(360, 200, BrickType.NORMAL)
+    far = Brick(360, 140, BrickType.NORMAL)
+    grid = BrickGrid([far, near])
+    ball = ball_at(400, 260, 0, -120)
+
+    hit, _ = CollisionManager.sweep_ball(ball, grid)
+
+    assert hit == [near]
+    assert ball.dy > 0
+
+
+def test_several_contacts_in_one_tick():
+    # A narrow gap between two bricks: the ball bounces off both walls
+    left = Brick(300, 200, BrickType.GOLD)
+    right = Brick(300 + 80 + BALL_RADIUS * 2 + 4, 200, BrickType.GOLD)
+    grid = BrickGrid([left, right])
+    ball = ball_at(left.rect.right + BALL_RADIUS + 1, 215, 60, 1)
+
+    hit, _ = CollisionManager.sweep_ball(ball, grid)
+
+    assert hit[:2] == [right, left]
+    assert left.rect.right + BALL_RADIUS - 1e-6 \
+        <= ball.pos_x <= right.rect.left - BALL_RADIUS + 1e-6
+
+
+def test_fast_ball_does_not_tunnel_through_paddle():
+    paddle = Paddle()
+    ball = ball_at(paddle.rect.centerx, paddle.rect.top - BALL_RADIUS - 5, 0, 60)
+
+    hit, hit_paddle = CollisionManager.sweep_ball(ball, BrickGrid(), paddle)
+
+    assert hit == []
+    assert hit_paddle
+    assert ball.dy < 0
+    assert ball.rect.bottom <= paddle.rect.top + 1
+
+
+def test_free_motion_keeps_sub_pixel_position():
+    ball = ball_at(100.0, 400.0, 0.25, -0.25)
+    for _ in range(4):
+        CollisionManager.sweep_ball(ball, BrickGrid())
+    assert ball.get_center() == (101.0, 399.0)
+
+
+def test_caught_ball_does_not_move():
+    ball = ball_at(100, 400, 5, -5)
+    ball.is_caught = True
+    assert CollisionManager.sweep_ball(ball, BrickGrid()) == ([], False)
+    assert ball.get_center() == (100, 400)
+
+
+def test_paddle_catches_one_ball_at_a_time():
+    paddle = Paddle()
+    paddle.catch_active = True
+    balls = [ball_at(paddle.rect.centerx + offset, paddle.rect.top - BALL_RADIUS - 2, 0, 5)
+             for offset in (-20, 20)]
+
+    for ball in balls:
+        CollisionManager.sweep_ball(ball, BrickGrid(), paddle)
+
+    assert [ball.is_caught for ball in balls] == [True, False]
+    assert paddle.caught_ball is balls[0]
+    assert balls[1].dy < 0
@@ -0,0 +1,46 @@
+"""Tests for the small slotted entities"""
+import pytest
+
+from src.constants import BrickType, PowerUpType
+from src.entities import bomb, enemy, laser, powerup
+from src.entities.brick import Brick
+
+
+def make_entities():
+    return [
+        enemy.Enemy(100),
+        laser.Laser(100, 500),
+        bomb.Bomb(100, 100),
+        powerup.PowerUp(100, 100, PowerUpType.SLOW),
+    ]
+
+
+@pytest.mark.parametrize('entity', make_entities() + [Brick(0, 0, BrickType.SILVER)],
+                         ids=lambda entity: type(entity).__name__)
+def test_entities_have_no_instance_dict(entity):
+    assert not hasattr(entity, '__dict__')
+
+
+@pytest.mark.parametrize('module, name, sign', [
+    (enemy, 'ENEMY_SPEED', 1),
+    (laser, 'LASER_SPEED', -1),
+    (bomb, 'BOMB_SPEED', 1),
+    (powerup, 'POWERUP_SPEED', 1),
+])
+def test_speed_is_read_when_spawned(monkeypatch, module, name, sign):
+    monkeypatch.setattr(module, name, 11)
+    entity = next(item for item in make_entities() if type(item).__module__ == module.__name__)
+    y = entity.rect.y
+
+    entity.move()
+
+    assert entity.dy == 11 * sign
+    assert entity.rect.y == y + 11 * sign
+
+
+def test_silver_brick_color_follows_damage():
+    brick = Brick(0, 0, BrickType.SILVER)
+    color = brick.color
+    assert not brick.hit()
+    assert brick.color != color
+    assert brick.hit()
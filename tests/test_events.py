@@ -0,0 +1,102 @@
+"""Tests for the gameplay event bus"""
+import pytest
+
+from src.constants import POINTS_PER_BOSS_HIT, POINTS_PER_BRICK, POINTS_PER_ENEMY
+from src.events import EventBus, EventSource, EventType
+from src.game_engine import GameEngine
+from tests.test_game_engine import build_engine
+
+
+def test_dispatch_delivers_batch_in_order_then_clears():
+    bus = EventBus(capacity=2)
+    seen = []
+    bus.subscribe(lambda events: seen.append(
+        [(event.type, event.subject, event.source) for event in events]))
+    bus.subscribe(lambda events: seen.append(len(events)))
+    bus.emit(EventType.BRICK_HIT, 'a', EventSource.BALL)
+    bus.emit(EventType.LIFE_LOST)
+    bus.emit(EventType.BALL_BOUNCE, 'b', EventSource.BALL)  # Grows the buffer
+
+    bus.dispatch()
+
+    assert seen == [
+        [(EventType.BRICK_HIT, 'a', EventSource.BALL),
+         (EventType.LIFE_LOST, None, None),
+         (EventType.BALL_BOUNCE, 'b', EventSource.BALL)],
+        3,
+    ]
+    assert len(bus) == 0
+    assert all(event.subject is None for event in bus._events)
+
+
+def test_empty_dispatch_skips_subscribers():
+    bus = EventBus()
+    calls = []
+    bus.subscribe(calls.append)
+    bus.dispatch()
+    assert calls == []
+
+
+def test_unsubscribe_and_clear():
+    bus = EventBus()
+    calls = []
+    bus.subscribe(calls.append)
+    bus.unsubscribe(calls.append)
+    with pytest.raises(ValueError):
+        bus.unsubscribe(calls.append)
+
+    bus.emit(EventType.LEVEL_CLEARED)
+    bus.dispatch()
+    bus.emit(EventType.LEVEL_CLEARED)
+    bus.clear()
+    assert calls == [] and len(bus) == 0
+
+
+def test_score_matches_dispatched_events():
+    engine = build_engine()
+    points = {
+        EventType.BRICK_DESTROYED: POINTS_PER_BRICK,
+        EventType.ENEMY_KILLED: POINTS_PER_ENEMY,
+        EventType.BOSS_HIT: POINTS_PER_BOSS_HIT,
+    }
+    counted = []
+    engine.events.subscribe(
+        lambda events: counted.extend(points.get(event.type, 0) for event in events))
+
+    engine.run_headless(2000)
+
+    assert engine.state.score > 0
+    assert engine.state.score == sum(counted)
+
+
+@pytest.mark.parametrize('start_level', [0, 2])
+def test_level_cleared_is_dispatched_in_the_clearing_tick(start_level):
+    # Empty layouts are cleared on the first tick; level 2 is the last one
+    engine = GameEngine([[], [], []], headless=True, seed=1, start_level=start_level)
+    cleared = []
+    engine.events.subscribe(lambda events: cleared.extend(
+        event for event in events if event.type is EventType.LEVEL_CLEARED))
+
+    engine.step()
+
+    assert len(cleared) == 1
+    assert engine.running == (start_level == 0)
+
+
+def test_profiler_counts_dispatched_events():
+    engine = build_engine()
+    counted = {}
+
+    def count(events):
+        for event in events:
+            counted[event.type.value] = counted.get(event.type.value, 0) + 1
+
+    engine.events.subscribe(count)
+    profiler = engine.enable_profiling()
+
+    engine.run_headless(500)
+
+    assert profiler.event_counts == counted
+    assert profiler.event_counts[EventType.BALL_BOUNCE.value] > 0
+    engine.disable_profiling()
+    assert profiler.count_events not in engine.events._subscribers
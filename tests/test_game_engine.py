@@ -0,0 +1,144 @@
+"""Tests for the game engine loop and headless stepping"""
+import pygame
+import pytest
+
+from data.levels import LEVELS
+from src import game_engine
+from src.constants import SCREEN_HEIGHT, TICK_RATE, PowerUpType
+from src.game_engine import GameEngine
+from src.managers.input_manager import AutopilotInput
+
+
+def build_engine(seed=7, **kwargs):
+    autopilot = AutopilotInput(fire_interval=15, jitter=20, seed=seed)
+    engine = GameEngine(LEVELS, headless=True, input_manager=autopilot, seed=seed, **kwargs)
+    autopilot.engine = engine
+    return engine
+
+
+def digests(engine, ticks):
+    result = []
+    for _ in range(ticks):
+        engine.step()
+        result.append(engine.state.digest())
+    return result
+
+
+class FakeClock:
+    """perf_counter replacement that advances a fixed amount per call"""
+
+    def __init__(self, step):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def ticks_per_loop(monkeypatch, game_speed, loops=4):
+    """Run the real-time loop on a fake clock and count physics ticks"""
+    monkeypatch.setattr(game_engine.time, 'perf_counter', FakeClock(0.1))
+    engine = build_engine(game_speed=game_speed, render_fps=0, max_catch_up_steps=1000)
+    step = engine.step
+    ticks = []
+
+    def counting_step():
+        ticks.append(None)
+        step()
+
+    engine.step = counting_step
+    iterations = []
+
+    def counting_draw(alpha):
+        iterations.append(len(ticks))
+        if len(iterations) == loops:
+            engine.running = False
+            engine.quit_requested = True
+
+    engine._draw = counting_draw
+    with pytest.raises(SystemExit):
+        engine.run()
+    return [b - a for a, b in zip(iterations, iterations[1:])]
+
+
+@pytest.mark.parametrize('game_speed', [0.5, 1.0, 2.0])
+def test_run_scales_ticks_per_real_second_with_game_speed(monkeypatch, game_speed):
+    per_loop = ticks_per_loop(monkeypatch, game_speed)
+    expected = round(0.1 * TICK_RATE * game_speed)
+    assert all(abs(count - expected) <= 1 for count in per_loop)
+
+
+def test_game_speed_does_not_change_simulation():
+    assert digests(build_engine(game_speed=0.5), 300) == digests(build_engine(game_speed=2.0), 300)
+
+
+@pytest.mark.parametrize('game_speed', [0, -1.0])
+def test_game_speed_must_be_positive(game_speed):
+    with pytest.raises(ValueError):
+        build_engine(game_speed=game_speed)
+
+
+def test_same_seed_and_input_reproduce_every_tick():
+    assert digests(build_engine(seed=11), 600) == digests(build_engine(seed=11), 600)
+
+
+def test_different_seeds_diverge():
+    assert digests(build_engine(seed=1), 600) != digests(build_engine(seed=2), 600)
+
+
+def test_break_capsule_advances_level_once():
+    engine = build_engine()
+    paddle = engine.state.paddle
+    engine.state.power_ups.acquire(paddle.rect.centerx, paddle.rect.top, PowerUpType.BREAK)
+    engine.state.power_ups.acquire(paddle.rect.centerx, paddle.rect.top, PowerUpType.PLAYER)
+    lives = engine.state.lives
+
+    engine.step()
+
+    assert engine.state.level == 1
+    assert len(engine.state.power_ups) == 0
+    assert engine.state.lives == lives  # Capsules after the BREAK are dropped
+    assert engine.running
+
+
+def test_break_capsule_on_last_level_wins():
+    engine = build_engine(start_level=len(LEVELS) - 1)
+    paddle = engine.state.paddle
+    engine.state.power_ups.acquire(paddle.rect.centerx, paddle.rect.top, PowerUpType.BREAK)
+
+    engine.step()
+
+    assert not engine.running
+    assert not engine.state.is_game_over()
+
+
+def test_start_level():
+    engine = build_engine(start_level=3)
+    assert engine.state.level == 3
+    assert len(engine.state.bricks) == sum(len(row.replace(' ', '')) for row in LEVELS[3])
+
+    engine.reset(seed=1, start_level=2)
+    assert engine.state.level == 2
+    with pytest.raises(ValueError):
+        engine.reset(start_level=len(LEVELS))
+    with pytest.raises(ValueError):
+        build_engine(start_level=-1)
+
+
+def test_headless_engine_needs_no_display():
+    pygame.quit()
+    engine = build_engine()
+    assert engine.screen is None
+    assert not pygame.display.get_init()
+    assert engine.run_headless(200) == 200
+    assert engine.state.digest()
+
+
+def test_run_headless_stops_at_game_over():
+    engine = build_engine()
+    engine.state.lives = 1
+    for ball in engine.state.balls:
+        ball.set_center(ball.rect.centerx, SCREEN_HEIGHT + 100)
+    assert engine.run_headless(1000) == 1
+    assert engine.state.is_game_over()
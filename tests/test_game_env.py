@@ -0,0 +1,123 @@
+"""Tests for the single-game learning environment"""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from data.levels import LEVELS
+from src.constants import SCREEN_HEIGHT
+from src.game_env import ACTION_FIRE, FEATURE_FIELDS, FEATURE_SIZE, GameEnv
+from src.vector_env import ACTION_LEFT, ACTION_NOOP
+
+
+def play(env, actions):
+    """Step through actions, stopping at the end of the game"""
+    steps = []
+    for action in actions:
+        steps.append(env.step(action))
+        if steps[-1][2]:
+            break
+    return steps
+
+
+def test_reset_and_step_shapes():
+    env = GameEnv(LEVELS)
+    obs, info = env.reset(seed=1)
+    assert obs.shape == (FEATURE_SIZE,) and obs.dtype == np.float32
+    assert info['seed'] == 1 and info['steps'] == 0
+
+    obs, reward, terminated, truncated, info = env.step(ACTION_LEFT)
+    assert obs.shape == (FEATURE_SIZE,)
+    assert isinstance(reward, float)
+    assert not terminated and not truncated
+    assert info['steps'] == 1
+    assert obs[FEATURE_FIELDS.index('lives')] == info['lives']
+
+
+def test_same_seed_and_actions_reproduce_episode():
+    actions = [ACTION_FIRE, ACTION_LEFT, ACTION_NOOP] * 100
+    first, second = GameEnv(LEVELS), GameEnv(LEVELS)
+    first.reset(seed=3)
+    second.reset(seed=3)
+    steps_a, steps_b = play(first, actions), play(second, actions)
+    assert len(steps_a) == len(steps_b)
+    for (obs_a, reward_a, *_), (obs_b, reward_b, *_) in zip(steps_a, steps_b):
+        assert np.array_equal(obs_a, obs_b)
+        assert reward_a == reward_b
+
+
+def test_observations_are_copies():
+    env = GameEnv(LEVELS)
+    obs, _ = env.reset(seed=1)
+    kept = obs.copy()
+    env.step(ACTION_LEFT)
+    assert np.array_equal(obs, kept)
+
+
+def lose_last_life(env):
+    env.engine.state.lives = 1
+    for ball in env.engine.state.balls:
+        ball.set_center(ball.rect.centerx, SCREEN_HEIGHT + 100)
+    return env.step(ACTION_NOOP)
+
+
+def test_step_after_termination_raises_until_reset():
+    env = GameEnv(LEVELS)
+    env.reset(seed=1)
+    _, reward, terminated, _, info = lose_last_life(env)
+    assert terminated
+    assert reward == -env.life_reward
+    assert info['lives'] == 0
+
+    with pytest.raises(RuntimeError):
+        env.step(ACTION_NOOP)
+
+    env.reset(seed=1)
+    assert not env.step(ACTION_NOOP)[2]
+
+
+def test_truncation():
+    env = GameEnv(LEVELS, max_episode_steps=3)
+    env.reset(seed=1)
+    assert [step[3] for step in play(env, [ACTION_NOOP] * 3)] == [False, False, True]
+
+
+def test_pixel_observations():
+    env = GameEnv(LEVELS, pixel_size=(84, 64))
+    obs, _ = env.reset(seed=1)
+    assert obs['features'].shape == (FEATURE_SIZE,)
+    assert obs['pixels'].shape == (64, 84) and obs['pixels'].dtype == np.uint8
+    assert obs['pixels'].any()
+    with pytest.raises(RuntimeError):
+        GameEnv(LEVELS).pixels()
+
+
+def scanned_features(state):
+    """Ball and capsule features found by walking the entity lists"""
+    ball = max(state.balls, key=lambda ball: ball.pos_y, default=None)
+    capsule = max(state.power_ups, key=lambda powerup: powerup.rect.bottom, default=None)
+    ball_features = [0] * 5 if ball is None else \
+        [ball.pos_x, ball.pos_y, ball.dx, ball.dy, float(ball.is_caught)]
+    capsule_features = [-1, -1] if capsule is None else list(capsule.rect.center)
+    return ball_features, capsule_features
+
+
+def test_tracked_features_match_a_full_scan():
+    env = GameEnv(LEVELS, frame_skip=1)
+    env.reset(seed=5)
+    actions = [ACTION_FIRE, ACTION_LEFT, ACTION_NOOP, ACTION_NOOP] * 750
+    capsules_seen = 0
+    for action in actions:
+        obs, _, terminated, _, _ = env.step(action)
+        balls, capsules = scanned_features(env.engine.state)
+        assert list(obs[2:7]) == pytest.approx(balls)
+        assert list(obs[12:14]) == capsules
+        capsules_seen += capsules[0] != -1
+        if terminated:
+            break
+    assert capsules_seen > 0
+
+
+def test_close_through_context_manager():
+    with GameEnv(LEVELS) as env:
+        env.reset(seed=1)
+    assert env.engine.level_manager._executor is None
@@ -0,0 +1,79 @@
+"""Tests for the compiled level format and the level cache"""
+import pytest
+
+from data.levels import LEVELS
+from src.constants import BRICK_HEIGHT, BRICK_OFFSET_Y, BRICK_WIDTH, BrickType
+from src.level_format import LEVEL_HEADER, CompiledLevel, compile_layout
+from src.managers.level_manager import LevelManager
+
+
+def layout_bricks(layout):
+    """Brick (x, y, type) triples read straight from a string layout"""
+    return [
+        (col * BRICK_WIDTH, row * BRICK_HEIGHT + BRICK_OFFSET_Y, BrickType(char))
+        for row, line in enumerate(layout)
+        for col, char in enumerate(line)
+        if char in 'nsg'
+    ]
+
+
+@pytest.mark.parametrize('index', range(len(LEVELS)))
+def test_compiled_bricks_match_layout(index):
+    bricks = compile_layout(LEVELS[index]).bricks()
+    assert [(brick.rect.x, brick.rect.y, brick.type) for brick in bricks] \
+        == layout_bricks(LEVELS[index])
+
+
+def test_short_rows_and_unknown_characters_are_empty():
+    level = compile_layout(["n", "sgx", "é"])
+    assert (level.rows, level.cols) == (3, 3)
+    assert bytes(level.cells) == bytes([1, 0, 0, 2, 3, 0, 0, 0, 0])
+
+
+def test_round_trip_from_buffer_at_offset():
+    level = compile_layout(LEVELS[0])
+    data = b'pad' + level.to_bytes() + b'tail'
+
+    loaded = CompiledLevel.from_buffer(data, 3)
+
+    assert isinstance(loaded.cells, memoryview)
+    assert (loaded.rows, loaded.cols, bytes(loaded.cells)) == (level.rows, level.cols, level.cells)
+
+
+@pytest.mark.parametrize('data', [
+    b'VCLV',
+    b'XXXX' + compile_layout(["nn"]).to_bytes()[4:],
+    compile_layout(["nn"]).to_bytes()[:4] + b'\x09' + compile_layout(["nn"]).to_bytes()[5:],
+    compile_layout(["nnnn"]).to_bytes()[:-1],
+])
+def test_from_buffer_rejects_bad_data(data):
+    with pytest.raises(ValueError):
+        CompiledLevel.from_buffer(data)
+
+
+def test_empty_layout():
+    level = compile_layout([])
+    assert len(level.to_bytes()) == LEVEL_HEADER.size
+    assert CompiledLevel.from_buffer(level.to_bytes()).bricks() == []
+
+
+def test_level_cache_evicts_least_recently_used():
+    manager = LevelManager(LEVELS, cache_size=2)
+    first = manager.get_compiled_level(0)
+    manager.get_compiled_level(1)
+    assert manager.get_compiled_level(0) is first
+    manager.get_compiled_level(2)
+
+    assert list(manager._compiled) == [0, 2]
+    assert manager.get_compiled_level(0) is first
+
+
+def test_load_level_builds_fresh_bricks():
+    manager = LevelManager(LEVELS)
+    bricks = manager.load_level(0)
+    bricks[0].hit()
+
+    again = manager.load_level(0)
+    assert again[0] is not bricks[0]
+    assert again[0].hits == compile_layout(LEVELS[0]).bricks()[0].hits
+    assert manager.load_level(len(LEVELS)) == []
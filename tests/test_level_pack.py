@@ -0,0 +1,102 @@
+"""Tests for level pack files and background prefetch"""
+import threading
+import zlib
+
+import pytest
+
+from data.levels import LEVELS
+from src.game_engine import GameEngine
+from src.level_format import compile_layout
+from src.level_pack import PACK_HEADER, LevelPack, write_level_pack
+from src.managers.input_manager import AutopilotInput
+from src.managers.level_manager import LevelManager
+
+
+@pytest.fixture
+def pack_path(tmp_path):
+    path = str(tmp_path / 'levels.vclp')
+    assert write_level_pack(path, iter(LEVELS)) == len(LEVELS)
+    return path
+
+
+def test_pack_levels_match_compiled_layouts(pack_path):
+    with LevelPack(pack_path) as pack:
+        assert len(pack) == len(LEVELS)
+        for index, layout in enumerate(LEVELS):
+            assert bytes(pack[index].cells) == compile_layout(layout).cells
+        assert pack[-1] == pack[len(LEVELS) - 1]
+        with pytest.raises(IndexError):
+            pack[len(LEVELS)]
+        with pytest.raises(IndexError):
+            pack[-len(LEVELS) - 1]
+
+
+def test_pack_checksum_covers_level_records(pack_path):
+    expected = 0
+    for layout in LEVELS:
+        expected = zlib.crc32(compile_layout(layout).to_bytes(), expected)
+    with LevelPack(pack_path) as pack:
+        assert pack.checksum == expected
+
+
+def test_empty_pack(tmp_path):
+    path = str(tmp_path / 'empty.vclp')
+    assert write_level_pack(path, []) == 0
+    with LevelPack(path) as pack:
+        assert len(pack) == 0
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data: data[:PACK_HEADER.size - 1],
+    lambda data: b'XXXX' + data[4:],
+    lambda data: data[:-1],
+], ids=['header', 'magic', 'index'])
+def test_bad_pack_raises(tmp_path, pack_path, corrupt):
+    with open(pack_path, 'rb') as pack_file:
+        data = pack_file.read()
+    path = tmp_path / 'bad.vclp'
+    path.write_bytes(corrupt(data))
+
+    with pytest.raises(ValueError):
+        LevelPack(str(path))
+
+
+def test_prefetch_reads_next_level(pack_path):
+    with LevelPack(pack_path) as pack:
+        manager = LevelManager(pack)
+        assert manager.prefetch_next
+        try:
+            manager.load_level(0)
+            future = manager._pending[1]
+            next_level = future.result()
+            assert manager.get_compiled_level(1) is next_level
+            assert not manager._pending
+
+            manager.load_level(len(LEVELS) - 1)
+            assert not manager._pending
+        finally:
+            manager.close()
+
+
+def test_engine_close_stops_prefetch_thread(pack_path):
+    with LevelPack(pack_path) as pack:
+        with GameEngine(pack, headless=True, seed=1) as engine:
+            assert any(thread.name.startswith('level-prefetch')
+                       for thread in threading.enumerate())
+        assert engine.level_manager._executor is None
+        assert not any(thread.name.startswith('level-prefetch')
+                       for thread in threading.enumerate())
+
+
+def play(level_data):
+    autopilot = AutopilotInput(fire_interval=15, jitter=20, seed=3)
+    engine = GameEngine(level_data, headless=True, input_manager=autopilot, seed=3)
+    autopilot.engine = engine
+    with engine:
+        engine.run_headless(1500)
+    return engine.state.digest()
+
+
+def test_engine_on_pack_matches_level_list(pack_path):
+    with LevelPack(pack_path) as pack:
+        assert play(pack) == play(LEVELS)
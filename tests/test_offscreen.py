@@ -0,0 +1,82 @@
+"""Tests for offscreen rendering and frame export"""
+import pygame
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from src.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.rendering.offscreen import (
+    GRAY_WEIGHTS, ImageSequenceWriter, OffscreenRenderer, RawVideoWriter, open_frame_writer
+)
+from src.rendering.renderer import Renderer
+from tests.test_game_engine import build_engine
+
+
+@pytest.fixture
+def engine():
+    pygame.font.init()
+    engine = build_engine()
+    engine.run_headless(200)
+    engine._store_previous_positions()
+    engine.step()
+    return engine
+
+
+def test_full_size_frame_matches_renderer(engine):
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
+    Renderer(screen).draw(engine.state, 0.5)
+
+    frame = OffscreenRenderer().to_array(engine.state, 0.5)
+
+    assert frame.shape == (SCREEN_HEIGHT, SCREEN_WIDTH, 3)
+    assert frame.tobytes() == pygame.image.tobytes(screen, 'RGB')
+
+
+def test_grayscale_uses_luma_weights(engine):
+    color = OffscreenRenderer((84, 84)).to_array(engine.state).astype(np.uint32)
+    gray = OffscreenRenderer((84, 84), grayscale=True).to_array(engine.state)
+
+    expected = (color * np.array(GRAY_WEIGHTS)).sum(axis=2) >> 8
+    assert gray.shape == (84, 84) and gray.dtype == np.uint8
+    assert np.array_equal(gray, expected)
+
+
+def test_batch_fills_given_array(engine):
+    renderer = OffscreenRenderer((160, 120), hud=False)
+    out = np.zeros((2,) + renderer.shape, dtype=np.uint8)
+
+    frames = renderer.render_batch([engine.state, engine.state], out=out)
+
+    assert frames is out and out.shape == (2, 120, 160, 3)
+    assert np.array_equal(out[0], renderer.to_array(engine.state))
+    assert out.any()
+
+
+def test_raw_video_writer(tmp_path):
+    path = str(tmp_path / 'clip.raw')
+    with RawVideoWriter(path) as writer:
+        with pytest.raises(ValueError):
+            writer.ffmpeg_command(30)
+        writer.write(np.zeros((4, 6), dtype=np.uint8))
+        writer.write(np.ones((4, 6), dtype=np.uint8))
+        with pytest.raises(ValueError):
+            writer.write(np.zeros((4, 6, 3), dtype=np.uint8))
+        command = writer.ffmpeg_command(30)
+
+    assert '-pixel_format gray' in command and '-video_size 6x4' in command
+    assert (tmp_path / 'clip.raw').read_bytes() == bytes(24) + bytes([1]) * 24
+
+
+def test_image_sequence_writer(tmp_path):
+    pattern = str(tmp_path / 'frames' / '{:03d}.png')
+    with open_frame_writer(pattern) as writer:
+        assert isinstance(writer, ImageSequenceWriter)
+        frame = np.zeros((5, 7, 3), dtype=np.uint8)
+        frame[1, 2] = (10, 20, 30)
+        writer.write(frame)
+        writer.write(frame[..., 0])
+
+    image = pygame.image.load(pattern.format(0))
+    assert image.get_size() == (7, 5)
+    assert tuple(image.get_at((2, 1)))[:3] == (10, 20, 30)
+    assert (tmp_path / 'frames' / '001.png').exists()
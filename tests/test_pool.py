@@ -0,0 +1,94 @@
+"""Tests for EntityList removal and EntityPool recycling"""
+import pytest
+
+from src.entities.laser import Laser
+from src.pool import EntityPool
+
+
+def make_pool(capacity=2):
+    return EntityPool(lambda: Laser(0, 0), capacity)
+
+
+def test_acquire_uses_preallocated_entities():
+    pool = make_pool(2)
+    lasers = [pool.acquire(100, 500), pool.acquire(200, 500)]
+
+    assert list(pool) == lasers
+    assert lasers[0].rect.centerx == 100
+    assert pool.stats() == {'active': 2, 'free': 0, 'capacity': 2, 'peak': 2, 'reused': 2}
+
+    pool.acquire(300, 500)
+    assert pool.stats()['capacity'] == 3
+
+
+def test_released_entity_is_reset_on_reuse():
+    pool = make_pool(1)
+    laser = pool.acquire(100, 500)
+    laser.move()
+    pool.release(laser)
+
+    assert len(pool) == 0
+    assert laser.pool_index == -1
+    again = pool.acquire(300, 400)
+    assert again is laser
+    assert again.rect.topleft == Laser(300, 400).rect.topleft
+
+
+def test_release_rejects_entity_not_in_play():
+    pool = make_pool(1)
+    laser = pool.acquire(100, 500)
+    pool.release(laser)
+
+    with pytest.raises(ValueError):
+        pool.release(laser)
+    with pytest.raises(ValueError):
+        make_pool(0).release(Laser(0, 0))
+
+
+def test_clear_returns_everything_to_the_free_list():
+    pool = make_pool(0)
+    for x in range(5):
+        pool.acquire(x, 0)
+    pool.clear()
+
+    assert pool.stats() == {'active': 0, 'free': 5, 'capacity': 5, 'peak': 5, 'reused': 0}
+
+
+def test_discard_while_iterating_visits_every_entity_once():
+    pool = make_pool(0)
+    lasers = [pool.acquire(x, 0) for x in range(8)]
+    visited = []
+
+    for laser in pool:
+        visited.append(laser)
+        if laser.rect.centerx % 2 == 0:
+            pool.discard(laser)
+        if laser.rect.centerx == 1:
+            pool.discard(lasers[7])  # Another entity, not yet visited
+    pool.flush()
+
+    assert visited == lasers[:7]
+    survivors = [laser for laser in lasers if laser.rect.centerx in (1, 3, 5)]
+    assert sorted(pool, key=lambda laser: laser.rect.centerx) == survivors
+    assert all(pool[index].pool_index == index for index in range(len(pool)))
+    assert pool.stats()['free'] == 5
+
+
+def test_discarded_entity_is_hidden_before_flush():
+    pool = make_pool(0)
+    first, second = pool.acquire(0, 0), pool.acquire(1, 0)
+    pool.discard(first)
+
+    assert len(pool) == 1
+    assert list(pool) == [second]
+    with pytest.raises(ValueError):
+        pool.discard(first)
+
+
+def test_remove_swaps_last_entity_into_slot():
+    pool = make_pool(0)
+    first, second, third = (pool.acquire(x, 0) for x in range(3))
+    pool.remove(first)
+
+    assert pool.active == [third, second]
+    assert third.pool_index == 0
@@ -0,0 +1,81 @@
+"""Tests for frame profiling"""
+import csv
+import json
+
+from src import profiler as profiler_module
+from src.profiler import FrameProfiler
+from tests.test_game_engine import build_engine
+
+
+class StepClock:
+    """perf_counter_ns replacement advancing one millisecond per call"""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1_000_000
+        return self.now
+
+
+def test_percentiles_over_rolling_window(monkeypatch):
+    profiler = FrameProfiler(['work'], window=100)
+    assert profiler.percentiles() == (0.0, 0.0, 0.0)
+    # 150 frames lasting 1..150 ms; the window keeps the last 100
+    times = []
+    for duration in range(1, 151):
+        times += [0, duration * 1_000_000]
+    monkeypatch.setattr(profiler_module.time, 'perf_counter_ns', iter(times).__next__)
+    for _ in range(150):
+        profiler.begin_frame()
+        profiler.end_frame()
+    assert profiler.percentiles() == (101.0, 145.0, 149.0)
+
+
+def test_wrapped_phases_are_timed_per_frame(monkeypatch):
+    monkeypatch.setattr(profiler_module.time, 'perf_counter_ns', StepClock())
+    profiler = FrameProfiler(['a', 'b'], window=8)
+    a = profiler.wrap('a', lambda value: value * 2)
+    b = profiler.wrap('b', lambda: None)
+
+    profiler.begin_frame()
+    assert a(4) == 8
+    a(1)
+    b()
+    profiler.end_frame()
+
+    assert profiler.percentiles('a')[0] == 2.0
+    assert profiler.percentiles('b')[0] == 1.0
+    assert profiler.totals_ns == {'a': 2_000_000, 'b': 1_000_000}
+    assert len(profiler.overlay_lines()) == 3
+
+
+def test_trace_files(tmp_path):
+    for name in ('trace.csv', 'trace.jsonl'):
+        path = tmp_path / name
+        profiler = FrameProfiler(['a'], trace_path=str(path))
+        for _ in range(3):
+            profiler.begin_frame()
+            profiler.end_frame()
+        profiler.close()
+        if name.endswith('.csv'):
+            rows = list(csv.reader(path.open()))
+            assert rows[0] == ['frame', 'frame_ms', 'a'] and len(rows) == 4
+        else:
+            records = [json.loads(line) for line in path.open()]
+            assert [record['frame'] for record in records] == [1, 2, 3]
+
+
+def test_engine_profiling_can_be_enabled_and_disabled():
+    engine = build_engine()
+    expected = build_engine()
+    profiler = engine.enable_profiling()
+    engine.run_headless(50)
+    expected.run_headless(50)
+    assert profiler.frame_count == 50
+    assert profiler.totals_ns['balls'] > 0
+    assert engine.state.digest() == expected.state.digest()
+
+    engine.disable_profiling()
+    assert engine.profiler is None
+    assert not any(name in vars(engine) for name in engine.PROFILED_PHASES.values())
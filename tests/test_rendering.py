@@ -0,0 +1,75 @@
+"""Tests for text caching and rendering"""
+import pygame
+import pytest
+
+from data.levels import LEVELS
+from src.constants import WHITE
+from src.game_engine import GameEngine
+from src.managers.input_manager import AutopilotInput
+from src.rendering.dirty_renderer import DirtyRectRenderer
+from src.rendering.hud import HudLabel
+from src.rendering.renderer import Renderer
+from src.rendering.text_cache import TextCache
+
+
+@pytest.fixture(autouse=True)
+def fonts():
+    pygame.font.init()
+    yield
+
+
+def test_text_cache_reuses_surfaces_and_fonts():
+    cache = TextCache()
+    first = cache.render("Score: 10", WHITE)
+    assert cache.render("Score: 10", WHITE) is first
+    assert cache.render("Score: 10", (255, 0, 0)) is not first
+    assert cache.get_font(20) is cache.get_font(20)
+
+
+def test_text_cache_evicts_least_recently_used():
+    cache = TextCache(max_entries=2)
+    a = cache.render("a", WHITE)
+    cache.render("b", WHITE)
+    assert cache.render("a", WHITE) is a  # Now most recent
+    cache.render("c", WHITE)
+    assert cache.render("a", WHITE) is a
+    assert len(cache._surfaces) == 2
+
+
+def test_hud_label_renders_only_on_change():
+    label = HudLabel("Lives: {}", (0, 0), TextCache())
+    screen = pygame.Surface((200, 50))
+    label.draw(screen, 3)
+    surface = label._surface
+    label.draw(screen, 3)
+    assert label._surface is surface
+    label.draw(screen, 2)
+    assert label._surface is not surface
+
+
+@pytest.fixture
+def windowed_engine():
+    autopilot = AutopilotInput(fire_interval=10, jitter=30, seed=4)
+    engine = GameEngine(LEVELS, input_manager=autopilot, seed=4)
+    autopilot.engine = engine
+    yield engine
+    engine.sound_manager.close()
+    pygame.display.quit()
+
+
+def test_dirty_rect_frames_match_full_redraw(windowed_engine):
+    engine = windowed_engine
+    assert isinstance(engine.renderer, DirtyRectRenderer)
+    reference = Renderer(pygame.Surface(engine.screen.get_size(), 0, engine.screen))
+    for tick in range(600):
+        engine._store_previous_positions()
+        if tick % 200 == 150:
+            engine.state.toggle_pause()
+        engine.step()
+        engine._draw(0.5)
+        reference.draw(engine.state, 0.5)
+        assert pygame.image.tobytes(engine.screen, 'RGB') == \
+            pygame.image.tobytes(reference.screen, 'RGB'), tick
+        if engine.state.is_paused:
+            engine.state.toggle_pause()
+    assert engine.state.score > 0  # Bricks were hit and re-baked
@@ -0,0 +1,106 @@
+"""Tests for replay recording, files and playback"""
+import pytest
+
+from data.levels import LEVELS
+from src.game_engine import GameEngine
+from src.level_format import compile_layout
+from src.level_pack import LevelPack, write_level_pack
+from src.managers.input_manager import AutopilotInput, InputFrame
+from src.replay import (
+    FLAG_FIRE, MAX_RUN_LENGTH, PADDLE_X_NONE, Replay, ReplayInputManager, ReplayRecorder,
+    level_checksum, play_replay
+)
+
+
+def record(level_data, ticks=1500, seed=5):
+    autopilot = AutopilotInput(fire_interval=20, jitter=25, seed=seed)
+    recorder = ReplayRecorder(autopilot, level_data)
+    engine = GameEngine(level_data, headless=True, input_manager=recorder, seed=seed)
+    autopilot.engine = engine
+    engine.run_headless(ticks)
+    recorder.replay.final_digest = engine.state.digest()
+    return recorder.replay, engine
+
+
+@pytest.fixture
+def pack(tmp_path):
+    path = str(tmp_path / 'levels.vclp')
+    write_level_pack(path, LEVELS)
+    level_pack = LevelPack(path)
+    yield level_pack
+    level_pack.close()
+
+
+def test_file_round_trip_reproduces_final_state(tmp_path):
+    replay, engine = record(LEVELS)
+    path = str(tmp_path / 'game.vcr')
+    replay.save(path)
+
+    loaded = Replay.load(path)
+    played = play_replay(loaded, LEVELS)
+
+    assert loaded.seed == replay.seed
+    assert len(loaded) == len(replay)
+    assert played.state.digest() == replay.final_digest == engine.state.digest()
+
+
+def test_checksum_is_the_same_for_layouts_compiled_levels_and_pack(pack):
+    checksum = level_checksum(LEVELS)
+    assert level_checksum([compile_layout(layout) for layout in LEVELS]) == checksum
+    assert level_checksum(pack) == checksum
+
+
+def test_checksum_changes_with_layout():
+    changed = [list(layout) for layout in LEVELS]
+    changed[0][0] = '.' * len(changed[0][0])
+    assert level_checksum(changed) != level_checksum(LEVELS)
+
+
+def test_replay_recorded_on_list_plays_on_pack(pack):
+    replay, _ = record(LEVELS, ticks=600)
+    assert play_replay(replay, pack).state.digest() == replay.final_digest
+
+
+def test_replay_on_other_levels_raises():
+    replay, _ = record(LEVELS, ticks=10)
+    with pytest.raises(ValueError):
+        play_replay(replay, LEVELS[1:])
+
+
+def test_identical_ticks_are_run_length_encoded():
+    replay = Replay(1, 0)
+    for _ in range(10):
+        replay.append(InputFrame(paddle_x=300))
+    replay.append(InputFrame(paddle_x=300, fire=True))
+    for _ in range(MAX_RUN_LENGTH + 5):
+        replay.append(InputFrame())
+
+    assert len(replay) == 11 + MAX_RUN_LENGTH + 5
+    assert list(replay.counts) == [10, 1, MAX_RUN_LENGTH, 5]
+    assert replay.paddle_x[2] == PADDLE_X_NONE
+    assert replay.flags[1] == FLAG_FIRE
+
+
+def test_playback_input_matches_recording():
+    frames = [InputFrame(paddle_x=x % 800, fire=x % 7 == 0, pause=x == 50)
+              for x in range(0, 400, 3)]
+    replay = Replay(1, 0)
+    for frame in frames:
+        replay.append(frame)
+    replay = Replay.from_bytes(replay.to_bytes())
+
+    playback = ReplayInputManager(replay)
+    for frame in frames:
+        polled = playback.poll()
+        assert (polled.paddle_x, polled.fire, polled.pause) \
+            == (frame.paddle_x, frame.fire, frame.pause)
+    assert playback.poll().quit
+    assert playback.finished
+
+
+def test_bad_replay_data_raises():
+    data = Replay(1, 0).to_bytes()
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data[:10])
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b'XXXX' + data[4:])
@@ -0,0 +1,40 @@
+"""Tests for seeded random streams"""
+from src.rng import GameRandom
+
+
+def draws(rng, count=20):
+    return [rng.drops.random() for _ in range(count)], [rng.enemies.random() for _ in range(count)]
+
+
+def test_same_seed_same_streams():
+    assert draws(GameRandom(9)) == draws(GameRandom(9))
+    assert draws(GameRandom(9)) != draws(GameRandom(10))
+
+
+def test_streams_are_independent():
+    plain = GameRandom(9)
+    shifted = GameRandom(9)
+    for _ in range(5):
+        shifted.drops.random()
+    assert [plain.enemies.random() for _ in range(10)] == \
+        [shifted.enemies.random() for _ in range(10)]
+
+
+def test_stream_seeds_do_not_depend_on_hash_seed():
+    # Fixed value: recorded replays depend on it
+    assert GameRandom.derive_seed(1, 'drops') == 16459816188662071323
+
+
+def test_getstate_setstate_round_trip_and_version():
+    rng = GameRandom(3)
+    state = rng.getstate()
+    version = rng.version
+    expected = draws(rng, 5)
+    assert rng.version != version
+    rng.setstate(state)
+    assert draws(rng, 5) == expected
+
+
+def test_random_seed_is_recorded():
+    rng = GameRandom()
+    assert draws(GameRandom(rng.seed)) == draws(rng)
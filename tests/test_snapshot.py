@@ -0,0 +1,82 @@
+"""Tests for snapshot/restore"""
+import pytest
+
+from benchmarks.scenarios import SCENARIOS
+from src.constants import SCREEN_HEIGHT
+from src.snapshot import Snapshot
+
+
+SCENARIO_NAMES = ['level_01', 'multiball_50', 'boss_bombs', 'vectorized_multiball_50']
+
+
+def build(name):
+    return next(scenario for scenario in SCENARIOS if scenario.name == name).build()
+
+
+def digests(engine, ticks):
+    result = []
+    for _ in range(ticks):
+        engine.step()
+        result.append(engine.state.digest())
+    return result
+
+
+@pytest.mark.parametrize('name', SCENARIO_NAMES)
+def test_restore_replays_the_same_ticks(name):
+    engine = build(name)
+    engine.run_headless(300)
+    snapshot = engine.snapshot()
+    digest = engine.state.digest()
+    expected = digests(engine, 300)
+
+    engine.restore(snapshot)
+    assert engine.state.digest() == digest
+    assert digests(engine, 300) == expected
+
+    engine.restore(Snapshot.from_bytes(snapshot.to_bytes()))
+    assert engine.state.digest() == digest
+    assert digests(engine, 300) == expected
+
+
+def test_unchanged_bricks_are_shared_between_snapshots():
+    engine = build('level_01')
+    first = engine.snapshot()
+    engine.step()
+    assert engine.snapshot().bricks is first.bricks
+
+
+def test_restore_after_game_over_keeps_stepping():
+    engine = build('level_01')
+    start = engine.snapshot()
+    engine.state.lives = 1
+    for ball in engine.state.balls:
+        ball.set_center(ball.rect.centerx, SCREEN_HEIGHT + 100)
+    engine.run_headless(10)
+    assert engine.state.is_game_over()
+    assert not engine.running
+
+    engine.restore(start)
+
+    assert engine.running
+    assert not engine.quit_requested
+    assert engine.run_headless(100) == 100
+
+
+def test_restore_game_over_snapshot_stays_stopped():
+    engine = build('level_01')
+    engine.state.lives = 1
+    for ball in engine.state.balls:
+        ball.set_center(ball.rect.centerx, SCREEN_HEIGHT + 100)
+    engine.run_headless(10)
+    over = engine.snapshot()
+    engine.reset()
+
+    engine.restore(over)
+
+    assert not engine.running
+    assert engine.run_headless(100) == 0
+
+
+def test_bad_blob_raises():
+    with pytest.raises(ValueError):
+        Snapshot.from_bytes(b'not a snapshot')
@@ -0,0 +1,74 @@
+"""Tests for queued, deduplicated sound playback"""
+import os
+import time
+
+import pytest
+
+from src.constants import SOUND_VOICE_LIMITS
+from src.managers import sound_manager
+from src.managers.sound_manager import SoundManager, load_sound
+
+
+class FakeSound:
+    """Records play() calls and reports a fixed number of busy channels"""
+
+    def __init__(self, channels=0):
+        self.channels = channels
+        self.plays = 0
+
+    def get_num_channels(self):
+        return self.channels
+
+    def play(self):
+        self.plays += 1
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Audio thread did not catch up"
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def manager():
+    manager = SoundManager()
+    wait_for(lambda: len(manager.sounds) == len(sound_manager.SOUND_FILES))
+    yield manager
+    manager.close()
+
+
+def test_requests_are_deduplicated_per_tick(manager):
+    manager.sounds['bounce'] = bounce = FakeSound()
+    manager.sounds['powerup'] = powerup = FakeSound()
+    for _ in range(5):
+        manager.play_bounce()
+    manager.play_powerup()
+    manager.flush()
+    manager.flush()  # Nothing new to send
+    assert len(manager._queue) <= 1
+
+    wait_for(lambda: not manager._queue)
+    wait_for(lambda: bounce.plays and powerup.plays)
+    assert (bounce.plays, powerup.plays) == (1, 1)
+
+
+def test_sounds_at_their_voice_limit_are_skipped(manager):
+    limit = SOUND_VOICE_LIMITS.get('bounce', 1)
+    manager.sounds['bounce'] = busy = FakeSound(channels=limit)
+    manager.sounds['powerup'] = marker = FakeSound()
+    manager.play_bounce()
+    manager.flush()
+    manager.play_powerup()
+    manager.flush()
+
+    wait_for(lambda: marker.plays)
+    assert busy.plays == 0
+
+
+def test_failed_sound_is_decoded_and_logged_once(caplog):
+    path = 'sounds/does_not_exist.wav'
+    assert load_sound(path) is None
+    assert load_sound(path) is None
+    assert len([record for record in caplog.records if path in record.getMessage()]) == 1
+    assert os.path.join(sound_manager.ASSET_ROOT, path) in sound_manager._decoded
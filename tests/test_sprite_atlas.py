@@ -0,0 +1,74 @@
+"""Tests for the sprite atlas"""
+import itertools
+
+import pygame
+import pytest
+
+from benchmarks.scenarios import SCENARIOS
+from src.constants import BLACK, SCREEN_HEIGHT, SCREEN_WIDTH, SPRITE_ALIGN
+from src.rendering.renderer import Renderer
+from src.rendering.sprite_atlas import SpriteAtlas
+
+
+@pytest.fixture(autouse=True)
+def fonts():
+    pygame.font.init()
+    yield
+
+
+def build(name):
+    return next(scenario for scenario in SCENARIOS if scenario.name == name).build()
+
+
+def draw_with_entities(screen, state, alpha):
+    """Frame drawn with the entities' own draw() methods, in renderer order"""
+    screen.fill(BLACK)
+    for brick in state.bricks:
+        brick.draw(screen)
+    state.paddle.draw(screen, alpha)
+    for ball in state.balls:
+        ball.draw(screen, alpha)
+    for entity in itertools.chain(state.power_ups, state.lasers, state.enemies):
+        entity.draw(screen)
+    if state.boss:
+        state.boss.draw(screen)
+    for bomb in state.bombs:
+        bomb.draw(screen)
+
+
+@pytest.mark.parametrize('name', ['multiball_50', 'laser_spam', 'boss_bombs'])
+def test_atlas_frames_match_entity_draws(name):
+    engine = build(name)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
+    renderer = Renderer(screen)
+    renderer._draw_ui = lambda state: None
+    reference = pygame.Surface(screen.get_size(), 0, screen)
+    for _ in range(4):
+        engine.run_headless(50)
+        engine._store_previous_positions()
+        engine.step()
+        for alpha in (0.5, 1.0):
+            renderer.draw(engine.state, alpha)
+            draw_with_entities(reference, engine.state, alpha)
+            assert pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(reference, 'RGB')
+
+
+@pytest.mark.parametrize('scale', [(1.0, 1.0), (0.4, 0.3)])
+def test_sprites_do_not_overlap(scale):
+    atlas = SpriteAtlas(pygame.Surface((10, 10), 0, 32), scale)
+    pages = {}
+    for key, (image, area) in atlas.sprites.items():
+        assert image.get_rect().contains(area), key
+        assert area.x % SPRITE_ALIGN == 0, key
+        pages.setdefault(image, []).append(area)
+    assert len(pages) == 2
+    for areas in pages.values():
+        for first, second in itertools.combinations(areas, 2):
+            assert not first.colliderect(second)
+
+
+def test_only_ball_page_is_colorkeyed():
+    atlas = SpriteAtlas(pygame.Surface((10, 10), 0, 32))
+    ball_page = atlas.sprites['ball'][0]
+    assert ball_page.get_colorkey() is not None
+    assert atlas.sprites['laser'][0].get_colorkey() is None
@@ -0,0 +1,85 @@
+"""Tests for parameter sweep overrides"""
+import pytest
+
+import src.constants as constants
+from data.levels import LEVELS
+from src import sweep
+from src.entities import enemy
+from src.entities.enemy import Enemy
+
+
+def test_override_reaches_spawned_entities_and_restores():
+    original = constants.ENEMY_SPEED
+    previous = sweep.apply_overrides({'ENEMY_SPEED': original + 3})
+    try:
+        assert constants.ENEMY_SPEED == original + 3
+        assert enemy.ENEMY_SPEED == original + 3
+        assert Enemy(0).dy == original + 3
+    finally:
+        sweep.apply_overrides(previous)
+    assert previous == {'ENEMY_SPEED': original}
+    assert Enemy(0).dy == original
+
+
+def test_unknown_constant_raises():
+    with pytest.raises(ValueError, match='Unknown constant'):
+        sweep.apply_overrides({'NOT_A_CONSTANT': 1})
+
+
+def test_import_time_constant_raises_without_changing_anything():
+    drop_chance = constants.POWERUP_DROP_CHANCE
+    with pytest.raises(ValueError, match='src/game_engine.py'):
+        sweep.apply_overrides({'POWERUP_DROP_CHANCE': 0.5, 'RENDER_FPS': 30})
+    assert constants.POWERUP_DROP_CHANCE == drop_chance
+    assert constants.RENDER_FPS != 30
+
+
+def test_import_time_uses_cover_defaults_class_attributes_and_derived_constants():
+    uses = sweep.import_time_uses()
+    assert 'src/game_engine.py' in uses['MAX_CATCH_UP_STEPS'][0]  # Default argument
+    assert any('src/entities/enemy.py' in use for use in uses['ORANGE'])  # Class attribute
+    assert any('src/constants.py' in use for use in uses['FPS'])  # Derived constant
+    for name in ('POWERUP_DROP_CHANCE', 'ENEMY_SPEED', 'LASER_SPEED', 'BOMB_SPEED',
+                 'POWERUP_SPEED', 'BALL_SLOW_DIVISOR', 'ENEMY_SPAWN_INTERVAL'):
+        assert name not in uses
+
+
+def test_override_changes_game_outcome():
+    baseline = sweep.play_game(LEVELS, 0, seed=3, max_ticks=2000)
+    previous = sweep.apply_overrides({'POWERUP_DROP_CHANCE': 1.0})
+    try:
+        swept = sweep.play_game(LEVELS, 0, seed=3, max_ticks=2000)
+    finally:
+        sweep.apply_overrides(previous)
+    assert swept != baseline
+    assert sweep.play_game(LEVELS, 0, seed=3, max_ticks=2000) == baseline
+
+
+def test_aggregate_statistics():
+    aggregate = sweep.Aggregate({'X': 1}, 2)
+    for score, cleared, ticks in ((100, True, 500), (300, True, 700), (200, False, 900)):
+        aggregate.add(cleared, score, ticks)
+    summary = aggregate.to_dict()
+    assert summary['games'] == 3
+    assert summary['clear_rate'] == pytest.approx(2 / 3)
+    assert summary['score_mean'] == 200
+    assert summary['score_std'] == pytest.approx(81.65, abs=0.01)
+    assert (summary['score_p10'], summary['score_p50'], summary['score_p90']) == (100, 200, 200)
+    assert summary['ticks_to_clear_mean'] == 600
+
+
+def test_sweep_matches_serial_games():
+    seeds = [1, 2, 3]
+    *_, (finished, total, aggregates) = sweep.run_sweep(
+        {'ENEMY_SPEED': [2, 4]}, seeds, [0], max_ticks=600, workers=2, chunk_size=2
+    )
+    assert finished == total == 6
+    for aggregate in aggregates:
+        expected = sweep.Aggregate(aggregate.overrides, 0)
+        previous = sweep.apply_overrides(aggregate.overrides)
+        try:
+            for seed in seeds:
+                expected.add(*sweep.play_game(LEVELS, 0, seed, 600))
+        finally:
+            sweep.apply_overrides(previous)
+        assert aggregate.to_dict() == expected.to_dict()
@@ -0,0 +1,108 @@
+"""Tests for the batched vectorized environment"""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from data.levels import LEVELS
+from src import game_engine
+from src.game_engine import GameEngine
+from src.managers.input_manager import InputFrame
+from src.constants import (
+    BALL_INITIAL_SPEED_X, BRICK_HEIGHT, BRICK_OFFSET_Y, BRICK_WIDTH, INITIAL_LIVES, PADDLE_WIDTH
+)
+from src.vector_env import (
+    ACTION_LEFT, ACTION_NOOP, ACTION_RIGHT, BRICK_HP, GOLD_HP, VectorEnv
+)
+
+
+LEVELS_SMALL = [["n s n  n", "  s  s  "], ["nnnn"], ["g s"]]
+
+
+def brick_hp(engine, shape):
+    """Engine bricks as a VectorEnv hit point grid"""
+    grid = np.zeros(shape, dtype=np.int8)
+    for brick in engine.state.bricks:
+        row = (brick.rect.top - BRICK_OFFSET_Y) // BRICK_HEIGHT
+        col = brick.rect.left // BRICK_WIDTH
+        grid[row, col] = BRICK_HP[brick.type] - brick.hits if brick.destructible else GOLD_HP
+    return grid
+
+
+def test_matches_engine_tick_by_tick_without_drops_enemies_or_bombs(monkeypatch):
+    monkeypatch.setattr(game_engine, 'POWERUP_DROP_CHANCE', 0)
+    monkeypatch.setattr(game_engine, 'ENEMY_SPAWN_INTERVAL', 10 ** 9)
+    monkeypatch.setattr(game_engine, 'BOMB_SPAWN_INTERVAL', 10 ** 9)
+    count, ticks = 4, 4000
+    env = VectorEnv(LEVELS_SMALL, count, serve_jitter=0)
+    env.reset(list(range(count)))
+    engines = [GameEngine(LEVELS_SMALL, headless=True, seed=index, vectorized_balls=True)
+               for index in range(count)]
+    aim = np.random.default_rng(0).integers(-45, 46, size=(ticks, count))
+
+    for tick in range(ticks):
+        # Follow the ball with a random offset so the games diverge
+        offset = env.ball_x - (env.paddle_x + PADDLE_WIDTH / 2) + aim[tick]
+        actions = np.where(offset < -4, ACTION_LEFT,
+                           np.where(offset > 4, ACTION_RIGHT, ACTION_NOOP))
+        env.step(actions)
+        for index, engine in enumerate(engines):
+            if not engine.running:
+                continue
+            action = actions[index]
+            engine.input_manager.push(
+                InputFrame(move_left=action == ACTION_LEFT, move_right=action == ACTION_RIGHT)
+            )
+            engine.step()
+            state = engine.state
+            assert state.paddle.rect.x == env.paddle_x[index]
+            if engine.running:
+                ball = state.balls[0]
+                assert (ball.pos_x, ball.pos_y, ball.dx, ball.dy) == (
+                    env.ball_x[index], env.ball_y[index],
+                    env.ball_dx[index], env.ball_dy[index]
+                )
+                assert np.array_equal(brick_hp(engine, env.bricks.shape[1:]), env.bricks[index])
+            assert (state.score, state.lives, state.level) == \
+                (env.score[index], env.lives[index], env.level[index])
+
+    for index, engine in enumerate(engines):
+        assert engine.running != env.done[index]
+    assert env.level.max() > 0
+
+
+def test_seeds_drive_serves():
+    seeds = [1, 2, 1]
+    env = VectorEnv(LEVELS, 3)
+    env.reset(seeds)
+    served = env.ball_dx.copy()
+    assert served[0] == served[2] != served[1]
+    assert np.all(np.abs(served - BALL_INITIAL_SPEED_X) <= env.serve_jitter)
+
+    # Each new serve draws again; resetting with the same seed replays the draws
+    env.lives[:] = INITIAL_LIVES
+    env.ball_y[:] = 10_000
+    env.step([ACTION_NOOP] * 3)
+    assert env.ball_dx[0] != served[0]
+    env.reset(seeds)
+    assert np.array_equal(env.ball_dx, served)
+    assert np.all(VectorEnv(LEVELS, 3, serve_jitter=0).reset(seeds)[:, 3]
+                  == BALL_INITIAL_SPEED_X)
+
+
+def test_finished_games_freeze_until_reset():
+    env = VectorEnv(LEVELS, 3)
+    env.reset([1, 2, 3])
+    env.lives[1] = 1
+    env.ball_y[1] = 10_000
+    obs, rewards, done = env.step([0, 0, 0])
+    assert done.tolist() == [False, True, False]
+
+    frozen = obs[1].copy()
+    obs, rewards, done = env.step([1, 1, 1])
+    assert np.array_equal(obs[1], frozen)
+    assert rewards[1] == 0
+
+    obs = env.reset([7], indices=[1])
+    assert not env.done[1]
+    assert env.seeds.tolist() == [1, 7, 3]
+    assert obs.shape[0] == 3